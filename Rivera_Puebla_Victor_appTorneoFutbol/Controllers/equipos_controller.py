@@ -6,15 +6,22 @@ Maneja creación, edición y eliminación de equipos.
 from PySide6.QtWidgets import (QWidget, QPushButton, QLineEdit, QComboBox, 
                                 QListWidget, QLabel, QColorDialog, QMessageBox,
                                 QListWidgetItem)
-from PySide6.QtGui import QIcon, QPixmap, QColor
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QColor
+from PySide6.QtCore import Qt, QTimer
 from Models.database import DatabaseManager, obtener_ruta_recurso
+from Views.components.buscar_widget import buscar_widget
+from Views.components.escudo_icon_cache import EscudoIconCache
+from Views.equipos_view import pixmap_vista_previa
+from itertools import islice
 import os
 
 
 class EquiposController:
     """Controlador para la pantalla de gestión de equipos."""
     
+    # Equipos que se añaden a la lista en cada vuelta del bucle de eventos
+    _TAMANO_LOTE_LISTA = 50
+    
     def __init__(self, widget: QWidget, main_controller):
         """
         Inicializa el controlador de equipos.
@@ -39,23 +46,49 @@ class EquiposController:
         
         # Cargar datos iniciales
         self.cargar_escudos_disponibles()
-        self.cargar_lista_equipos()
+        
+        # La lista de equipos se crea justo después de mostrarse la vista:
+        # sus señales y su contenido se preparan cuando exista
+        if getattr(self.widget, "_lista_construida", True):
+            self._preparar_lista()
+        else:
+            self.widget._al_construir_lista.append(self._preparar_lista)
         
     def _obtener_widgets(self):
         """Obtiene referencias a los widgets de la UI."""
-        self.txt_nombre = self.widget.findChild(QLineEdit, "txtNombre")
-        self.txt_curso = self.widget.findChild(QLineEdit, "txtCurso")
-        self.btn_color = self.widget.findChild(QPushButton, "btnSeleccionarColor")
-        self.combo_escudos = self.widget.findChild(QComboBox, "comboEscudos")
-        self.lbl_vista_previa = self.widget.findChild(QLabel, "lblVistaPrevia")
-        self.btn_guardar = self.widget.findChild(QPushButton, "btnGuardar")
-        self.btn_limpiar = self.widget.findChild(QPushButton, "btnLimpiar")
-        self.txt_buscar = self.widget.findChild(QLineEdit, "txtBuscar")
-        self.list_equipos = self.widget.findChild(QListWidget, "listEquipos")
-        self.btn_volver = self.widget.findChild(QPushButton, "btnVolver")
-        self.btn_ver_jugadores = self.widget.findChild(QPushButton, "btnVerJugadores")
-        self.btn_editar = self.widget.findChild(QPushButton, "btnEditar")
-        self.btn_eliminar = self.widget.findChild(QPushButton, "btnEliminar")
+        self.txt_nombre = buscar_widget(self.widget, QLineEdit, "txtNombre")
+        self.txt_curso = buscar_widget(self.widget, QLineEdit, "txtCurso")
+        self.btn_color = buscar_widget(self.widget, QPushButton, "btnSeleccionarColor")
+        self.combo_escudos = buscar_widget(self.widget, QComboBox, "comboEscudos")
+        self.lbl_vista_previa = buscar_widget(self.widget, QLabel, "lblVistaPrevia")
+        self.btn_guardar = buscar_widget(self.widget, QPushButton, "btnGuardar")
+        self.btn_limpiar = buscar_widget(self.widget, QPushButton, "btnLimpiar")
+        self.btn_volver = buscar_widget(self.widget, QPushButton, "btnVolver")
+        
+        # Widgets de la lista: None hasta que la vista la construye
+        self.txt_buscar = None
+        self.list_equipos = None
+        self.btn_ver_jugadores = None
+        self.btn_editar = None
+        self.btn_eliminar = None
+        
+    def _preparar_lista(self):
+        """Obtiene los widgets de la lista, conecta sus señales y la rellena."""
+        self.txt_buscar = buscar_widget(self.widget, QLineEdit, "txtBuscar")
+        self.list_equipos = buscar_widget(self.widget, QListWidget, "listEquipos")
+        self.btn_ver_jugadores = buscar_widget(self.widget, QPushButton, "btnVerJugadores")
+        self.btn_editar = buscar_widget(self.widget, QPushButton, "btnEditar")
+        self.btn_eliminar = buscar_widget(self.widget, QPushButton, "btnEliminar")
+        
+        # La lista se rellena por lotes para no bloquear el repintado
+        self._equipos_pendientes = iter(())
+        self._timer_relleno = QTimer(self.widget)
+        self._timer_relleno.setSingleShot(True)
+        self._timer_relleno.setInterval(0)
+        self._timer_relleno.timeout.connect(self._anadir_lote_equipos)
+        
+        self._conectar_senales_lista()
+        self.cargar_lista_equipos()
         
     def _conectar_senales(self):
         """Conecta las señales de los widgets."""
@@ -67,12 +100,20 @@ class EquiposController:
             self.btn_guardar.clicked.connect(self.guardar_equipo)
         if self.btn_limpiar:
             self.btn_limpiar.clicked.connect(self.limpiar_formulario)
+        if self.btn_volver:
+            self.btn_volver.clicked.connect(self.main_controller.volver_a_principal)
+            
+    def _conectar_senales_lista(self):
+        """Conecta las señales de los widgets de la lista."""
         if self.txt_buscar:
-            self.txt_buscar.textChanged.connect(self.filtrar_equipos)
+            # Filtrar cuando el usuario deja de escribir, no en cada tecla
+            self._timer_busqueda = QTimer(self.widget)
+            self._timer_busqueda.setSingleShot(True)
+            self._timer_busqueda.setInterval(150)
+            self._timer_busqueda.timeout.connect(self.filtrar_equipos)
+            self.txt_buscar.textChanged.connect(self._timer_busqueda.start)
         if self.list_equipos:
             self.list_equipos.itemClicked.connect(self.cargar_equipo_edicion)
-        if self.btn_volver:
-            self.btn_volver.clicked.connect(self.main_controller.volver_a_principal)
         if self.btn_ver_jugadores:
             self.btn_ver_jugadores.clicked.connect(self.ver_jugadores_equipo)
         if self.btn_editar:
@@ -110,7 +151,7 @@ class EquiposController:
                 # Solo agregar si no está en uso
                 if ruta_completa not in escudos_usados:
                     # Agregar solo el ícono, sin texto
-                    icon = QIcon(ruta_completa)
+                    icon = EscudoIconCache.get(ruta_completa)
                     self.combo_escudos.addItem(icon, "", ruta_completa)
                     
     def seleccionar_color(self):
@@ -134,10 +175,7 @@ class EquiposController:
             
         ruta_escudo = self.combo_escudos.currentData()
         if ruta_escudo and os.path.exists(ruta_escudo):
-            pixmap = QPixmap(ruta_escudo)
-            self.lbl_vista_previa.setPixmap(
-                pixmap.scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            self.lbl_vista_previa.setPixmap(pixmap_vista_previa(QPixmap(ruta_escudo)))
             self.escudo_seleccionado = ruta_escudo
             
     def guardar_equipo(self):
@@ -191,8 +229,7 @@ class EquiposController:
         if self.combo_escudos:
             self.combo_escudos.setCurrentIndex(0)
         if self.lbl_vista_previa:
-            self.lbl_vista_previa.clear()
-            self.lbl_vista_previa.setText("Vista Previa:")
+            self.lbl_vista_previa.setPixmap(pixmap_vista_previa())
             
         self.color_seleccionado = "#4CAF50"
         self.escudo_seleccionado = None
@@ -210,32 +247,10 @@ class EquiposController:
         if not self.list_equipos:
             return
             
-        # Limpiar lista
-        self.list_equipos.clear()
-        
         # Obtener equipos de la base de datos
         equipos = self.db.obtener_todos_equipos()
         print(f"Cargando {len(equipos)} equipos en la lista")
-        
-        for equipo in equipos:
-            # Crear item con ícono
-            item = QListWidgetItem()
-            
-            # Cargar ícono del escudo
-            escudo_path = equipo.get('escudo_path', '')
-            if escudo_path and os.path.exists(escudo_path):
-                icon = QIcon(escudo_path)
-                item.setIcon(icon)
-                
-            # Texto con información del equipo
-            num_jugadores = self.db.contar_jugadores_por_equipo(equipo['id'])
-            texto = f"{equipo['nombre']} - {equipo['curso']} ({num_jugadores} jugadores)"
-            item.setText(texto)
-            item.setData(Qt.UserRole, equipo['id'])
-            
-            # Añadir a la lista
-            self.list_equipos.addItem(item)
-            print(f"  - Añadido: {texto}")
+        self._rellenar_lista(equipos)
             
     def filtrar_equipos(self):
         """Filtra los equipos según el texto de búsqueda."""
@@ -249,17 +264,51 @@ class EquiposController:
         else:
             equipos = self.db.obtener_todos_equipos()
             
+        self._rellenar_lista(equipos)
+        
+    def _rellenar_lista(self, equipos):
+        """
+        Sustituye el contenido de la lista por los equipos indicados.
+        El primer lote se añade al momento y el resto en las siguientes
+        vueltas del bucle de eventos, de modo que la vista sigue pintándose.
+        
+        Args:
+            equipos: Lista de diccionarios de equipos a mostrar
+        """
+        self._timer_relleno.stop()
         self.list_equipos.clear()
         
-        for equipo in equipos:
+        # Número de jugadores de todos los equipos en una sola consulta
+        conteos = self.db.contar_jugadores_por_equipos()
+        self._equipos_pendientes = ((equipo, conteos.get(equipo['id'], 0))
+                                    for equipo in equipos)
+        self._anadir_lote_equipos()
+        
+    def _anadir_lote_equipos(self):
+        """Añade a la lista el siguiente lote de equipos pendientes."""
+        lote = list(islice(self._equipos_pendientes, self._TAMANO_LOTE_LISTA))
+        if not lote:
+            return
+            
+        self.list_equipos.setUpdatesEnabled(False)
+        for equipo, num_jugadores in lote:
+            # Crear item con ícono
             item = QListWidgetItem()
-            if os.path.exists(equipo['escudo_path']):
-                icon = QIcon(equipo['escudo_path'])
-                item.setIcon(icon)
-            num_jugadores = self.db.contar_jugadores_por_equipo(equipo['id'])
+            
+            # Cargar ícono del escudo (QIcon no decodifica la imagen hasta pintarla)
+            escudo_path = equipo.get('escudo_path', '')
+            if escudo_path and os.path.exists(escudo_path):
+                item.setIcon(EscudoIconCache.get(escudo_path))
+                
+            # Texto con información del equipo
             item.setText(f"{equipo['nombre']} - {equipo['curso']} ({num_jugadores} jugadores)")
             item.setData(Qt.UserRole, equipo['id'])
             self.list_equipos.addItem(item)
+        self.list_equipos.setUpdatesEnabled(True)
+        
+        # Quedan equipos: continuar tras procesar los eventos pendientes
+        if len(lote) == self._TAMANO_LOTE_LISTA:
+            self._timer_relleno.start()
             
     def cargar_equipo_edicion(self, item: QListWidgetItem):
         """
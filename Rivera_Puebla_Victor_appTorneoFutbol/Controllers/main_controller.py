@@ -5,13 +5,16 @@ Controlador principal de la aplicación.
 Gestiona la navegación entre pantallas y la lógica global.
 """
 
+from typing import TYPE_CHECKING
 from PySide6.QtWidgets import QMainWindow, QMessageBox, QStackedWidget, QPushButton, QDialog, QVBoxLayout
 from PySide6.QtCore import Qt, QFile
 from PySide6.QtUiTools import QUiLoader
 from Models.database import DatabaseManager, obtener_ruta_recurso
 from Models.torneo_logic import TorneoLogic
 from Controllers.nuevo_torneo_controller import NuevoTorneoController
-from Views.components.reloj_widget import RelojDigital
+
+if TYPE_CHECKING:
+    from Views.components.reloj_widget import RelojDigital
 
 
 class MainController:
@@ -128,55 +131,59 @@ class MainController:
         elif pantalla == "participantes":
             self._cargar_participantes()
         elif pantalla == "calendario":
+            self._cargar_calendario()
+        elif pantalla == "resultados":
+            self._cargar_resultados()
+        elif pantalla == "clasificacion":
+            self._cargar_clasificacion()
+                                   
+    def _cargar_calendario(self):
+        """Carga la pantalla del calendario de partidos."""
+        # Verificar si ya existe la pantalla
+        if "calendario" in self.pantallas:
+            # Ya existe: cambiar a ella y refrescar equipos, árbitros y partidos
+            self.stacked_widget.setCurrentWidget(self.pantallas["calendario"])
+            self.calendario_controller.cargar_equipos()
+            self.calendario_controller.cargar_arbitros()
+            self.calendario_controller.cargar_partidos()
+        else:
+            # Crear la pantalla
             from Views.calendario_view import crear_vista_calendario
             from Controllers.calendario_controller import CalendarioController
             
             # Crear vista de calendario (retorna widget y reloj)
             widget_calendario, reloj_widget = crear_vista_calendario()
-            
-            # Añadir al stacked widget
             self.stacked_widget.addWidget(widget_calendario)
-            indice = self.stacked_widget.indexOf(widget_calendario)
-            self.stacked_widget.setCurrentIndex(indice)
+            self.stacked_widget.setCurrentWidget(widget_calendario)
             
-            # Crear controlador pasando el widget del reloj
-            CalendarioController(widget_calendario, self, reloj_widget)
-        elif pantalla == "resultados":
-            from Views.resultados_view import crear_vista_resultados
-            from Controllers.resultados_controller import ResultadosController
-            
-            # Crear vista de resultados
-            widget_resultados = crear_vista_resultados()
-            
-            # Añadir al stacked widget
-            self.stacked_widget.addWidget(widget_resultados)
-            indice = self.stacked_widget.indexOf(widget_resultados)
-            self.stacked_widget.setCurrentIndex(indice)
+            # Guardar referencia
+            self.pantallas["calendario"] = widget_calendario
             
-            # Crear controlador y guardarlo
-            self.resultados_controller = ResultadosController(widget_resultados, self)
+            # Crear controlador pasando el widget del reloj
+            self.calendario_controller = CalendarioController(widget_calendario, self, reloj_widget)
             
-            # Establecer idioma del reloj
-            if hasattr(self, '_current_language'):
-                self.resultados_controller.establecer_idioma(self._current_language)
-        elif pantalla == "clasificacion":
+    def _cargar_clasificacion(self):
+        """Carga la pantalla de clasificación."""
+        # Verificar si ya existe la pantalla
+        if "clasificacion" in self.pantallas:
+            # Ya existe: cambiar a ella y recargar brackets para asegurar que estén actualizados
+            self.stacked_widget.setCurrentWidget(self.pantallas["clasificacion"])
+            self.clasificacion_controller.cargar_brackets()
+        else:
+            # Crear la pantalla
             from Views.clasificacion_view import crear_vista_clasificacion
             from Controllers.clasificacion_controller import ClasificacionController
             
-            # Crear vista de clasificación
             widget_clasificacion = crear_vista_clasificacion()
-            
-            # Añadir al stacked widget
             self.stacked_widget.addWidget(widget_clasificacion)
-            indice = self.stacked_widget.indexOf(widget_clasificacion)
-            self.stacked_widget.setCurrentIndex(indice)
+            self.stacked_widget.setCurrentWidget(widget_clasificacion)
             
-            # Crear controlador y guardarlo
+            # Guardar referencia
+            self.pantallas["clasificacion"] = widget_clasificacion
+            
+            # Crear controlador y guardarlo (carga los brackets al iniciarse)
             self.clasificacion_controller = ClasificacionController(widget_clasificacion, self)
             
-            # Recargar brackets para asegurar que estén actualizados
-            self.clasificacion_controller.cargar_brackets()
-                                   
     def _cargar_equipos(self):
         """Carga la pantalla de gestión de equipos."""
         # Verificar si ya existe la pantalla
@@ -198,6 +205,32 @@ class MainController:
             # Inicializar controlador
             self.equipos_controller = EquiposController(vista_equipos, self)
             
+    def _cargar_resultados(self):
+        """Carga la pantalla de registro de resultados."""
+        # Verificar si ya existe la pantalla
+        if "resultados" in self.pantallas:
+            # Ya existe: cambiar a ella y refrescar la lista de partidos
+            self.stacked_widget.setCurrentWidget(self.pantallas["resultados"])
+            self.resultados_controller.filtrar_partidos()
+        else:
+            # Crear la pantalla
+            from Views.resultados_view import crear_vista_resultados
+            from Controllers.resultados_controller import ResultadosController
+            
+            widget_resultados = crear_vista_resultados()
+            self.stacked_widget.addWidget(widget_resultados)
+            self.stacked_widget.setCurrentWidget(widget_resultados)
+            
+            # Guardar referencia
+            self.pantallas["resultados"] = widget_resultados
+            
+            # Crear controlador y guardarlo
+            self.resultados_controller = ResultadosController(widget_resultados, self)
+            
+            # Establecer idioma del reloj
+            if hasattr(self, '_current_language'):
+                self.resultados_controller.establecer_idioma(self._current_language)
+            
     def _cargar_participantes(self):
         """Carga la pantalla de gestión de participantes."""
         # Verificar si ya existe la pantalla
@@ -366,6 +399,9 @@ class MainController:
     def abrir_reloj(self):
         """Abre el diálogo del reloj digital o lo trae al frente."""
         if self._clock_dialog is None:
+            # El reloj solo se importa si se llega a abrir
+            from Views.components.reloj_widget import RelojDigital
+            
             dialog = QDialog(self.main_window)
             dialog.setWindowTitle("Reloj / Cronómetro")
             dialog.setModal(False)
@@ -4,9 +4,9 @@ Maneja la creación, edición y asignación de participantes a equipos.
 """
 
 from PySide6.QtWidgets import (QWidget, QPushButton, QLineEdit, QComboBox, 
-                                QDateEdit, QFrame, QMessageBox, QListWidgetItem,
-                                QListWidget, QCheckBox)
-from PySide6.QtCore import QDate, Qt
+                                QDateEdit, QFrame, QMessageBox, QListView,
+                                QCheckBox)
+from PySide6.QtCore import QDate, Qt, QModelIndex
 from PySide6.QtGui import QIcon
 from Models.database import DatabaseManager
 import os
@@ -58,7 +58,12 @@ class ParticipantesController:
         
         # Lista de participantes
         self.txt_buscar = self.widget.findChild(QLineEdit, "txtBuscar")
-        self.list_participantes = self.widget.findChild(QListWidget, "listParticipantes")
+        self.list_participantes = self.widget.findChild(QListView, "listParticipantes")
+        self.proxy_participantes = None
+        self.modelo_participantes = None
+        if self.list_participantes:
+            self.proxy_participantes = self.list_participantes.model()
+            self.modelo_participantes = self.proxy_participantes.sourceModel()
         self.btn_eliminar = self.widget.findChild(QPushButton, "btnEliminar")
         
         # Checkboxes de filtro
@@ -90,7 +95,7 @@ class ParticipantesController:
             
         # Lista - doble clic para editar
         if self.list_participantes:
-            self.list_participantes.itemDoubleClicked.connect(self.editar_participante)
+            self.list_participantes.doubleClicked.connect(self.editar_participante)
             
         # Botón eliminar
         if self.btn_eliminar:
@@ -187,7 +192,7 @@ class ParticipantesController:
         if not self.list_participantes:
             return
             
-        self.list_participantes.clear()
+        filas = []
         
         # Cargar jugadores
         jugadores = self.db.obtener_todos_jugadores()
@@ -196,18 +201,16 @@ class ParticipantesController:
             curso = jugador.get('curso', 'Sin curso')
             equipo_nombre = jugador.get('equipo_nombre', 'Sin equipo')
             
-            item = QListWidgetItem(f"🏃 {nombre} - {curso} - {equipo_nombre}")
-            item.setData(Qt.UserRole, ('jugador', jugador['id']))
-            self.list_participantes.addItem(item)
+            filas.append((f"🏃 {nombre} - {curso} - {equipo_nombre}", 'jugador', jugador['id']))
             
         # Cargar árbitros
         arbitros = self.db.obtener_todos_arbitros()
         for arbitro in arbitros:
             nombre = arbitro.get('nombre', 'Sin nombre')
             
-            item = QListWidgetItem(f"⚖️ {nombre}")
-            item.setData(Qt.UserRole, ('arbitro', arbitro['id']))
-            self.list_participantes.addItem(item)
+            filas.append((f"⚖️ {nombre}", 'arbitro', arbitro['id']))
+            
+        self.modelo_participantes.establecer_participantes(filas)
             
     def on_checkbox_todos_changed(self, state):
         """Maneja el cambio del checkbox 'Todos'."""
@@ -231,33 +234,19 @@ class ParticipantesController:
         if not self.list_participantes:
             return
             
-        texto = self.txt_buscar.text().lower() if self.txt_buscar else ""
+        texto = self.txt_buscar.text() if self.txt_buscar else ""
         
         # Obtener estados de los checkboxes
         mostrar_jugadores = self.chk_jugadores.isChecked() if self.chk_jugadores else True
         mostrar_arbitros = self.chk_arbitros.isChecked() if self.chk_arbitros else True
         
-        for i in range(self.list_participantes.count()):
-            item = self.list_participantes.item(i)
-            texto_item = item.text().lower()
-            tipo, _ = item.data(Qt.UserRole)
-            
-            # Verificar texto
-            cumple_texto = texto in texto_item if texto else True
-            
-            # Verificar tipo
-            cumple_tipo = False
-            if tipo == 'jugador' and mostrar_jugadores:
-                cumple_tipo = True
-            elif tipo == 'arbitro' and mostrar_arbitros:
-                cumple_tipo = True
-            
-            # Mostrar solo si cumple ambas condiciones
-            item.setHidden(not (cumple_texto and cumple_tipo))
+        # El proxy aplica ambos filtros sin recorrer los items desde Python
+        self.proxy_participantes.establecer_tipos_visibles(mostrar_jugadores, mostrar_arbitros)
+        self.proxy_participantes.setFilterFixedString(texto)
             
-    def editar_participante(self, item: QListWidgetItem):
+    def editar_participante(self, index: QModelIndex):
         """Carga los datos de un participante para edición."""
-        tipo, participante_id = item.data(Qt.UserRole)
+        tipo, participante_id = index.data(Qt.UserRole)
         self.participante_actual = participante_id
         
         if tipo == 'jugador':
@@ -311,12 +300,12 @@ class ParticipantesController:
         if not self.list_participantes:
             return
             
-        item = self.list_participantes.currentItem()
-        if not item:
+        index = self.list_participantes.currentIndex()
+        if not index.isValid():
             QMessageBox.warning(self.widget, "Error", "Selecciona un participante para eliminar.")
             return
             
-        tipo, participante_id = item.data(Qt.UserRole)
+        tipo, participante_id = index.data(Qt.UserRole)
         
         # Confirmar eliminación
         respuesta = QMessageBox.question(
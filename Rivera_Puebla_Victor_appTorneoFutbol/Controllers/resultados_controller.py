@@ -4,14 +4,14 @@ Maneja el registro de goles, tarjetas y actualización de resultados.
 """
 
 from PySide6.QtWidgets import (QWidget, QPushButton, QListWidget, QListWidgetItem,
-                               QTableWidget, QTableWidgetItem, QLabel, QSpinBox,
-                               QCheckBox, QMessageBox, QComboBox, QHBoxLayout)
+                               QTableView, QLabel, QSpinBox, QMessageBox, QComboBox)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon, QBrush, QColor
 from datetime import datetime
 import os
 
 from Models.database import DatabaseManager
+from Views.components.buscar_widget import buscar_widget
 
 
 class ResultadosController:
@@ -35,6 +35,8 @@ class ResultadosController:
         self.jugadores_equipo_a = []
         self.jugadores_equipo_b = []
         self.estado_partido_actual = None
+        self._panel_derecho_listo = False
+        self._idioma_reloj = None
         
         # Obtener widgets
         self._obtener_widgets()
@@ -54,28 +56,59 @@ class ResultadosController:
         
     def _obtener_widgets(self):
         """Obtiene referencias a los widgets de la UI."""
-        self.list_partidos = self.widget.findChild(QListWidget, "listPartidos")
-        self.combo_filtro_estado = self.widget.findChild(QComboBox, "comboFiltroEstado")
-        self.lbl_resumen = self.widget.findChild(QLabel, "lblResumen")
-        self.lbl_partido_seleccionado = self.widget.findChild(QLabel, "lblPartidoSeleccionado")
-        self.lbl_nombre_equipo_a = self.widget.findChild(QLabel, "lblNombreEquipoA")
-        self.lbl_nombre_equipo_b = self.widget.findChild(QLabel, "lblNombreEquipoB")
-        self.table_jugadores_a = self.widget.findChild(QTableWidget, "tableJugadoresA")
-        self.table_jugadores_b = self.widget.findChild(QTableWidget, "tableJugadoresB")
-        self.spin_total_goles_a = self.widget.findChild(QSpinBox, "spinTotalGolesA")
-        self.spin_total_goles_b = self.widget.findChild(QSpinBox, "spinTotalGolesB")
-        self.btn_registrar = self.widget.findChild(QPushButton, "btnRegistrarResultado")
-        self.btn_limpiar = self.widget.findChild(QPushButton, "btnLimpiar")
-        self.btn_volver = self.widget.findChild(QPushButton, "btnVolver")
-        self.btn_iniciar = self.widget.findChild(QPushButton, "btnIniciarPartido")
-        self.btn_finalizar = self.widget.findChild(QPushButton, "btnFinalizarPartido")
-        self.btn_cancelar = self.widget.findChild(QPushButton, "btnCancelarPartido")
-        self.btn_reabrir = self.widget.findChild(QPushButton, "btnReabrirPartido")
-        self.reloj_partido = self.widget.findChild(QWidget, "relojPartido")
-        
-        # Configurar el reloj para partidos
-        if self.reloj_partido:
-            self._configurar_reloj()
+        self.list_partidos = buscar_widget(self.widget, QListWidget, "listPartidos")
+        self.combo_filtro_estado = buscar_widget(self.widget, QComboBox, "comboFiltroEstado")
+        self.lbl_resumen = buscar_widget(self.widget, QLabel, "lblResumen")
+        self.btn_volver = buscar_widget(self.widget, QPushButton, "btnVolver")
+        
+        # El reloj se crea al mostrarse la vista por primera vez: se
+        # configura cuando exista
+        self.reloj_partido = None
+        if getattr(self.widget, "_reloj_built", True):
+            self._preparar_reloj()
+        else:
+            self.widget._al_construir_reloj.append(self._preparar_reloj)
+        
+        # El panel derecho puede no existir todavía (se crea al elegir partido)
+        self._obtener_widgets_panel_derecho()
+            
+    def _preparar_reloj(self):
+        """Obtiene el reloj de partido, lo configura y le aplica el idioma activo."""
+        self.reloj_partido = buscar_widget(self.widget, QWidget, "relojPartido")
+        if not self.reloj_partido:
+            return
+        self._configurar_reloj()
+        if self._idioma_reloj:
+            self.establecer_idioma(self._idioma_reloj)
+            
+    def _obtener_widgets_panel_derecho(self):
+        """Obtiene referencias a los widgets del panel de registro de jugadores."""
+        self.lbl_partido_seleccionado = buscar_widget(self.widget, QLabel, "lblPartidoSeleccionado")
+        self.lbl_nombre_equipo_a = buscar_widget(self.widget, QLabel, "lblNombreEquipoA")
+        self.lbl_nombre_equipo_b = buscar_widget(self.widget, QLabel, "lblNombreEquipoB")
+        self.table_jugadores_a = buscar_widget(self.widget, QTableView, "tableJugadoresA")
+        self.table_jugadores_b = buscar_widget(self.widget, QTableView, "tableJugadoresB")
+        self.modelo_jugadores_a = self.table_jugadores_a.model() if self.table_jugadores_a else None
+        self.modelo_jugadores_b = self.table_jugadores_b.model() if self.table_jugadores_b else None
+        self.spin_total_goles_a = buscar_widget(self.widget, QSpinBox, "spinTotalGolesA")
+        self.spin_total_goles_b = buscar_widget(self.widget, QSpinBox, "spinTotalGolesB")
+        self.btn_registrar = buscar_widget(self.widget, QPushButton, "btnRegistrarResultado")
+        self.btn_limpiar = buscar_widget(self.widget, QPushButton, "btnLimpiar")
+        self.btn_iniciar = buscar_widget(self.widget, QPushButton, "btnIniciarPartido")
+        self.btn_finalizar = buscar_widget(self.widget, QPushButton, "btnFinalizarPartido")
+        self.btn_cancelar = buscar_widget(self.widget, QPushButton, "btnCancelarPartido")
+        self.btn_reabrir = buscar_widget(self.widget, QPushButton, "btnReabrirPartido")
+        
+    def _asegurar_panel_derecho(self):
+        """Construye (si hace falta) el panel derecho y conecta sus widgets una sola vez."""
+        if self._panel_derecho_listo:
+            return
+        construir_panel = getattr(self.widget, "asegurar_panel_derecho", None)
+        if construir_panel is not None:
+            construir_panel()
+        self._obtener_widgets_panel_derecho()
+        self._conectar_senales_panel_derecho()
+        self._panel_derecho_listo = True
             
     def _configurar_reloj(self):
         """Configura el reloj para el modo de partido."""
@@ -110,12 +143,21 @@ class ResultadosController:
             self.list_partidos.itemClicked.connect(self.cargar_partido)
         if self.combo_filtro_estado:
             self.combo_filtro_estado.currentIndexChanged.connect(self.filtrar_partidos)
+        if self.btn_volver:
+            self.btn_volver.clicked.connect(self.main_controller.volver_a_principal)
+            
+    def _conectar_senales_panel_derecho(self):
+        """Conecta las señales de los widgets del panel derecho."""
+        if self.modelo_jugadores_a:
+            self.modelo_jugadores_a.dataChanged.connect(self._actualizar_total_goles_a)
+            self.modelo_jugadores_a.modelReset.connect(self._actualizar_total_goles_a)
+        if self.modelo_jugadores_b:
+            self.modelo_jugadores_b.dataChanged.connect(self._actualizar_total_goles_b)
+            self.modelo_jugadores_b.modelReset.connect(self._actualizar_total_goles_b)
         if self.btn_registrar:
             self.btn_registrar.clicked.connect(self.registrar_resultado)
         if self.btn_limpiar:
             self.btn_limpiar.clicked.connect(self.limpiar_formulario)
-        if self.btn_volver:
-            self.btn_volver.clicked.connect(self.main_controller.volver_a_principal)
         if self.btn_iniciar:
             self.btn_iniciar.clicked.connect(self.iniciar_partido)
         if self.btn_finalizar:
@@ -251,6 +293,9 @@ class ResultadosController:
         self.equipo_b_id = partido['equipo_b_id']
         self.estado_partido_actual = partido.get('estado', 'pendiente')
         
+        # El panel derecho se crea la primera vez que se carga un partido
+        self._asegurar_panel_derecho()
+        
         # Actualizar etiquetas
         if self.lbl_partido_seleccionado:
             vs_texto = f"{partido['equipo_a_nombre']} vs {partido['equipo_b_nombre']} - {partido['ronda']}"
@@ -287,175 +332,43 @@ class ResultadosController:
     def _mostrar_jugadores_equipo_a(self):
         """Muestra los jugadores del equipo A en la tabla."""
         print("DEBUG: _mostrar_jugadores_equipo_a() ejecutado")
-        if not self.table_jugadores_a:
+        if not self.modelo_jugadores_a:
             print("DEBUG: self.table_jugadores_a es None!")
             return
             
-        self.table_jugadores_a.setRowCount(0)
-        self.table_jugadores_a.setRowCount(len(self.jugadores_equipo_a))
+        self.modelo_jugadores_a.establecer_jugadores(self.jugadores_equipo_a)
         print(f"DEBUG: Tabla A configurada con {len(self.jugadores_equipo_a)} filas")
-        
-        for fila, jugador in enumerate(self.jugadores_equipo_a):
-            # Columna 0: Nombre del jugador
-            item_nombre = QTableWidgetItem(jugador['nombre'])
-            item_nombre.setForeground(QColor(0, 0, 0))  # Negro
-            item_nombre.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            item_nombre.setFlags(item_nombre.flags() & ~Qt.ItemIsEditable)  # No editable
-            self.table_jugadores_a.setItem(fila, 0, item_nombre)
-            
-            # Columna 1: SpinBox para goles
-            spin_goles = QSpinBox()
-            spin_goles.setMinimum(0)
-            spin_goles.setMaximum(20)
-            spin_goles.setValue(0)
-            spin_goles.setStyleSheet("color: black; background-color: white;")
-            spin_goles.valueChanged.connect(self._actualizar_total_goles_a)
-            # Guardar referencia del jugador_id en el widget
-            spin_goles.setProperty("jugador_id", jugador['id'])
-            self.table_jugadores_a.setCellWidget(fila, 1, spin_goles)
-            
-            # Columna 2: CheckBox para tarjetas amarillas
-            check_amarilla = QCheckBox()
-            check_amarilla.setStyleSheet("QCheckBox { background-color: transparent; }")
-            check_amarilla.setProperty("jugador_id", jugador['id'])
-            # Centrar el checkbox
-            container_amarilla = QWidget()
-            layout_amarilla = QHBoxLayout(container_amarilla)
-            layout_amarilla.addWidget(check_amarilla)
-            layout_amarilla.setAlignment(Qt.AlignCenter)
-            layout_amarilla.setContentsMargins(0, 0, 0, 0)
-            self.table_jugadores_a.setCellWidget(fila, 2, container_amarilla)
-            
-            # Columna 3: CheckBox para tarjetas rojas
-            check_roja = QCheckBox()
-            check_roja.setStyleSheet("QCheckBox { background-color: transparent; }")
-            check_roja.setProperty("jugador_id", jugador['id'])
-            # Centrar el checkbox
-            container_roja = QWidget()
-            layout_roja = QHBoxLayout(container_roja)
-            layout_roja.addWidget(check_roja)
-            layout_roja.setAlignment(Qt.AlignCenter)
-            layout_roja.setContentsMargins(0, 0, 0, 0)
-            self.table_jugadores_a.setCellWidget(fila, 3, container_roja)
             
     def _mostrar_jugadores_equipo_b(self):
         """Muestra los jugadores del equipo B en la tabla."""
-        if not self.table_jugadores_b:
+        if not self.modelo_jugadores_b:
             return
             
-        self.table_jugadores_b.setRowCount(0)
-        self.table_jugadores_b.setRowCount(len(self.jugadores_equipo_b))
-        
-        for fila, jugador in enumerate(self.jugadores_equipo_b):
-            # Columna 0: Nombre del jugador
-            item_nombre = QTableWidgetItem(jugador['nombre'])
-            item_nombre.setForeground(QColor(0, 0, 0))  # Negro
-            item_nombre.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            item_nombre.setFlags(item_nombre.flags() & ~Qt.ItemIsEditable)  # No editable
-            self.table_jugadores_b.setItem(fila, 0, item_nombre)
-            
-            # Columna 1: SpinBox para goles
-            spin_goles = QSpinBox()
-            spin_goles.setMinimum(0)
-            spin_goles.setMaximum(20)
-            spin_goles.setValue(0)
-            spin_goles.setStyleSheet("color: black; background-color: white;")
-            spin_goles.valueChanged.connect(self._actualizar_total_goles_b)
-            # Guardar referencia del jugador_id en el widget
-            spin_goles.setProperty("jugador_id", jugador['id'])
-            self.table_jugadores_b.setCellWidget(fila, 1, spin_goles)
-            
-            # Columna 2: CheckBox para tarjetas amarillas
-            check_amarilla = QCheckBox()
-            check_amarilla.setStyleSheet("QCheckBox { background-color: transparent; }")
-            check_amarilla.setProperty("jugador_id", jugador['id'])
-            # Centrar el checkbox
-            container_amarilla = QWidget()
-            layout_amarilla = QHBoxLayout(container_amarilla)
-            layout_amarilla.addWidget(check_amarilla)
-            layout_amarilla.setAlignment(Qt.AlignCenter)
-            layout_amarilla.setContentsMargins(0, 0, 0, 0)
-            self.table_jugadores_b.setCellWidget(fila, 2, container_amarilla)
-            
-            # Columna 3: CheckBox para tarjetas rojas
-            check_roja = QCheckBox()
-            check_roja.setStyleSheet("QCheckBox { background-color: transparent; }")
-            check_roja.setProperty("jugador_id", jugador['id'])
-            # Centrar el checkbox
-            container_roja = QWidget()
-            layout_roja = QHBoxLayout(container_roja)
-            layout_roja.addWidget(check_roja)
-            layout_roja.setAlignment(Qt.AlignCenter)
-            layout_roja.setContentsMargins(0, 0, 0, 0)
-            self.table_jugadores_b.setCellWidget(fila, 3, container_roja)
+        self.modelo_jugadores_b.establecer_jugadores(self.jugadores_equipo_b)
             
     def _cargar_eventos_existentes(self, partido_id):
         """Carga los eventos existentes del partido en las tablas."""
         eventos = self.db.obtener_eventos_partido(partido_id)
         
-        for evento in eventos:
-            jugador_id = evento['jugador_id']
-            tipo_evento = evento['tipo_evento']
-            
-            # Buscar en tabla equipo A
-            for fila in range(self.table_jugadores_a.rowCount()):
-                spin = self.table_jugadores_a.cellWidget(fila, 1)
-                if spin and spin.property("jugador_id") == jugador_id:
-                    if tipo_evento == 'gol':
-                        spin.setValue(spin.value() + 1)
-                    elif tipo_evento == 'tarjeta_amarilla':
-                        container = self.table_jugadores_a.cellWidget(fila, 2)
-                        if container:
-                            check = container.layout().itemAt(0).widget()
-                            check.setChecked(True)
-                    elif tipo_evento == 'tarjeta_roja':
-                        container = self.table_jugadores_a.cellWidget(fila, 3)
-                        if container:
-                            check = container.layout().itemAt(0).widget()
-                            check.setChecked(True)
-                            
-            # Buscar en tabla equipo B
-            for fila in range(self.table_jugadores_b.rowCount()):
-                spin = self.table_jugadores_b.cellWidget(fila, 1)
-                if spin and spin.property("jugador_id") == jugador_id:
-                    if tipo_evento == 'gol':
-                        spin.setValue(spin.value() + 1)
-                    elif tipo_evento == 'tarjeta_amarilla':
-                        container = self.table_jugadores_b.cellWidget(fila, 2)
-                        if container:
-                            check = container.layout().itemAt(0).widget()
-                            check.setChecked(True)
-                    elif tipo_evento == 'tarjeta_roja':
-                        container = self.table_jugadores_b.cellWidget(fila, 3)
-                        if container:
-                            check = container.layout().itemAt(0).widget()
-                            check.setChecked(True)
+        # Cada modelo se queda con los eventos de sus jugadores
+        if self.modelo_jugadores_a:
+            self.modelo_jugadores_a.aplicar_eventos(eventos)
+        if self.modelo_jugadores_b:
+            self.modelo_jugadores_b.aplicar_eventos(eventos)
             
     def _actualizar_total_goles_a(self):
         """Actualiza el total de goles del equipo A."""
-        if not self.table_jugadores_a or not self.spin_total_goles_a:
+        if not self.modelo_jugadores_a or not self.spin_total_goles_a:
             return
             
-        total = 0
-        for fila in range(self.table_jugadores_a.rowCount()):
-            spin = self.table_jugadores_a.cellWidget(fila, 1)
-            if spin:
-                total += spin.value()
-                
-        self.spin_total_goles_a.setValue(total)
+        self.spin_total_goles_a.setValue(self.modelo_jugadores_a.total_goles())
             
     def _actualizar_total_goles_b(self):
         """Actualiza el total de goles del equipo B."""
-        if not self.table_jugadores_b or not self.spin_total_goles_b:
+        if not self.modelo_jugadores_b or not self.spin_total_goles_b:
             return
             
-        total = 0
-        for fila in range(self.table_jugadores_b.rowCount()):
-            spin = self.table_jugadores_b.cellWidget(fila, 1)
-            if spin:
-                total += spin.value()
-                
-        self.spin_total_goles_b.setValue(total)
+        self.spin_total_goles_b.setValue(self.modelo_jugadores_b.total_goles())
             
     def registrar_resultado(self):
         """Registra el resultado del partido y los eventos."""
@@ -523,57 +436,22 @@ class ResultadosController:
             # 2. Eliminar eventos anteriores
             self.db.eliminar_eventos_partido(self.partido_actual)
             
-            # 3. Guardar eventos del equipo A
-            for fila in range(self.table_jugadores_a.rowCount()):
-                spin_goles = self.table_jugadores_a.cellWidget(fila, 1)
-                container_amarilla = self.table_jugadores_a.cellWidget(fila, 2)
-                container_roja = self.table_jugadores_a.cellWidget(fila, 3)
-                
-                if spin_goles:
-                    jugador_id = spin_goles.property("jugador_id")
-                    goles = spin_goles.value()
-                    
-                    # Registrar goles
-                    for _ in range(goles):
-                        self.db.registrar_evento(self.partido_actual, jugador_id, 'gol')
-                    
-                    # Registrar tarjetas amarillas
-                    if container_amarilla:
-                        check = container_amarilla.layout().itemAt(0).widget()
-                        if check.isChecked():
-                            self.db.registrar_evento(self.partido_actual, jugador_id, 'tarjeta_amarilla')
-                    
-                    # Registrar tarjetas rojas
-                    if container_roja:
-                        check = container_roja.layout().itemAt(0).widget()
-                        if check.isChecked():
-                            self.db.registrar_evento(self.partido_actual, jugador_id, 'tarjeta_roja')
-            
-            # 4. Guardar eventos del equipo B
-            for fila in range(self.table_jugadores_b.rowCount()):
-                spin_goles = self.table_jugadores_b.cellWidget(fila, 1)
-                container_amarilla = self.table_jugadores_b.cellWidget(fila, 2)
-                container_roja = self.table_jugadores_b.cellWidget(fila, 3)
-                
-                if spin_goles:
-                    jugador_id = spin_goles.property("jugador_id")
-                    goles = spin_goles.value()
-                    
+            # 3-4. Guardar eventos de los equipos A y B
+            for modelo in (self.modelo_jugadores_a, self.modelo_jugadores_b):
+                if not modelo:
+                    continue
+                for jugador_id, goles, amarilla, roja in modelo.estadisticas():
                     # Registrar goles
                     for _ in range(goles):
                         self.db.registrar_evento(self.partido_actual, jugador_id, 'gol')
                     
                     # Registrar tarjetas amarillas
-                    if container_amarilla:
-                        check = container_amarilla.layout().itemAt(0).widget()
-                        if check.isChecked():
-                            self.db.registrar_evento(self.partido_actual, jugador_id, 'tarjeta_amarilla')
+                    if amarilla:
+                        self.db.registrar_evento(self.partido_actual, jugador_id, 'tarjeta_amarilla')
                     
                     # Registrar tarjetas rojas
-                    if container_roja:
-                        check = container_roja.layout().itemAt(0).widget()
-                        if check.isChecked():
-                            self.db.registrar_evento(self.partido_actual, jugador_id, 'tarjeta_roja')
+                    if roja:
+                        self.db.registrar_evento(self.partido_actual, jugador_id, 'tarjeta_roja')
             
             # 5. Actualizar estadísticas de jugadores
             self.db.actualizar_estadisticas_jugadores_desde_eventos()
@@ -856,10 +734,10 @@ class ResultadosController:
         self.estado_partido_actual = None
         
         # Limpiar tablas
-        if self.table_jugadores_a:
-            self.table_jugadores_a.setRowCount(0)
-        if self.table_jugadores_b:
-            self.table_jugadores_b.setRowCount(0)
+        if self.modelo_jugadores_a:
+            self.modelo_jugadores_a.establecer_jugadores([])
+        if self.modelo_jugadores_b:
+            self.modelo_jugadores_b.establecer_jugadores([])
             
         # Limpiar etiquetas
         if self.lbl_partido_seleccionado:
@@ -890,6 +768,8 @@ class ResultadosController:
         Args:
             language_code: Código del idioma ('es' o 'en')
         """
+        # Se guarda para aplicarlo también si el reloj se crea más tarde
+        self._idioma_reloj = language_code
         if self.reloj_partido and hasattr(self.reloj_partido, 'setLanguage'):
             self.reloj_partido.setLanguage(language_code)
             # Actualizar mensaje de alarma según idioma
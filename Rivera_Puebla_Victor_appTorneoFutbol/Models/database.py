@@ -6,6 +6,7 @@ Incluye el DatabaseManager con todas las tablas necesarias y utilidades para rut
 import sqlite3
 import os
 import sys
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional, List, Tuple, Dict
 
@@ -37,6 +38,10 @@ class DatabaseManager:
     Maneja equipos, participantes, partidos, resultados y eventos.
     """
     
+    # Máximo de parámetros por sentencia en las versiones antiguas de SQLite;
+    # limita cuántas filas caben en cada INSERT de varias filas
+    _MAX_PARAMETROS_SQL = 999
+    
     def __init__(self, db_name: str = "torneo_futbol.db"):
         """
         Inicializa el gestor de base de datos.
@@ -46,18 +51,86 @@ class DatabaseManager:
         """
         self.db_path = obtener_ruta_recurso(db_name)
         self.conn = None
+        # True mientras dura un bloque conexion(): conectar/desconectar reutilizan
+        # la conexión abierta en lugar de abrir y cerrar una nueva
+        self._conexion_persistente = False
         
     def conectar(self):
         """Establece conexión con la base de datos."""
-        self.conn = sqlite3.connect(self.db_path, timeout=30.0)  # Timeout de 30 segundos
+        if self._conexion_persistente and self.conn:
+            return
+        # Timeout de 30 segundos; caché de sentencias preparadas más grande que
+        # la de serie para que las consultas repetidas no se vuelvan a compilar
+        self.conn = sqlite3.connect(self.db_path, timeout=30.0, cached_statements=256)
         self.conn.row_factory = sqlite3.Row  # Permite acceder a columnas por nombre
         # Habilitar claves foráneas
         self.conn.execute("PRAGMA foreign_keys = ON")
         # Configurar para mejor manejo de bloqueos
         self.conn.execute("PRAGMA busy_timeout = 30000")  # 30 segundos en milisegundos
+        # Con WAL basta con sincronizar en cada checkpoint, no en cada commit
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        
+    @contextmanager
+    def conexion(self):
+        """
+        Mantiene una única conexión abierta durante todo el bloque with.
+        Los métodos llamados dentro del bloque la reutilizan en lugar de
+        abrir y cerrar la suya; cada uno sigue haciendo su propio commit.
+        Si el bloque lanza una excepción, se deshace lo que no se haya
+        confirmado antes de cerrar la conexión.
+        
+        Yields:
+            La conexión sqlite3 abierta
+        """
+        self.conectar()
+        self._conexion_persistente = True
+        try:
+            yield self.conn
+        except Exception:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+            raise
+        finally:
+            self._conexion_persistente = False
+            self.desconectar()
+        
+    def _ajustar_para_carga_masiva(self):
+        """Ajusta la conexión actual para inserciones de muchas filas."""
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA cache_size = -20000")  # ~20 MB
+        # Mantener las páginas modificadas en memoria hasta el commit
+        self.conn.execute("PRAGMA cache_spill = OFF")
+        
+    def _insertar_multifila(self, insert_sql: str, filas: List[Tuple]):
+        """
+        Inserta filas agrupándolas en sentencias INSERT de varias filas.
+        Los lotes completos usan siempre la misma sentencia, que sqlite3
+        reutiliza ya preparada; las filas sobrantes del último lote parcial
+        van con la sentencia de una fila.
+        
+        Args:
+            insert_sql: Sentencia "INSERT INTO Tabla (columnas) VALUES " sin valores
+            filas: Tuplas de parámetros, todas con el mismo número de columnas
+        """
+        if not filas:
+            return
+        cursor = self.conn.cursor()
+        valores_fila = "(" + ", ".join(["?"] * len(filas[0])) + ")"
+        lote = self._MAX_PARAMETROS_SQL // len(filas[0])
+        
+        sql_lote = insert_sql + ", ".join([valores_fila] * lote)
+        completas = len(filas) - len(filas) % lote
+        for inicio in range(0, completas, lote):
+            parametros = [valor for fila in filas[inicio:inicio + lote] for valor in fila]
+            cursor.execute(sql_lote, parametros)
+        
+        if completas < len(filas):
+            cursor.executemany(insert_sql + valores_fila, filas[completas:])
         
     def desconectar(self):
         """Cierra la conexión con la base de datos."""
+        if self._conexion_persistente:
+            return
         if self.conn:
             self.conn.close()
             self.conn = None
@@ -71,6 +144,11 @@ class DatabaseManager:
         self.conectar()
         cursor = self.conn.cursor()
         
+        # Modo WAL: las escrituras no bloquean a los lectores y cada commit
+        # evita el doble fsync del diario por defecto. Queda guardado en el
+        # fichero, así que repetirlo en cada arranque no cambia nada
+        cursor.execute("PRAGMA journal_mode = WAL")
+        
         # Tabla Equipos: información básica de cada equipo
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS Equipos (
@@ -114,6 +192,9 @@ class DatabaseManager:
             )
         """)
         
+        # Índice para las consultas de jugadores por equipo
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jugadores_equipo ON Jugadores(equipo_id)")
+        
         # Tabla Arbitros: árbitros que pueden arbitrar partidos
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS Arbitros (
@@ -227,6 +308,52 @@ class DatabaseManager:
         self.desconectar()
         return equipo_id
         
+    def crear_equipos_bulk(self, filas: List[Tuple[str, str, str, str]]) -> List[int]:
+        """
+        Crea varios equipos en una sola transacción.
+        
+        Args:
+            filas: Lista de tuplas (nombre, curso, color, escudo_path)
+            
+        Returns:
+            IDs de los equipos creados, en el mismo orden que las filas
+        """
+        if not filas:
+            return []
+        
+        self.conectar()
+        try:
+            self._ajustar_para_carga_masiva()
+            cursor = self.conn.cursor()
+            fecha_actual = datetime.now().strftime('%d/%m/%Y')
+            
+            self._insertar_multifila("""
+                INSERT INTO Equipos (nombre, curso, color, escudo_path, fecha_creacion)
+                VALUES """, [(nombre, curso, color, escudo_path, fecha_actual)
+                             for nombre, curso, color, escudo_path in filas])
+            
+            # Los INSERT de varias filas no dan el id de cada una; el nombre es único, así que
+            # se recuperan dentro de la misma transacción, por tramos que respeten el
+            # límite de parámetros por sentencia
+            nombres = [fila[0] for fila in filas]
+            ids_por_nombre = {}
+            for inicio in range(0, len(nombres), self._MAX_PARAMETROS_SQL):
+                tramo = nombres[inicio:inicio + self._MAX_PARAMETROS_SQL]
+                marcadores = ", ".join(["?"] * len(tramo))
+                cursor.execute(f"SELECT id, nombre FROM Equipos WHERE nombre IN ({marcadores})",
+                               tramo)
+                ids_por_nombre.update((row['nombre'], row['id']) for row in cursor.fetchall())
+            ids = [ids_por_nombre[nombre] for nombre in nombres]
+            
+            self.conn.commit()
+        except Exception:
+            # No dejar la transacción abierta: la conexión puede ser compartida
+            self.conn.rollback()
+            raise
+        finally:
+            self.desconectar()
+        return ids
+        
     def obtener_todos_equipos(self) -> List[Dict]:
         """
         Obtiene todos los equipos registrados.
@@ -350,6 +477,25 @@ class DatabaseManager:
         self.desconectar()
         return total
         
+    def contar_jugadores_por_equipos(self) -> Dict[int, int]:
+        """
+        Cuenta los jugadores de todos los equipos con una sola consulta.
+        
+        Returns:
+            Diccionario {equipo_id: número de jugadores}; los equipos sin
+            jugadores no aparecen
+        """
+        self.conectar()
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT equipo_id, COUNT(*) as total 
+            FROM Jugadores 
+            GROUP BY equipo_id
+        """)
+        conteos = {row['equipo_id']: row['total'] for row in cursor.fetchall()}
+        self.desconectar()
+        return conteos
+        
     # ========== MÉTODOS DE PARTICIPANTES ==========
     
     def crear_participante(self, nombre: str, fecha_nacimiento: str, curso: str, tipo: str) -> int:
@@ -418,6 +564,48 @@ class DatabaseManager:
         self.desconectar()
         return jugador_id
         
+    def crear_jugadores_bulk(self, filas: List[Tuple]) -> int:
+        """
+        Crea varios jugadores en una sola transacción.
+        
+        Args:
+            filas: Lista de tuplas (nombre, apellidos, fecha_nacimiento, curso,
+                   equipo_id, posicion, dorsal, es_capitan, tarjetas_amarillas,
+                   tarjetas_rojas, goles), con es_capitan como 0/1
+            
+        Returns:
+            Número de jugadores creados
+        """
+        self.conectar()
+        try:
+            self._ajustar_para_carga_masiva()
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            
+            # Si la carga es al menos tan grande como la tabla, es más barato quitar
+            # el índice por equipo y reconstruirlo de una vez al final que mantenerlo
+            # fila a fila; en cargas pequeñas se deja en su sitio
+            existentes = self.conn.execute("SELECT COUNT(*) FROM Jugadores").fetchone()[0]
+            reconstruir_indice = len(filas) >= existentes
+            if reconstruir_indice:
+                self.conn.execute("DROP INDEX IF EXISTS idx_jugadores_equipo")
+            self._insertar_multifila("""
+                INSERT INTO Jugadores (nombre, apellidos, fecha_nacimiento, curso,
+                                      equipo_id, posicion, dorsal, es_capitan,
+                                      tarjetas_amarillas, tarjetas_rojas, goles)
+                VALUES """, filas)
+            if reconstruir_indice:
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jugadores_equipo ON Jugadores(equipo_id)")
+            creados = len(filas)
+            self.conn.commit()
+        except Exception:
+            # Deshace las inserciones y el DROP INDEX: la tabla nunca se queda sin índice
+            self.conn.rollback()
+            raise
+        finally:
+            self.desconectar()
+        return creados
+        
     def crear_arbitro(self, nombre: str, apellidos: str, fecha_nacimiento: str,
                      experiencia: int = 0, categoria: str = "Regional") -> int:
         """
@@ -445,6 +633,34 @@ class DatabaseManager:
         self.desconectar()
         return arbitro_id
         
+    def crear_arbitros_bulk(self, filas: List[Tuple]) -> int:
+        """
+        Crea varios árbitros en una sola transacción.
+        
+        Args:
+            filas: Lista de tuplas (nombre, apellidos, fecha_nacimiento,
+                   experiencia, categoria)
+            
+        Returns:
+            Número de árbitros creados
+        """
+        self.conectar()
+        try:
+            self._ajustar_para_carga_masiva()
+            self._insertar_multifila("""
+                INSERT INTO Arbitros (nombre, apellidos, fecha_nacimiento,
+                                     experiencia, categoria)
+                VALUES """, filas)
+            creados = len(filas)
+            self.conn.commit()
+        except Exception:
+            # No dejar la transacción abierta: la conexión puede ser compartida
+            self.conn.rollback()
+            raise
+        finally:
+            self.desconectar()
+        return creados
+        
     def obtener_todos_arbitros(self) -> List[Dict]:
         """
         Obtiene todos los árbitros disponibles.
@@ -0,0 +1,156 @@
+"""
+Modelo de datos Qt para las tablas de jugadores de un partido.
+Guarda goles y tarjetas de cada jugador sin crear un widget por celda.
+"""
+
+from typing import Dict, Iterator, List, Tuple
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class JugadoresModel(QAbstractTableModel):
+    """
+    Modelo de tabla con los jugadores de un equipo en un partido.
+    Columnas: Jugador, Goles (editable), T. Amarillas y T. Rojas (marcables).
+    Cada fila es una lista [jugador_id, nombre, goles, amarilla, roja].
+    """
+
+    COLUMNAS = ("Jugador", "Goles", "T. Amarillas", "T. Rojas")
+    MAX_GOLES = 20
+
+    # Columnas de la tabla (en la fila, el dato de la columna c está en c + 1)
+    _COL_GOLES = 1
+    _COL_AMARILLA = 2
+    _COL_ROJA = 3
+
+    def __init__(self, parent=None):
+        """Inicializa el modelo vacío."""
+        super().__init__(parent)
+        self._rows: List[list] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Devuelve el número de jugadores cargados."""
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Devuelve el número de columnas de la tabla."""
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNAS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        """Devuelve los títulos de las columnas."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNAS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """
+        Devuelve el dato de una celda según el rol pedido.
+
+        Args:
+            index: Índice de la celda
+            role: Rol de Qt (Display/Edit para texto y goles, CheckState para tarjetas)
+        """
+        if not index.isValid():
+            return None
+        fila = self._rows[index.row()]
+        columna = index.column()
+        if columna == 0:
+            if role == Qt.DisplayRole:
+                return fila[1]
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignLeft | Qt.AlignVCenter
+        elif columna == self._COL_GOLES:
+            if role in (Qt.DisplayRole, Qt.EditRole):
+                return fila[2]
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+        elif role == Qt.CheckStateRole:
+            return Qt.Checked if fila[columna + 1] else Qt.Unchecked
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        """
+        Modifica los goles o las tarjetas de un jugador.
+
+        Args:
+            index: Índice de la celda
+            value: Nuevo valor (número de goles o estado de la casilla)
+            role: EditRole para goles, CheckStateRole para tarjetas
+        """
+        if not index.isValid():
+            return False
+        fila = self._rows[index.row()]
+        columna = index.column()
+        if columna == self._COL_GOLES and role == Qt.EditRole:
+            fila[2] = max(0, min(int(value), self.MAX_GOLES))
+        elif columna in (self._COL_AMARILLA, self._COL_ROJA) and role == Qt.CheckStateRole:
+            fila[columna + 1] = Qt.CheckState(value) == Qt.Checked
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index: QModelIndex):
+        """El nombre es de solo lectura; goles editables y tarjetas marcables."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        columna = index.column()
+        if columna == self._COL_GOLES:
+            flags |= Qt.ItemIsEditable
+        elif columna in (self._COL_AMARILLA, self._COL_ROJA):
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def establecer_jugadores(self, jugadores: List[Dict]):
+        """
+        Sustituye los jugadores del modelo, con goles y tarjetas a cero.
+
+        Args:
+            jugadores: Lista de diccionarios con 'id' y 'nombre'
+        """
+        self.beginResetModel()
+        self._rows = [[j['id'], j['nombre'], 0, False, False] for j in jugadores]
+        self.endResetModel()
+
+    def aplicar_eventos(self, eventos: List[Dict]):
+        """
+        Suma de una vez los eventos ya registrados de los jugadores del modelo.
+        Los eventos de jugadores que no están en el modelo se ignoran, y la
+        vista recibe un único dataChanged al final en lugar de uno por evento.
+
+        Args:
+            eventos: Lista de diccionarios con 'jugador_id' y 'tipo_evento'
+                     ('gol', 'tarjeta_amarilla' o 'tarjeta_roja')
+        """
+        filas_por_id = {fila[0]: fila for fila in self._rows}
+        cambios = False
+        for evento in eventos:
+            fila = filas_por_id.get(evento['jugador_id'])
+            if fila is None:
+                continue
+            tipo_evento = evento['tipo_evento']
+            if tipo_evento == 'gol':
+                fila[2] = min(fila[2] + 1, self.MAX_GOLES)
+            elif tipo_evento == 'tarjeta_amarilla':
+                fila[3] = True
+            elif tipo_evento == 'tarjeta_roja':
+                fila[4] = True
+            else:
+                continue
+            cambios = True
+        if cambios:
+            self.dataChanged.emit(self.index(0, self._COL_GOLES),
+                                  self.index(len(self._rows) - 1, self._COL_ROJA))
+
+    def total_goles(self) -> int:
+        """Devuelve la suma de goles de todos los jugadores."""
+        return sum(fila[2] for fila in self._rows)
+
+    def estadisticas(self) -> Iterator[Tuple[int, int, bool, bool]]:
+        """Recorre las filas como tuplas (jugador_id, goles, amarilla, roja)."""
+        for jugador_id, _, goles, amarilla, roja in self._rows:
+            yield jugador_id, goles, amarilla, roja
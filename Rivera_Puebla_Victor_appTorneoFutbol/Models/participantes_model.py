@@ -0,0 +1,98 @@
+"""
+Modelo de datos Qt para la lista de participantes.
+Expone jugadores y árbitros a un QListView y permite filtrarlos
+mediante un QSortFilterProxyModel sin reconstruir los items.
+"""
+
+from typing import List, Optional, Tuple
+from PySide6.QtCore import (Qt, QAbstractListModel, QModelIndex,
+                            QSortFilterProxyModel)
+
+
+class ParticipantesModel(QAbstractListModel):
+    """
+    Modelo de lista con los participantes del torneo.
+    Cada fila es una tupla (texto, tipo, id) donde tipo es 'jugador' o 'arbitro'.
+    """
+
+    def __init__(self, parent=None):
+        """Inicializa el modelo vacío."""
+        super().__init__(parent)
+        self._filas: List[Tuple[str, str, int]] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Devuelve el número de participantes cargados."""
+        if parent.isValid():
+            return 0
+        return len(self._filas)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """
+        Devuelve el dato de una fila según el rol pedido.
+
+        Args:
+            index: Índice de la fila
+            role: Rol de Qt (DisplayRole para el texto, UserRole para (tipo, id))
+        """
+        if not index.isValid():
+            return None
+        texto, tipo, participante_id = self._filas[index.row()]
+        if role == Qt.DisplayRole:
+            return texto
+        if role == Qt.UserRole:
+            return (tipo, participante_id)
+        return None
+
+    def establecer_participantes(self, filas: List[Tuple[str, str, int]]):
+        """
+        Sustituye todos los participantes del modelo de una sola vez.
+
+        Args:
+            filas: Lista de tuplas (texto, tipo, id)
+        """
+        self.beginResetModel()
+        self._filas = list(filas)
+        self.endResetModel()
+
+    def tipo_de_fila(self, fila: int) -> Optional[str]:
+        """Devuelve el tipo ('jugador' o 'arbitro') de una fila."""
+        if 0 <= fila < len(self._filas):
+            return self._filas[fila][1]
+        return None
+
+
+class ParticipantesFilterProxy(QSortFilterProxyModel):
+    """
+    Proxy que filtra participantes por texto y por tipo.
+    El filtro de texto lo resuelve Qt; aquí solo se añade el filtro por tipo.
+    """
+
+    def __init__(self, parent=None):
+        """Inicializa el proxy sin distinguir mayúsculas/minúsculas."""
+        super().__init__(parent)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self._tipos_visibles = {'jugador', 'arbitro'}
+
+    def establecer_tipos_visibles(self, mostrar_jugadores: bool, mostrar_arbitros: bool):
+        """
+        Indica qué tipos de participante deben mostrarse.
+
+        Args:
+            mostrar_jugadores: True para mostrar jugadores
+            mostrar_arbitros: True para mostrar árbitros
+        """
+        tipos = set()
+        if mostrar_jugadores:
+            tipos.add('jugador')
+        if mostrar_arbitros:
+            tipos.add('arbitro')
+        if tipos != self._tipos_visibles:
+            self._tipos_visibles = tipos
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Acepta la fila si su tipo está visible y cumple el filtro de texto."""
+        modelo = self.sourceModel()
+        if modelo.tipo_de_fila(source_row) not in self._tipos_visibles:
+            return False
+        return super().filterAcceptsRow(source_row, source_parent)
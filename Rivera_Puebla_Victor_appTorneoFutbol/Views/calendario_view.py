@@ -58,6 +58,7 @@ def crear_vista_calendario():
     # === FORMULARIO (Izquierda) ===
     frame_formulario = QFrame()
     frame_formulario.setObjectName("frameFormulario")
+    frame_formulario.setAttribute(Qt.WA_StyledBackground, True)
     frame_formulario.setMaximumWidth(400)
     
     layout_formulario = QVBoxLayout(frame_formulario)
@@ -145,6 +146,7 @@ def crear_vista_calendario():
     # === LISTA DE PARTIDOS (Derecha) ===
     frame_lista = QFrame()
     frame_lista.setObjectName("frameLista")
+    frame_lista.setAttribute(Qt.WA_StyledBackground, True)
     
     layout_lista = QVBoxLayout(frame_lista)
     layout_lista.setSpacing(15)
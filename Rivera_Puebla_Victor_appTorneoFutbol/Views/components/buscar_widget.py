@@ -0,0 +1,23 @@
+"""
+Búsqueda de widgets de una vista por su objectName.
+Las vistas que se construyen por partes publican sus widgets en el
+diccionario _refs para que los controladores no recorran el árbol.
+"""
+
+
+def buscar_widget(raiz, tipo, nombre: str):
+    """
+    Devuelve un widget de la vista por su objectName.
+    
+    Usa el diccionario de referencias de la vista y solo recurre a
+    findChild si el widget no está registrado en él.
+    
+    Args:
+        raiz: Widget raíz de la vista
+        tipo: Clase del widget buscado
+        nombre: objectName del widget
+    """
+    widget = getattr(raiz, "_refs", {}).get(nombre)
+    if widget is not None:
+        return widget
+    return raiz.findChild(tipo, nombre)
@@ -0,0 +1,34 @@
+"""
+Caché de iconos de escudos compartida por las vistas.
+Evita volver a leer y decodificar del disco el mismo escudo cada vez que
+se rellena un combo o una lista.
+"""
+
+from typing import Dict
+from PySide6.QtGui import QIcon
+
+
+class EscudoIconCache:
+    """
+    Guarda un QIcon por ruta de escudo durante toda la ejecución.
+    QIcon conserva los pixmaps que ya ha renderizado, así que reutilizar
+    el mismo objeto evita repetir la decodificación en cada repintado.
+    """
+    
+    _iconos: Dict[str, QIcon] = {}
+    
+    @classmethod
+    def get(cls, ruta: str) -> QIcon:
+        """
+        Devuelve el icono del escudo, creándolo solo la primera vez.
+        
+        Args:
+            ruta: Ruta absoluta del archivo del escudo
+            
+        Returns:
+            QIcon: Icono del escudo
+        """
+        icono = cls._iconos.get(ruta)
+        if icono is None:
+            icono = cls._iconos[ruta] = QIcon(ruta)
+        return icono
@@ -0,0 +1,26 @@
+"""
+Filtro de eventos para construir partes de una vista bajo demanda.
+Permite retrasar la creación de widgets hasta que la vista se muestra.
+"""
+
+from PySide6.QtCore import QObject, QEvent
+
+
+class FiltroPrimerShow(QObject):
+    """Ejecuta una función la primera vez que se muestra el widget observado."""
+    
+    def __init__(self, callback, parent):
+        """
+        Args:
+            callback: Función sin argumentos a ejecutar
+            parent: Widget observado (también dueño del filtro)
+        """
+        super().__init__(parent)
+        self._callback = callback
+    
+    def eventFilter(self, obj, event):
+        """Lanza el callback en el primer Show y se desinstala."""
+        if event.type() == QEvent.Show:
+            obj.removeEventFilter(self)
+            self._callback()
+        return False
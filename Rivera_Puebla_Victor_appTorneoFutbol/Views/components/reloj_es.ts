@@ -0,0 +1,123 @@
+<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE TS>
+<TS version="2.1" language="es_ES">
+<context>
+    <name>RelojDigital</name>
+    <message>
+        <source>UI file not found: {path}</source>
+        <translation>No se encontró el archivo de interfaz: {path}</translation>
+    </message>
+    <message>
+        <source>Unable to open {path}</source>
+        <translation>No se puede abrir {path}</translation>
+    </message>
+    <message>
+        <source>Could not load UI from {path}</source>
+        <translation>No se pudo cargar la interfaz desde {path}</translation>
+    </message>
+    <message>
+        <source>Missing widget {name} in UI</source>
+        <translation>Falta el widget {name} en la interfaz</translation>
+    </message>
+    <message>
+        <source>Alarm</source>
+        <translation>Alarma</translation>
+    </message>
+    <message>
+        <source>Reset</source>
+        <translation>Reiniciar</translation>
+    </message>
+    <message>
+        <source>Clock</source>
+        <translation>Reloj</translation>
+    </message>
+    <message>
+        <source>Timer</source>
+        <translation>Temporizador</translation>
+    </message>
+    <message>
+        <source>Mode: {mode}</source>
+        <translation>Modo: {mode}</translation>
+    </message>
+    <message>
+        <source>Timer ({behavior})</source>
+        <translation>Temporizador ({behavior})</translation>
+    </message>
+    <message>
+        <source>Switch to Timer</source>
+        <translation>Cambiar a temporizador</translation>
+    </message>
+    <message>
+        <source>Switch to Clock</source>
+        <translation>Cambiar a reloj</translation>
+    </message>
+    <message>
+        <source>Switch to Alarm</source>
+        <translation>Cambiar a alarma</translation>
+    </message>
+    <message>
+        <source>Pause</source>
+        <translation>Pausa</translation>
+    </message>
+    <message>
+        <source>Start</source>
+        <translation>Iniciar</translation>
+    </message>
+    <message>
+        <source>Digital Clock</source>
+        <translation>Reloj digital</translation>
+    </message>
+    <message>
+        <source>Language</source>
+        <translation>Idioma</translation>
+    </message>
+    <message>
+        <source>English</source>
+        <translation>Inglés</translation>
+    </message>
+    <message>
+        <source>Spanish</source>
+        <translation>Español</translation>
+    </message>
+    <message>
+        <source>Use Stopwatch</source>
+        <translation>Usar cronómetro</translation>
+    </message>
+    <message>
+        <source>Use Countdown</source>
+        <translation>Usar cuenta atrás</translation>
+    </message>
+    <message>
+        <source>Countdown</source>
+        <translation>Cuenta atrás</translation>
+    </message>
+    <message>
+        <source>Stopwatch</source>
+        <translation>Cronómetro</translation>
+    </message>
+    <message>
+        <source>Alarm disabled</source>
+        <translation>Alarma desactivada</translation>
+    </message>
+    <message>
+        <source>Next alarm at {time} ({countdown})</source>
+        <translation>Próxima alarma a las {time} ({countdown})</translation>
+    </message>
+    <message>
+        <source>Set Alarm</source>
+        <translation>Configurar alarma</translation>
+    </message>
+    <message>
+        <source>Alarm time (HH:MM)</source>
+        <translation>Hora de la alarma (HH:MM)</translation>
+    </message>
+    <message>
+        <source>Invalid time format</source>
+        <translation>Formato de hora no válido</translation>
+    </message>
+    <message>
+        <source>Timer finished</source>
+        <translation>El temporizador ha finalizado</translation>
+    </message>
+</context>
+</TS>
@@ -1,10 +1,28 @@
 from __future__ import annotations
 
+import string
+import sys
+import threading
+import weakref
 from enum import Enum
 from pathlib import Path
+from time import localtime, struct_time, time
 from typing import Dict, Optional, Tuple
 
-from PySide6.QtCore import QCoreApplication, QDateTime, QEvent, QFile, QTime, QTimer, QTranslator, Signal
+from PySide6.QtCore import (
+    QBuffer,
+    QByteArray,
+    QCoreApplication,
+    QDateTime,
+    QEvent,
+    QFile,
+    QIODevice,
+    Qt,
+    QTime,
+    QTimer,
+    QTranslator,
+    Signal,
+)
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QAbstractSpinBox,
@@ -21,6 +39,20 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtUiTools import QUiLoader
 
+try:
+    # Módulo generado con: pyside6-rcc reloj.qrc -o reloj_rc.py
+    from Views.components import reloj_rc  # noqa: F401
+except ImportError:
+    reloj_rc = None
+
+_UI_RESOURCE = ":/ui/reloj.ui"
+_QM_RESOURCE = ":/i18n/reloj_es.qm"
+
+# Rutas resueltas una sola vez al importar el módulo
+_MODULE_DIR = Path(__file__).resolve().parent
+_UI_PATH = _MODULE_DIR / "reloj.ui"
+_QM_PATH = _MODULE_DIR / "reloj_es.qm"
+
 
 _ES_TRANSLATIONS: Dict[str, Dict[str, str]] = {
     "RelojDigital": {
@@ -57,16 +89,57 @@ _ES_TRANSLATIONS: Dict[str, Dict[str, str]] = {
 }
 
 
+# Identificadores enteros de cada modo para las comparaciones del tick
+_MODE_CLOCK = 0
+_MODE_TIMER = 1
+_MODE_ALARM = 2
+
+# "MM:SS" precalculado para los 3600 valores posibles dentro de una hora
+_MMSS: Tuple[str, ...] = tuple(f"{m:02d}:{s:02d}" for m in range(60) for s in range(60))
+
+_FORMATTER = string.Formatter()
+
+# Contenido de los .ui ya leídos, indexado por ruta junto a su mtime
+_UI_BYTES_CACHE: Dict[Path, Tuple[float, QByteArray]] = {}
+_UI_CACHE_LOCK = threading.Lock()
+
+
+def _read_ui_bytes(path: Path) -> QByteArray:
+    """Devuelve el contenido del .ui, releyéndolo solo si cambió en disco."""
+    mtime = path.stat().st_mtime
+    with _UI_CACHE_LOCK:
+        cached = _UI_BYTES_CACHE.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, QByteArray(path.read_bytes()))
+            _UI_BYTES_CACHE[path] = cached
+        return cached[1]
+
+
+# Solo existe el contexto "RelojDigital": se aplana a un único dict con claves internadas
+_ES_CONTEXT = "RelojDigital"
+_ES_FLAT: Dict[str, str] = {
+    sys.intern(source): sys.intern(text) for source, text in _ES_TRANSLATIONS[_ES_CONTEXT].items()
+}
+
+
 class InlineTranslator(QTranslator):
-    def __init__(self, translations: Dict[str, Dict[str, str]]) -> None:
+    def __init__(self, context: str, translations: Dict[str, str]) -> None:
         super().__init__()
+        self._context = context
         self._translations = translations
 
     def translate(self, context, sourceText, disambiguation=None, n=-1):  # type: ignore[override]
-        context_key = context or ""
-        context_map = self._translations.get(context_key, {})
-        text = context_map.get(sourceText)
-        return text if text is not None else sourceText
+        if context != self._context:
+            return sourceText
+        return self._translations.get(sourceText, sourceText)
+
+
+def _create_spanish_translator() -> QTranslator:
+    """Usa el .qm compilado (recurso o archivo) y, si no existe, el diccionario."""
+    translator = QTranslator()
+    if translator.load(_QM_RESOURCE) or translator.load(str(_QM_PATH)):
+        return translator
+    return InlineTranslator(_ES_CONTEXT, _ES_FLAT)
 
 
 class RelojDigital(QWidget):
@@ -90,6 +163,19 @@ class RelojDigital(QWidget):
         Mode.TIMER,
         Mode.ALARM,
     )
+    _NEXT_MODE: Dict["RelojDigital.Mode", "RelojDigital.Mode"] = dict(
+        zip(MODE_SEQUENCE, MODE_SEQUENCE[1:] + MODE_SEQUENCE[:1])
+    )
+    _MODE_FROM_STR: Dict[str, "RelojDigital.Mode"] = {mode.value: mode for mode in Mode}
+    _MODE_IDS: Dict["RelojDigital.Mode", int] = {
+        Mode.CLOCK: _MODE_CLOCK,
+        Mode.TIMER: _MODE_TIMER,
+        Mode.ALARM: _MODE_ALARM,
+    }
+
+    # Un único tick para todas las instancias vivas del reloj
+    _SHARED_TICK: Optional[QTimer] = None
+    _INSTANCES: "weakref.WeakSet[RelojDigital]" = weakref.WeakSet()
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -104,7 +190,16 @@ class RelojDigital(QWidget):
         self._languageLabel: QLabel = self._require_child("languageLabel", QLabel)
         self._languageCombo: QComboBox = self._require_child("languageCombo", QComboBox)
 
+        self._trCache: Dict[str, str] = {}
+        self._tmplCache: Dict[str, Tuple[Tuple[str, Optional[str]], ...]] = {}
+        # Último texto/estado aplicado a cada widget, para no repetir llamadas a Qt
+        self._shadowText: Dict[int, str] = {}
+        self._shadowEnabled: Dict[int, bool] = {}
+        self._modeLabelKey: Optional[str] = None
+        self._alarmDisplayKey: Optional[Tuple[str, str]] = None
+        self._alarmDisplayText = ""
         self._mode = RelojDigital.Mode.CLOCK
+        self._modeId = _MODE_CLOCK
         self._is24Hour = True
         self._alarmEnabled = False
         self._alarmHour = 7
@@ -116,19 +211,34 @@ class RelojDigital(QWidget):
         self._remainingSeconds = self._timerDuration
         self._elapsedSeconds = 0
         self._timerRunning = False
-        self._lastAlarmStamp: Optional[Tuple[int, int]] = None
+        self._alarmTarget: Optional[QDateTime] = None
+        self._notifyBox: Optional[QMessageBox] = None
+        self._alarmTargetSecs = 0
+        self._lastHM: Optional[Tuple[int, int, bool]] = None
+        self._lastHMPrefix = ""
+        self._lastHMSuffix = ""
         self._languageCodes = ["es", "en"]
         self._currentLanguage = "es"
         self._translatorMap = {
             "en": None,
-            "es": InlineTranslator(_ES_TRANSLATIONS),
+            "es": _create_spanish_translator(),
         }
         self._activeTranslator: Optional[QTranslator] = None
 
-        self._tick = QTimer(self)
-        self._tick.setInterval(1000)
-        self._tick.timeout.connect(self._on_tick)
-        self._tick.start()
+        RelojDigital._register_instance(self)
+
+        # La alarma se programa para su hora exacta en lugar de comprobarse cada segundo
+        self._alarmTimer = QTimer(self)
+        self._alarmTimer.setSingleShot(True)
+        self._alarmTimer.setTimerType(Qt.PreciseTimer)
+        self._alarmTimer.timeout.connect(self._fire_alarm)
+
+        # Agrupa las ráfagas de resizeEvent en un único recálculo de fuente
+        self._lastFontSize: Optional[int] = None
+        self._resizeTimer = QTimer(self)
+        self._resizeTimer.setSingleShot(True)
+        self._resizeTimer.setInterval(30)
+        self._resizeTimer.timeout.connect(self._apply_display_font)
 
         self._initialize_language_combo()
         self._apply_translator()
@@ -138,22 +248,45 @@ class RelojDigital(QWidget):
         self._refresh_clock_display()
 
     def _load_ui(self) -> QWidget:
-        ui_path = Path(__file__).resolve().with_name("reloj.ui")
+        if reloj_rc is not None:
+            widget = self._load_ui_from_resource()
+        else:
+            widget = self._load_ui_from_file()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(widget)
+        return widget
+
+    def _load_ui_from_resource(self) -> QWidget:
+        ui_file = QFile(_UI_RESOURCE)
+        if not ui_file.open(QIODevice.ReadOnly):
+            raise RuntimeError(self.tr("Unable to open {path}").format(path=_UI_RESOURCE))
+        widget = QUiLoader().load(ui_file, self)
+        ui_file.close()
+        if widget is None:
+            raise RuntimeError(self.tr("Could not load UI from {path}").format(path=_UI_RESOURCE))
+        return widget
+
+    def _load_ui_from_file(self) -> QWidget:
+        ui_path = _UI_PATH
         if not ui_path.exists():
             raise FileNotFoundError(self.tr("UI file not found: {path}").format(path=ui_path))
 
+        try:
+            ui_data = _read_ui_bytes(ui_path)
+        except OSError:
+            raise RuntimeError(self.tr("Unable to open {path}").format(path=ui_path))
+
         loader = QUiLoader()
-        ui_file = QFile(str(ui_path))
-        if not ui_file.open(QFile.ReadOnly):
+        ui_buffer = QBuffer()
+        ui_buffer.setData(ui_data)
+        if not ui_buffer.open(QIODevice.ReadOnly):
             raise RuntimeError(self.tr("Unable to open {path}").format(path=ui_path))
-        widget = loader.load(ui_file, self)
-        ui_file.close()
+        widget = loader.load(ui_buffer, self)
+        ui_buffer.close()
         if widget is None:
             raise RuntimeError(self.tr("Could not load UI from {path}").format(path=ui_path))
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(widget)
         return widget
 
     def _require_child(self, name: str, cls: type):
@@ -192,17 +325,23 @@ class RelojDigital(QWidget):
         self._languageCombo.currentIndexChanged.connect(self._handle_language_combo_change)
 
     def _initialize_language_combo(self) -> None:
-        self._languageCombo.blockSignals(True)
-        self._languageCombo.clear()
-        for code in self._languageCodes:
-            self._languageCombo.addItem("", code)
-        self._languageCombo.blockSignals(False)
-        self._update_language_combo_texts()
-        self._sync_language_selection()
+        # Textos, datos y selección en una sola pasada con las señales bloqueadas una vez
+        combo = self._languageCombo
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems([self._language_label_text(code) for code in self._languageCodes])
+        for idx, code in enumerate(self._languageCodes):
+            combo.setItemData(idx, code)
+        combo.setCurrentIndex(self._language_index())
+        combo.blockSignals(False)
 
     def resizeEvent(self, event):  # type: ignore[override]
-        """Ajusta el tamaño de fuente del display al redimensionar."""
+        """Programa el ajuste de la fuente del display al redimensionar."""
         super().resizeEvent(event)
+        self._resizeTimer.start()
+
+    def _apply_display_font(self) -> None:
+        """Ajusta el tamaño de fuente del display al tamaño actual del widget."""
         if self._displayLabel:
             # Calcular tamaño de fuente basado en el tamaño del widget
             # Usar regla de tres simple: el tamaño de fuente es proporcional al tamaño mínimo
@@ -216,23 +355,66 @@ class RelojDigital(QWidget):
             font_size = max(12, int(min_dimension * 0.10))  # Mínimo 12pt
             font_size = min(font_size, 72)  # Máximo 72pt para evitar excesos
             
-            # Aplicar el nuevo tamaño de fuente
-            font = self._displayLabel.font()
-            if font.pointSize() != font_size:
+            # Aplicar el nuevo tamaño de fuente solo si ha cambiado
+            if font_size != self._lastFontSize:
+                self._lastFontSize = font_size
+                font = self._displayLabel.font()
                 font.setPointSize(font_size)
                 self._displayLabel.setFont(font)
 
+    def showEvent(self, event):  # type: ignore[override]
+        super().showEvent(event)
+        # Mientras estuvo oculto _on_tick pudo saltarse el refresco
+        if self._modeId == _MODE_CLOCK:
+            self._refresh_clock_display()
+        elif self._modeId == _MODE_ALARM:
+            self._refresh_alarm_display()
+
     def changeEvent(self, event):  # type: ignore[override]
         super().changeEvent(event)
         if event.type() == QEvent.LanguageChange:
             self._retranslate_ui()
 
+    def _t(self, key: str) -> str:
+        value = self._trCache.get(key)
+        if value is None:
+            value = self.tr(key)
+            self._trCache[key] = value
+        return value
+
+    def _set_text(self, widget: QWidget, text: str) -> None:
+        key = id(widget)
+        if self._shadowText.get(key) != text:
+            self._shadowText[key] = text
+            widget.setText(text)
+
+    def _set_enabled(self, widget: QWidget, enabled: bool) -> None:
+        key = id(widget)
+        if self._shadowEnabled.get(key) != enabled:
+            self._shadowEnabled[key] = enabled
+            widget.setEnabled(enabled)
+
+    def _fill(self, key: str, **values: str) -> str:
+        # La plantilla traducida se trocea una sola vez en (literal, campo)
+        parts = self._tmplCache.get(key)
+        if parts is None:
+            parts = tuple(
+                (literal, field) for literal, field, _spec, _conv in _FORMATTER.parse(self._t(key))
+            )
+            self._tmplCache[key] = parts
+        return "".join(literal if field is None else literal + values[field] for literal, field in parts)
+
     def _retranslate_ui(self) -> None:
+        # Las traducciones cacheadas dejan de ser válidas al cambiar el idioma
+        self._trCache.clear()
+        self._tmplCache.clear()
+        self._modeLabelKey = None
+        self._alarmDisplayKey = None
         if not self._alarmMessageCustom:
-            self._alarmMessage = self.tr("Alarm")
-        self._resetButton.setText(self.tr("Reset"))
-        self._languageLabel.setText(self.tr("Language"))
-        self._setAlarmButton.setText(self.tr("Set Alarm"))
+            self._alarmMessage = self._t("Alarm")
+        self._set_text(self._resetButton, self._t("Reset"))
+        self._set_text(self._languageLabel, self._t("Language"))
+        self._set_text(self._setAlarmButton, self._t("Set Alarm"))
         self._update_language_combo_texts()
         self._update_mode_label()
         self._update_mode_button()
@@ -249,6 +431,7 @@ class RelojDigital(QWidget):
         if new_mode == self._mode:
             return
         self._mode = new_mode
+        self._modeId = RelojDigital._MODE_IDS[new_mode]
         self._timerRunning = False
         self._sync_controls()
         self.modeChanged.emit(self._mode.value)
@@ -257,18 +440,14 @@ class RelojDigital(QWidget):
     def _normalize_mode(value: str | Mode) -> Mode:
         if isinstance(value, RelojDigital.Mode):
             return value
-        normalized = value.lower()
-        return RelojDigital.Mode(normalized)
+        mode = RelojDigital._MODE_FROM_STR.get(value.lower())
+        if mode is None:
+            raise ValueError(f"{value!r} is not a valid RelojDigital.Mode")
+        return mode
 
     @staticmethod
     def _next_mode_value(current: Optional["RelojDigital.Mode"] = None) -> "RelojDigital.Mode":
-        sequence = RelojDigital.MODE_SEQUENCE
-        active = current or sequence[0]
-        try:
-            index = sequence.index(active)
-        except ValueError:
-            index = 0
-        return sequence[(index + 1) % len(sequence)]
+        return RelojDigital._NEXT_MODE.get(current, RelojDigital.MODE_SEQUENCE[1])
 
     @property
     def is24Hour(self) -> bool:
@@ -277,7 +456,7 @@ class RelojDigital(QWidget):
     @is24Hour.setter
     def is24Hour(self, value: bool) -> None:
         self._is24Hour = bool(value)
-        if self._mode == RelojDigital.Mode.CLOCK:
+        if self._modeId == _MODE_CLOCK:
             self._refresh_clock_display()
 
     @property
@@ -287,6 +466,7 @@ class RelojDigital(QWidget):
     @alarmEnabled.setter
     def alarmEnabled(self, value: bool) -> None:
         self._alarmEnabled = bool(value)
+        self._rearm_alarm()
 
     @property
     def alarmHour(self) -> int:
@@ -295,6 +475,7 @@ class RelojDigital(QWidget):
     @alarmHour.setter
     def alarmHour(self, value: int) -> None:
         self._alarmHour = max(0, min(23, int(value)))
+        self._rearm_alarm()
 
     @property
     def alarmMinute(self) -> int:
@@ -303,6 +484,7 @@ class RelojDigital(QWidget):
     @alarmMinute.setter
     def alarmMinute(self, value: int) -> None:
         self._alarmMinute = max(0, min(59, int(value)))
+        self._rearm_alarm()
 
     @property
     def alarmMessage(self) -> str:
@@ -325,24 +507,24 @@ class RelojDigital(QWidget):
             self._remainingSeconds = seconds
             self._elapsedSeconds = 0
             self._timerRunning = False
-            if self._mode == RelojDigital.Mode.TIMER:
+            if self._modeId == _MODE_TIMER:
                 self._refresh_timer_display()
                 self._update_start_button()
 
     def start(self) -> None:
-        if self._mode != RelojDigital.Mode.TIMER:
+        if self._modeId != _MODE_TIMER:
             return
         self._timerRunning = True
         self._update_start_button()
 
     def stop(self) -> None:
-        if self._mode != RelojDigital.Mode.TIMER:
+        if self._modeId != _MODE_TIMER:
             return
         self._timerRunning = False
         self._update_start_button()
 
     def reset(self) -> None:
-        if self._mode != RelojDigital.Mode.TIMER:
+        if self._modeId != _MODE_TIMER:
             return
         self._timerRunning = False
         if self._timerBehavior == RelojDigital.TimerBehavior.COUNTDOWN:
@@ -354,7 +536,7 @@ class RelojDigital(QWidget):
         self._update_start_button()
 
     def _handle_start_stop(self) -> None:
-        if self._mode != RelojDigital.Mode.TIMER:
+        if self._modeId != _MODE_TIMER:
             return
         if self._timerRunning:
             self.stop()
@@ -365,14 +547,14 @@ class RelojDigital(QWidget):
         self.mode = self._next_mode_value(self._mode)
 
     def _sync_controls(self) -> None:
-        is_timer = self._mode == RelojDigital.Mode.TIMER
-        self._startStopButton.setEnabled(is_timer)
-        self._resetButton.setEnabled(is_timer)
+        is_timer = self._modeId == _MODE_TIMER
+        self._set_enabled(self._startStopButton, is_timer)
+        self._set_enabled(self._resetButton, is_timer)
         self._update_mode_label()
         self._update_mode_button()
-        if self._mode == RelojDigital.Mode.CLOCK:
+        if self._modeId == _MODE_CLOCK:
             self._refresh_clock_display()
-        elif self._mode == RelojDigital.Mode.TIMER:
+        elif self._modeId == _MODE_TIMER:
             self._refresh_timer_display()
         else:
             self._refresh_alarm_display()
@@ -380,77 +562,124 @@ class RelojDigital(QWidget):
         self._update_timer_type_button()
 
     def _update_mode_label(self) -> None:
-        if self._mode == RelojDigital.Mode.CLOCK:
-            mode_text = self.tr("Clock")
-        elif self._mode == RelojDigital.Mode.TIMER:
-            behavior = self.tr("Countdown") if self._timerBehavior == RelojDigital.TimerBehavior.COUNTDOWN else self.tr("Stopwatch")
-            mode_text = self.tr("Timer ({behavior})").format(behavior=behavior)
+        if self._modeId == _MODE_CLOCK:
+            mode_text = self._t("Clock")
+        elif self._modeId == _MODE_TIMER:
+            behavior = self._t("Countdown") if self._timerBehavior == RelojDigital.TimerBehavior.COUNTDOWN else self._t("Stopwatch")
+            mode_text = self._fill("Timer ({behavior})", behavior=behavior)
         else:
-            mode_text = self.tr("Alarm")
-        self._modeLabel.setText(self.tr("Mode: {mode}").format(mode=mode_text))
+            mode_text = self._t("Alarm")
+        if mode_text != self._modeLabelKey:
+            self._modeLabelKey = mode_text
+            self._set_text(self._modeLabel, self._fill("Mode: {mode}", mode=mode_text))
 
     def _update_mode_button(self) -> None:
         next_mode = self._next_mode_value(self._mode)
         if next_mode == RelojDigital.Mode.CLOCK:
-            text = self.tr("Switch to Clock")
+            text = self._t("Switch to Clock")
         elif next_mode == RelojDigital.Mode.TIMER:
-            text = self.tr("Switch to Timer")
+            text = self._t("Switch to Timer")
         else:
-            text = self.tr("Switch to Alarm")
-        self._modeButton.setText(text)
+            text = self._t("Switch to Alarm")
+        self._set_text(self._modeButton, text)
 
     def _update_start_button(self) -> None:
-        text = self.tr("Pause") if self._timerRunning else self.tr("Start")
-        self._startStopButton.setText(text)
+        text = self._t("Pause") if self._timerRunning else self._t("Start")
+        self._set_text(self._startStopButton, text)
 
     def _update_timer_type_button(self) -> None:
-        is_timer = self._mode == RelojDigital.Mode.TIMER
-        self._timerTypeButton.setEnabled(is_timer)
+        is_timer = self._modeId == _MODE_TIMER
+        self._set_enabled(self._timerTypeButton, is_timer)
         if self._timerBehavior == RelojDigital.TimerBehavior.COUNTDOWN:
-            text = self.tr("Use Stopwatch")
+            text = self._t("Use Stopwatch")
         else:
-            text = self.tr("Use Countdown")
-        self._timerTypeButton.setText(text)
-
-    def _on_tick(self) -> None:
-        if self._mode == RelojDigital.Mode.CLOCK:
-            self._refresh_clock_display()
-        elif self._mode == RelojDigital.Mode.TIMER:
+            text = self._t("Use Countdown")
+        self._set_text(self._timerTypeButton, text)
+
+    @classmethod
+    def _register_instance(cls, instance: "RelojDigital") -> None:
+        cls._INSTANCES.add(instance)
+        if cls._SHARED_TICK is None:
+            # Tick de un solo disparo que se reprograma al siguiente segundo exacto
+            cls._SHARED_TICK = QTimer()
+            cls._SHARED_TICK.setSingleShot(True)
+            cls._SHARED_TICK.setTimerType(Qt.PreciseTimer)
+            cls._SHARED_TICK.timeout.connect(cls._dispatch_tick)
+        if not cls._SHARED_TICK.isActive():
+            cls._schedule_next_tick()
+
+    @classmethod
+    def _schedule_next_tick(cls) -> None:
+        cls._SHARED_TICK.start(1000 - int(time() * 1000) % 1000)
+
+    @classmethod
+    def _dispatch_tick(cls) -> None:
+        # Se reprograma antes de repartir: un diálogo modal no debe parar el tick
+        cls._schedule_next_tick()
+        now = localtime()
+        for instance in list(cls._INSTANCES):
+            try:
+                instance._on_tick(now)
+            except RuntimeError:
+                # El objeto C++ ya se destruyó aunque quede el envoltorio Python
+                cls._INSTANCES.discard(instance)
+        if not cls._INSTANCES:
+            cls._SHARED_TICK.stop()
+
+    def _on_tick(self, now: struct_time) -> None:
+        # Oculto y sin temporizador activo no hay nada que hacer
+        if not self.isVisible() and self._modeId != _MODE_TIMER:
+            return
+        if self._modeId == _MODE_CLOCK:
+            self._refresh_clock_display(now)
+        elif self._modeId == _MODE_TIMER:
             self._advance_timer()
             self._refresh_timer_display()
         else:
             self._refresh_alarm_display()
-        self._check_alarm()
 
-    def _refresh_clock_display(self) -> None:
-        now = QDateTime.currentDateTime()
-        time = now.time()
-        fmt = "hh:mm:ss AP" if not self._is24Hour else "HH:mm:ss"
-        text = time.toString(fmt)
-        if self._displayLabel.text() != text:
-            self._displayLabel.setText(text)
+    def _refresh_clock_display(self, now: Optional[struct_time] = None) -> None:
+        if now is None:
+            now = localtime()
+        hour = now.tm_hour
+        minute = now.tm_min
+        # Solo se recompone "HH:mm:" cuando cambia el minuto (o el formato)
+        hm = (hour, minute, self._is24Hour)
+        if hm != self._lastHM:
+            self._lastHM = hm
+            if self._is24Hour:
+                self._lastHMPrefix = f"{hour:02d}:{minute:02d}:"
+                self._lastHMSuffix = ""
+            else:
+                self._lastHMPrefix = f"{hour % 12 or 12:02d}:{minute:02d}:"
+                self._lastHMSuffix = " AM" if hour < 12 else " PM"
+        self._set_text(self._displayLabel, f"{self._lastHMPrefix}{now.tm_sec:02d}{self._lastHMSuffix}")
 
     def _refresh_timer_display(self) -> None:
         seconds = self._remainingSeconds if self._timerBehavior == RelojDigital.TimerBehavior.COUNTDOWN else self._elapsedSeconds
         formatted = self._format_seconds(seconds)
-        if self._displayLabel.text() != formatted:
-            self._displayLabel.setText(formatted)
+        self._set_text(self._displayLabel, formatted)
 
     def _refresh_alarm_display(self) -> None:
         if not self._alarmEnabled:
-            text = self.tr("Alarm disabled")
+            text = self._t("Alarm disabled")
         else:
-            next_alarm = self._next_alarm_datetime()
+            next_alarm = self._alarmTarget
             if next_alarm is None:
-                text = self.tr("Alarm disabled")
+                text = self._t("Alarm disabled")
             else:
                 fmt = "HH:mm" if self._is24Hour else "hh:mm AP"
                 alarm_time = next_alarm.time().toString(fmt)
-                seconds = max(0, QDateTime.currentDateTime().secsTo(next_alarm))
+                seconds = max(0, self._alarmTargetSecs - int(time()))
                 countdown = self._format_seconds(seconds)
-                text = self.tr("Next alarm at {time} ({countdown})").format(time=alarm_time, countdown=countdown)
-        if self._displayLabel.text() != text:
-            self._displayLabel.setText(text)
+                key = (alarm_time, countdown)
+                if key != self._alarmDisplayKey:
+                    self._alarmDisplayKey = key
+                    self._alarmDisplayText = self._fill(
+                        "Next alarm at {time} ({countdown})", time=alarm_time, countdown=countdown
+                    )
+                text = self._alarmDisplayText
+        self._set_text(self._displayLabel, text)
 
     def _next_alarm_datetime(self) -> Optional[QDateTime]:
         if not self._alarmEnabled:
@@ -464,11 +693,10 @@ class RelojDigital(QWidget):
 
     @staticmethod
     def _format_seconds(seconds: int) -> str:
-        seconds = max(0, seconds)
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        remaining = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{remaining:02d}"
+        hours, remaining = divmod(max(0, seconds), 3600)
+        if hours:
+            return f"{hours:02d}:{_MMSS[remaining]}"
+        return "00:" + _MMSS[remaining]
 
     def _advance_timer(self) -> None:
         if not self._timerRunning:
@@ -484,26 +712,38 @@ class RelojDigital(QWidget):
         else:
             self._elapsedSeconds += 1
 
-    def _check_alarm(self) -> None:
-        if not self._alarmEnabled:
-            return
-        now = QDateTime.currentDateTime()
-        time = now.time()
-        if time.hour() != self._alarmHour or time.minute() != self._alarmMinute:
-            return
-        stamp = (now.date().toJulianDay(), time.minute())
-        if stamp == self._lastAlarmStamp:
+    def _rearm_alarm(self) -> None:
+        self._alarmTimer.stop()
+        self._alarmTarget = self._next_alarm_datetime()
+        if self._alarmTarget is not None:
+            self._alarmTargetSecs = self._alarmTarget.toSecsSinceEpoch()
+            self._alarmTimer.start(QDateTime.currentDateTime().msecsTo(self._alarmTarget))
+
+    def _fire_alarm(self) -> None:
+        if not self._alarmEnabled or self._alarmTarget is None:
             return
-        self._lastAlarmStamp = stamp
-        message = self._alarmMessage or self.tr("Alarm")
+        # Se reprograma a partir del objetivo para no repetir si el timer se adelanta
+        self._alarmTarget = self._alarmTarget.addDays(1)
+        self._alarmTargetSecs = self._alarmTarget.toSecsSinceEpoch()
+        self._alarmTimer.start(max(0, QDateTime.currentDateTime().msecsTo(self._alarmTarget)))
+        message = self._alarmMessage or self._t("Alarm")
         self.alarmTriggered.emit(message)
         self._notify_alarm_trigger(message)
 
+    def _notify(self, title: str, message: str) -> None:
+        # Se reutiliza un único QMessageBox; si ya está abierto solo se actualiza
+        if self._notifyBox is None:
+            self._notifyBox = QMessageBox(QMessageBox.Information, "", "", QMessageBox.Ok, self)
+        self._notifyBox.setWindowTitle(title)
+        self._notifyBox.setText(message)
+        if not self._notifyBox.isVisible():
+            self._notifyBox.exec()
+
     def _notify_alarm_trigger(self, message: str) -> None:
-        QMessageBox.information(self, self.tr("Alarm"), message)
+        self._notify(self._t("Alarm"), message)
 
     def _notify_timer_finished(self) -> None:
-        QMessageBox.information(self, self.tr("Timer"), self.tr("Timer finished"))
+        self._notify(self._t("Timer"), self._t("Timer finished"))
 
     def _toggle_timer_behavior(self) -> None:
         new_behavior = (
@@ -515,9 +755,9 @@ class RelojDigital(QWidget):
 
     def _prompt_alarm_time(self) -> None:
         dialog = QDialog(self)
-        dialog.setWindowTitle(self.tr("Set Alarm"))
+        dialog.setWindowTitle(self._t("Set Alarm"))
         layout = QVBoxLayout(dialog)
-        label = QLabel(self.tr("Alarm time (HH:MM)"), dialog)
+        label = QLabel(self._t("Alarm time (HH:MM)"), dialog)
         layout.addWidget(label)
 
         time_edit = QTimeEdit(dialog)
@@ -538,7 +778,7 @@ class RelojDigital(QWidget):
         self.alarmHour = time.hour()
         self.alarmMinute = time.minute()
         self.alarmEnabled = True
-        if self._mode == RelojDigital.Mode.ALARM:
+        if self._modeId == _MODE_ALARM:
             self._refresh_alarm_display()
 
     @property
@@ -580,16 +820,18 @@ class RelojDigital(QWidget):
         self._languageCombo.blockSignals(False)
 
     def _language_label_text(self, code: str) -> str:
-        return self.tr("English") if code == "en" else self.tr("Spanish")
+        return self._t("English") if code == "en" else self._t("Spanish")
 
     def _sync_language_selection(self) -> None:
         self._languageCombo.blockSignals(True)
+        self._languageCombo.setCurrentIndex(self._language_index())
+        self._languageCombo.blockSignals(False)
+
+    def _language_index(self) -> int:
         try:
-            index = self._languageCodes.index(self._currentLanguage)
+            return self._languageCodes.index(self._currentLanguage)
         except ValueError:
-            index = 0
-        self._languageCombo.setCurrentIndex(index)
-        self._languageCombo.blockSignals(False)
+            return 0
 
     def setLanguage(self, code: Optional[str]) -> None:
         normalized = self._normalize_language(code)
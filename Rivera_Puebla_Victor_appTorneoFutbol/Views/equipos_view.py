@@ -5,8 +5,181 @@ Crea la interfaz de gestión de equipos dinámicamente.
 
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QFrame,
                                QLabel, QLineEdit, QPushButton, QComboBox,
-                               QListWidget, QScrollArea)
-from PySide6.QtCore import Qt, QSize
+                               QListWidget, QFormLayout)
+from PySide6.QtCore import Qt, QSize, QTimer, QRectF
+from PySide6.QtGui import QPixmap, QPainter, QPen, QColor
+
+from Views.components.filtro_primer_show import FiltroPrimerShow
+
+
+# Hoja de estilo única de la vista, aplicada sobre el widget raíz. Todas las
+# reglas van por objectName para no afectar a los widgets que añade el controlador.
+_EQUIPOS_QSS = """
+QLabel#lblTituloEquipos {
+    font-size: 20px;
+    font-weight: bold;
+    color: #FFD700;
+}
+
+QLabel[role="field"] {
+    color: #FFD700;
+}
+
+QPushButton#btnSeleccionarColor, QPushButton#btnGuardar {
+    color: #1E1E1E;
+}
+
+QPushButton#btnLimpiar {
+    color: #000000;
+}
+
+QLabel#lblTituloLista {
+    font-size: 18px;
+    font-weight: bold;
+    color: #FFFFFF;
+}
+
+QPushButton#btnEditar, QPushButton#btnEliminar {
+    color: #000000;
+    background-color: #4CAF50;
+    border-radius: 5px;
+    padding: 10px;
+    font-weight: bold;
+}
+"""
+
+# Tamaño de los iconos del combo de escudos
+_TAMANO_ICONO_ESCUDO = QSize(48, 48)
+
+# Lado de la vista previa del escudo y grosor de su marco discontinuo
+_TAMANO_VISTA_PREVIA = 80
+_GROSOR_MARCO_VISTA_PREVIA = 2
+
+# Marco de la vista previa, pintado la primera vez que se necesita
+_marco_vista_previa = None
+
+
+def pixmap_vista_previa(escudo=None):
+    """
+    Devuelve la imagen de la vista previa: el marco discontinuo con el
+    escudo dentro. El marco se pinta una sola vez con QPainter y se
+    reutiliza, en lugar de que la hoja de estilos lo trace en cada repintado.
+    
+    Args:
+        escudo: QPixmap del escudo, o None para mostrar solo el marco
+    
+    Returns:
+        QPixmap: Imagen lista para lblVistaPrevia.setPixmap
+    """
+    global _marco_vista_previa
+    if _marco_vista_previa is None:
+        _marco_vista_previa = QPixmap(_TAMANO_VISTA_PREVIA, _TAMANO_VISTA_PREVIA)
+        _marco_vista_previa.fill(Qt.transparent)
+        painter = QPainter(_marco_vista_previa)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor("#4A5F7F"), _GROSOR_MARCO_VISTA_PREVIA, Qt.DashLine))
+        mitad = _GROSOR_MARCO_VISTA_PREVIA / 2
+        painter.drawRoundedRect(
+            QRectF(mitad, mitad,
+                   _TAMANO_VISTA_PREVIA - _GROSOR_MARCO_VISTA_PREVIA,
+                   _TAMANO_VISTA_PREVIA - _GROSOR_MARCO_VISTA_PREVIA),
+            10, 10)
+        painter.end()
+        
+    if escudo is None:
+        return _marco_vista_previa
+        
+    # Escudo centrado dentro del marco, sin tapar el borde
+    interior = _TAMANO_VISTA_PREVIA - 2 * _GROSOR_MARCO_VISTA_PREVIA
+    escudo = escudo.scaled(interior, interior, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    resultado = QPixmap(_marco_vista_previa)
+    painter = QPainter(resultado)
+    painter.drawPixmap((_TAMANO_VISTA_PREVIA - escudo.width()) // 2,
+                       (_TAMANO_VISTA_PREVIA - escudo.height()) // 2,
+                       escudo)
+    painter.end()
+    return resultado
+
+
+def _field_label(texto):
+    """
+    Crea la etiqueta de un campo del formulario.
+    Su estilo sale de la regla QLabel[role="field"] de la hoja de la vista.
+    
+    Args:
+        texto: Texto de la etiqueta
+    
+    Returns:
+        QLabel: Etiqueta del campo
+    """
+    lbl = QLabel(texto)
+    lbl.setProperty("role", "field")
+    return lbl
+
+
+def _build_lista(refs):
+    """
+    Construye el panel derecho con el buscador y la lista de equipos.
+    
+    Args:
+        refs: Diccionario de referencias de la vista, al que se añaden
+              los widgets del panel
+    
+    Returns:
+        QFrame: Panel de la lista
+    """
+    frame_lista = QFrame()
+    frame_lista.setObjectName("frameLista")
+    
+    layout_lista = QVBoxLayout(frame_lista)
+    layout_lista.setSpacing(15)
+    
+    # Título
+    lblTituloLista = QLabel("Equipos registrados")
+    lblTituloLista.setObjectName("lblTituloLista")
+    lblTituloLista.setAlignment(Qt.AlignCenter)
+    layout_lista.addWidget(lblTituloLista)
+    
+    # Buscador
+    txtBuscar = QLineEdit()
+    txtBuscar.setObjectName("txtBuscar")
+    txtBuscar.setPlaceholderText("🔍 Buscar por nombre o curso...")
+    layout_lista.addWidget(txtBuscar)
+    
+    # Lista de equipos (QListWidget ya tiene su propio scroll)
+    listEquipos = QListWidget()
+    listEquipos.setObjectName("listEquipos")
+    listEquipos.setVerticalScrollMode(QListWidget.ScrollPerPixel)
+    # Todos los equipos ocupan una línea con su escudo: Qt puede calcular la
+    # altura una vez y colocar las filas por lotes
+    listEquipos.setUniformItemSizes(True)
+    listEquipos.setLayoutMode(QListWidget.Batched)
+    listEquipos.setBatchSize(100)
+    layout_lista.addWidget(listEquipos)
+    
+    # Botón para ver jugadores del equipo seleccionado
+    btnVerJugadores = QPushButton("VER JUGADORES DEL EQUIPO")
+    btnVerJugadores.setObjectName("btnVerJugadores")
+    layout_lista.addWidget(btnVerJugadores)
+    
+    # Botones de edición/eliminación
+    layout_acciones = QHBoxLayout()
+    btnEditar = QPushButton("EDITAR")
+    btnEditar.setObjectName("btnEditar")
+    btnEliminar = QPushButton("ELIMINAR")
+    btnEliminar.setObjectName("btnEliminar")
+    layout_acciones.addWidget(btnEditar)
+    layout_acciones.addWidget(btnEliminar)
+    layout_lista.addLayout(layout_acciones)
+    
+    refs.update({
+        "txtBuscar": txtBuscar,
+        "listEquipos": listEquipos,
+        "btnVerJugadores": btnVerJugadores,
+        "btnEditar": btnEditar,
+        "btnEliminar": btnEliminar,
+    })
+    return frame_lista
 
 
 def crear_vista_equipos():
@@ -18,6 +191,7 @@ def crear_vista_equipos():
     """
     widget = QWidget()
     widget.setObjectName("pagina_equipos")
+    widget.setStyleSheet(_EQUIPOS_QSS)
     
     # Layout principal
     layout_principal = QVBoxLayout(widget)
@@ -36,70 +210,66 @@ def crear_vista_equipos():
     # === FORMULARIO (Izquierda) ===
     frame_formulario = QFrame()
     frame_formulario.setObjectName("frameFormulario")
-    frame_formulario.setMaximumWidth(400)
+    # Ancho fijo: el layout no necesita negociar el ancho del formulario
+    frame_formulario.setFixedWidth(400)
     
     layout_formulario = QVBoxLayout(frame_formulario)
     layout_formulario.setSpacing(15)
     
     # Título
     lblTitulo = QLabel("Gestión de equipos")
-    lblTitulo.setStyleSheet("font-size: 20px; font-weight: bold; color: #FFD700;")
+    lblTitulo.setObjectName("lblTituloEquipos")
     lblTitulo.setAlignment(Qt.AlignCenter)
     layout_formulario.addWidget(lblTitulo)
     
+    # Campos: cada etiqueta encima de su campo, en un único QFormLayout
+    layout_campos = QFormLayout()
+    layout_campos.setRowWrapPolicy(QFormLayout.WrapAllRows)
+    layout_campos.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+    layout_campos.setLabelAlignment(Qt.AlignLeft)
+    layout_campos.setVerticalSpacing(15)
+    layout_campos.setContentsMargins(0, 0, 0, 0)
+    
     # Nombre
-    lblNombre = QLabel("Nombre del equipo:")
-    lblNombre.setStyleSheet("color: #FFD700;")
     txtNombre = QLineEdit()
     txtNombre.setObjectName("txtNombre")
     txtNombre.setPlaceholderText("Ej: Real Madrid")
-    layout_formulario.addWidget(lblNombre)
-    layout_formulario.addWidget(txtNombre)
+    layout_campos.addRow(_field_label("Nombre del equipo:"), txtNombre)
     
     # Curso
-    lblCurso = QLabel("Curso:")
-    lblCurso.setStyleSheet("color: #FFD700;")
     txtCurso = QLineEdit()
     txtCurso.setObjectName("txtCurso")
     txtCurso.setPlaceholderText("Ej: 1º ESO, 2º DAM")
-    layout_formulario.addWidget(lblCurso)
-    layout_formulario.addWidget(txtCurso)
+    layout_campos.addRow(_field_label("Curso:"), txtCurso)
     
     # Color
-    lblColor = QLabel("Color del equipo:")
-    lblColor.setStyleSheet("color: #FFD700;")
     btnSeleccionarColor = QPushButton("Seleccionar color")
     btnSeleccionarColor.setObjectName("btnSeleccionarColor")
-    btnSeleccionarColor.setStyleSheet("color: #1E1E1E;")
-    layout_formulario.addWidget(lblColor)
-    layout_formulario.addWidget(btnSeleccionarColor)
+    layout_campos.addRow(_field_label("Color del equipo:"), btnSeleccionarColor)
     
     # Escudo
-    lblEscudo = QLabel("Escudo:")
-    lblEscudo.setStyleSheet("color: #FFD700;")
     comboEscudos = QComboBox()
     comboEscudos.setObjectName("comboEscudos")
-    comboEscudos.setIconSize(QSize(48, 48))
+    comboEscudos.setIconSize(_TAMANO_ICONO_ESCUDO)
     comboEscudos.setMinimumHeight(60)
-    layout_formulario.addWidget(lblEscudo)
-    layout_formulario.addWidget(comboEscudos)
+    layout_campos.addRow(_field_label("Escudo:"), comboEscudos)
+    
+    layout_formulario.addLayout(layout_campos)
     
     # Vista previa del escudo
     lblVistaPrevia = QLabel()
     lblVistaPrevia.setObjectName("lblVistaPrevia")
-    lblVistaPrevia.setFixedSize(80, 80)
+    lblVistaPrevia.setFixedSize(_TAMANO_VISTA_PREVIA, _TAMANO_VISTA_PREVIA)
     lblVistaPrevia.setAlignment(Qt.AlignCenter)
-    lblVistaPrevia.setStyleSheet("border: 2px dashed #4A5F7F; border-radius: 10px;")
+    lblVistaPrevia.setPixmap(pixmap_vista_previa())
     layout_formulario.addWidget(lblVistaPrevia)
     
     # Botones
     layout_botones = QHBoxLayout()
     btnGuardar = QPushButton("GUARDAR")
     btnGuardar.setObjectName("btnGuardar")
-    btnGuardar.setStyleSheet("""color: #1E1E1E;""")
     btnLimpiar = QPushButton("LIMPIAR")
     btnLimpiar.setObjectName("btnLimpiar")
-    btnLimpiar.setStyleSheet("""color: #000000;""")
     layout_botones.addWidget(btnGuardar)
     layout_botones.addWidget(btnLimpiar)
     layout_formulario.addLayout(layout_botones)
@@ -109,62 +279,50 @@ def crear_vista_equipos():
     layout_contenido.addWidget(frame_formulario)
     
     # === LISTA (Derecha) ===
-    frame_lista = QFrame()
-    frame_lista.setObjectName("frameLista")
-    
-    layout_lista = QVBoxLayout(frame_lista)
-    layout_lista.setSpacing(15)
-    
-    # Título
-    lblTituloLista = QLabel("Equipos registrados")
-    lblTituloLista.setStyleSheet("font-size: 18px; font-weight: bold; color: #FFFFFF;")
-    lblTituloLista.setAlignment(Qt.AlignCenter)
-    layout_lista.addWidget(lblTituloLista)
+    # Se construye justo después del primer Show, para que el formulario se
+    # pinte sin esperar a la lista; hasta entonces ocupa su sitio un hueco vacío
+    placeholder_lista = QWidget()
+    layout_contenido.addWidget(placeholder_lista)
     
-    # Buscador
-    txtBuscar = QLineEdit()
-    txtBuscar.setObjectName("txtBuscar")
-    txtBuscar.setPlaceholderText("🔍 Buscar por nombre o curso...")
-    layout_lista.addWidget(txtBuscar)
-    
-    # Lista de equipos
-    scroll_area = QScrollArea()
-    scroll_area.setWidgetResizable(True)
-    scroll_area.setFrameShape(QFrame.NoFrame)
-    
-    listEquipos = QListWidget()
-    listEquipos.setObjectName("listEquipos")
-    scroll_area.setWidget(listEquipos)
-    
-    layout_lista.addWidget(scroll_area)
-    
-    # Botón para ver jugadores del equipo seleccionado
-    btnVerJugadores = QPushButton("VER JUGADORES DEL EQUIPO")
-    btnVerJugadores.setObjectName("btnVerJugadores")
-    layout_lista.addWidget(btnVerJugadores)
+    layout_principal.addLayout(layout_contenido)
     
-    # Botones de edición/eliminación
-    layout_acciones = QHBoxLayout()
-    btnEditar = QPushButton("EDITAR")
-    btnEditar.setStyleSheet("""color: #000000;
-    background-color: #4CAF50;
-    border-radius: 5px;
-    padding: 10px;
-    font-weight: bold;""")
-    btnEditar.setObjectName("btnEditar")
-    btnEliminar = QPushButton("ELIMINAR")
-    btnEliminar.setStyleSheet("""color: #000000;
-    background-color: #4CAF50;
-    border-radius: 5px;
-    padding: 10px;
-    font-weight: bold;""")
-    btnEliminar.setObjectName("btnEliminar")
-    layout_acciones.addWidget(btnEditar)
-    layout_acciones.addWidget(btnEliminar)
-    layout_lista.addLayout(layout_acciones)
+    # Referencias por objectName para que el controlador no tenga que recorrer
+    # el árbol con findChild. La lista añade las suyas al crearse
+    widget._refs = {
+        "btnVolver": btnVolver,
+        "txtNombre": txtNombre,
+        "txtCurso": txtCurso,
+        "btnSeleccionarColor": btnSeleccionarColor,
+        "comboEscudos": comboEscudos,
+        "lblVistaPrevia": lblVistaPrevia,
+        "btnGuardar": btnGuardar,
+        "btnLimpiar": btnLimpiar,
+    }
     
-    layout_contenido.addWidget(frame_lista)
+    def _asegurar_lista():
+        """Construye la lista de equipos si aún no existe y avisa a los interesados."""
+        if widget._lista_construida:
+            return
+        widget._lista_construida = True
+        # La vista ya está visible: sin repintar hasta que la lista esté
+        # colocada y rellena, así se pinta una sola vez
+        widget.setUpdatesEnabled(False)
+        try:
+            frame_lista = _build_lista(widget._refs)
+            layout_contenido.replaceWidget(placeholder_lista, frame_lista)
+            placeholder_lista.deleteLater()
+            for callback in widget._al_construir_lista:
+                callback()
+            widget._al_construir_lista.clear()
+        finally:
+            widget.setUpdatesEnabled(True)
     
-    layout_principal.addLayout(layout_contenido)
+    widget._lista_construida = False
+    # Funciones a llamar cuando la lista exista (el controlador registra aquí
+    # la conexión de sus señales)
+    widget._al_construir_lista = []
+    widget.asegurar_lista = _asegurar_lista
+    widget.installEventFilter(
+        FiltroPrimerShow(lambda: QTimer.singleShot(0, _asegurar_lista), widget))
     
     return widget
@@ -5,10 +5,38 @@ Crea la interfaz de gestión de participantes dinámicamente.
 
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QFrame,
                                QLabel, QLineEdit, QPushButton, QComboBox,
-                               QListWidget, QScrollArea, QRadioButton, QButtonGroup,
+                               QListView, QScrollArea, QRadioButton, QButtonGroup,
                                QDateEdit, QCheckBox, QSpinBox, QTableWidget,
                                QHeaderView, QGroupBox)
 from PySide6.QtCore import Qt, QDate
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache, QPainter
+from Models.participantes_model import ParticipantesModel, ParticipantesFilterProxy
+
+
+def _emoji_icon(ch: str, size: int = 20) -> QIcon:
+    """
+    Devuelve un icono con el emoji indicado, renderizado una sola vez.
+    
+    El pixmap se guarda en QPixmapCache para que los botones no tengan que
+    resolver la fuente del emoji en cada repintado.
+    
+    Args:
+        ch: Emoji a dibujar
+        size: Tamaño en píxeles del icono
+        
+    Returns:
+        QIcon: Icono con el emoji
+    """
+    key = f"emoji:{ch}:{size}"
+    pix = QPixmap()
+    if not QPixmapCache.find(key, pix):
+        pix = QPixmap(size, size)
+        pix.fill(Qt.transparent)
+        painter = QPainter(pix)
+        painter.drawText(pix.rect(), Qt.AlignCenter, ch)
+        painter.end()
+        QPixmapCache.insert(key, pix)
+    return QIcon(pix)
 
 
 def crear_vista_participantes():
@@ -32,6 +60,7 @@ def crear_vista_participantes():
     # ========== COLUMNA 1: FORMULARIO DE REGISTRO (30%) ==========
     frame_formulario = QFrame()
     frame_formulario.setObjectName("frameFormulario")
+    frame_formulario.setAttribute(Qt.WA_StyledBackground, True)
     frame_formulario.setFrameShape(QFrame.StyledPanel)
     frame_formulario.setStyleSheet("""
         QFrame#frameFormulario { 
@@ -66,7 +95,8 @@ def crear_vista_participantes():
     layout_formulario.setSpacing(5)
     
     # Botón volver
-    btnVolver = QPushButton("⬅ VOLVER")
+    btnVolver = QPushButton(" VOLVER")
+    btnVolver.setIcon(_emoji_icon("⬅"))
     btnVolver.setObjectName("btnVolver")
     btnVolver.setMinimumHeight(30)
     btnVolver.setMaximumHeight(30)
@@ -84,6 +114,8 @@ def crear_vista_participantes():
     scroll_form.setWidgetResizable(True)
     scroll_form.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
     scroll_form.setStyleSheet("QScrollArea { background: rgba(30, 40, 60, 0.9); border: none; }")
+    # El contenido ya pinta su propio fondo; evitar el relleno extra del viewport
+    scroll_form.viewport().setAutoFillBackground(False)
     
     widget_form_content = QWidget()
     widget_form_content.setStyleSheet("QWidget { background: rgba(30, 40, 60, 0.9); }")
@@ -261,14 +293,16 @@ def crear_vista_participantes():
     layout_botones_form = QHBoxLayout()
     layout_botones_form.setSpacing(5)
     
-    btnGuardar = QPushButton("💾 GUARDAR")
+    btnGuardar = QPushButton(" GUARDAR")
+    btnGuardar.setIcon(_emoji_icon("💾"))
     btnGuardar.setObjectName("btnGuardar")
     btnGuardar.setMinimumHeight(35)
     btnGuardar.setMaximumHeight(35)
     btnGuardar.setSizePolicy(btnGuardar.sizePolicy().horizontalPolicy(), btnGuardar.sizePolicy().verticalPolicy())
     btnGuardar.setStyleSheet("QPushButton { background-color: rgba(60, 80, 120, 0.9); color: #FFD700; font-weight: bold; padding: 5px; border: 2px solid #4A5F7F; }")
     
-    btnLimpiar = QPushButton("🗑 LIMPIAR")
+    btnLimpiar = QPushButton(" LIMPIAR")
+    btnLimpiar.setIcon(_emoji_icon("🗑"))
     btnLimpiar.setObjectName("btnLimpiar")
     btnLimpiar.setMinimumHeight(35)
     btnLimpiar.setMaximumHeight(35)
@@ -289,6 +323,7 @@ def crear_vista_participantes():
     # ========== COLUMNA 2: LISTA DE PARTICIPANTES (35%) ==========
     frame_lista = QFrame()
     frame_lista.setObjectName("frameLista")
+    frame_lista.setAttribute(Qt.WA_StyledBackground, True)
     frame_lista.setFrameShape(QFrame.StyledPanel)
     layout_lista = QVBoxLayout(frame_lista)
     
@@ -327,22 +362,29 @@ def crear_vista_participantes():
     layout_lista.addLayout(layout_filtros)
     
     # Lista de participantes
-    listParticipantes = QListWidget()
+    # La vista trabaja sobre un proxy para que el filtrado lo haga Qt
+    listParticipantes = QListView()
     listParticipantes.setObjectName("listParticipantes")
-    listParticipantes.setStyleSheet("QListWidget { color: black; }")
+    listParticipantes.setStyleSheet("QListView { color: black; }")
+    modeloParticipantes = ParticipantesModel(listParticipantes)
+    proxyParticipantes = ParticipantesFilterProxy(listParticipantes)
+    proxyParticipantes.setSourceModel(modeloParticipantes)
+    listParticipantes.setModel(proxyParticipantes)
     layout_lista.addWidget(listParticipantes)
     
     # Botones de gestión
     layout_botones_lista = QHBoxLayout()
     layout_botones_lista.setSpacing(5)
     
-    btnEditar = QPushButton("✏ EDITAR")
+    btnEditar = QPushButton(" EDITAR")
+    btnEditar.setIcon(_emoji_icon("✏"))
     btnEditar.setObjectName("btnEditar")
     btnEditar.setMinimumHeight(35)
     btnEditar.setMaximumHeight(35)
     btnEditar.setStyleSheet("QPushButton { padding: 5px; }")
     
-    btnEliminar = QPushButton("🗑 ELIMINAR")
+    btnEliminar = QPushButton(" ELIMINAR")
+    btnEliminar.setIcon(_emoji_icon("🗑"))
     btnEliminar.setObjectName("btnEliminar")
     btnEliminar.setMinimumHeight(35)
     btnEliminar.setMaximumHeight(35)
@@ -357,6 +399,7 @@ def crear_vista_participantes():
     # ========== COLUMNA 3: ASIGNACIÓN A EQUIPOS (30%) ==========
     frame_asignacion = QFrame()
     frame_asignacion.setObjectName("frameAsignacion")
+    frame_asignacion.setAttribute(Qt.WA_StyledBackground, True)
     frame_asignacion.setFrameShape(QFrame.StyledPanel)
     layout_asignacion = QVBoxLayout(frame_asignacion)
     
@@ -373,7 +416,8 @@ def crear_vista_participantes():
     layout_asignacion.addWidget(lblEquipoAsignar)
     layout_asignacion.addWidget(comboEquipoAsignar)
     
-    btnCargarJugadores = QPushButton("📋 CARGAR JUGADORES DEL EQUIPO")
+    btnCargarJugadores = QPushButton(" CARGAR JUGADORES DEL EQUIPO")
+    btnCargarJugadores.setIcon(_emoji_icon("📋"))
     btnCargarJugadores.setObjectName("btnCargarJugadores")
     btnCargarJugadores.setMinimumHeight(35)
     btnCargarJugadores.setMaximumHeight(35)
@@ -401,14 +445,16 @@ def crear_vista_participantes():
     layout_asignacion.addWidget(lblJugadorAsignar)
     layout_asignacion.addWidget(comboJugadorAsignar)
     
-    btnAsignarEquipo = QPushButton("➕ ASIGNAR AL EQUIPO")
+    btnAsignarEquipo = QPushButton(" ASIGNAR AL EQUIPO")
+    btnAsignarEquipo.setIcon(_emoji_icon("➕"))
     btnAsignarEquipo.setObjectName("btnAsignarEquipo")
     btnAsignarEquipo.setMinimumHeight(35)
     btnAsignarEquipo.setMaximumHeight(35)
     btnAsignarEquipo.setStyleSheet("QPushButton { background-color: rgba(60, 80, 120, 0.9); color: #FFD700; font-weight: bold; padding: 5px; border: 2px solid #4A5F7F; }")
     layout_asignacion.addWidget(btnAsignarEquipo)
     
-    btnDesasignarEquipo = QPushButton("➖ QUITAR DEL EQUIPO")
+    btnDesasignarEquipo = QPushButton(" QUITAR DEL EQUIPO")
+    btnDesasignarEquipo.setIcon(_emoji_icon("➖"))
     btnDesasignarEquipo.setObjectName("btnDesasignarEquipo")
     btnDesasignarEquipo.setMinimumHeight(35)
     btnDesasignarEquipo.setMaximumHeight(35)
@@ -4,11 +4,265 @@ Crea la interfaz de resultados dinámicamente.
 """
 
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QFrame,
-                               QLabel, QPushButton, QListWidget, QTableWidget,
-                               QTableWidgetItem, QHeaderView, QScrollArea,
-                               QSpinBox, QCheckBox, QGroupBox, QComboBox)
+                               QLabel, QPushButton, QListWidget, QComboBox,
+                               QStackedWidget)
 from PySide6.QtCore import Qt
-from Views.components.reloj_widget import RelojDigital
+
+from Views.components.filtro_primer_show import FiltroPrimerShow
+
+
+# Hoja de estilo única de la vista, aplicada sobre el widget raíz. Todas las
+# reglas van por objectName para no afectar a los widgets del reloj ni a las
+# celdas que añade el controlador.
+_RESULTADOS_QSS = """
+QLabel#lblTituloResultados {
+    font-size: 20px;
+    font-weight: bold;
+    color: #FFD700;
+}
+
+QFrame#panelIzquierdo {
+    background-color: rgba(30, 40, 60, 0.9);
+    border-radius: 10px;
+    padding: 10px;
+}
+QLabel#lblTituloPartidos {
+    font-size: 16px;
+    font-weight: bold;
+    color: #FFD700;
+}
+QLabel#lblFiltro {
+    color: #FFD700;
+    font-weight: bold;
+}
+
+QComboBox#comboFiltroEstado {
+    background-color: #E6E6E6;
+    color: #1E1E1E;
+    border: 1px solid #4A5F7F;
+    border-radius: 5px;
+    padding: 5px;
+    min-height: 25px;
+}
+QComboBox#comboFiltroEstado::drop-down {
+    border: none;
+    width: 20px;
+}
+QComboBox#comboFiltroEstado::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 5px solid #1E1E1E;
+    margin-right: 5px;
+}
+QComboBox#comboFiltroEstado QAbstractItemView {
+    background-color: #E6E6E6;
+    color: #1E1E1E;
+    selection-background-color: #4A5F7F;
+    selection-color: black;
+}
+
+QListWidget#listPartidos {
+    background-color: white;
+    color: black;
+    border: 1px solid #CCCCCC;
+    border-radius: 5px;
+    padding: 5px;
+}
+QListWidget#listPartidos::item {
+    color: black;
+    padding: 10px;
+    border-bottom: 1px solid #EEEEEE;
+}
+QListWidget#listPartidos::item:selected {
+    background-color: #E8F5E9;
+    color: black;
+}
+QListWidget#listPartidos::item:hover {
+    background-color: #F1F8F4;
+}
+
+QFrame#frameResumen {
+    background-color: rgba(255, 255, 255, 180);
+    border: 2px solid #4CAF50;
+    border-radius: 8px;
+    padding: 10px;
+}
+QLabel#lblResumenTitulo {
+    font-weight: bold;
+    font-size: 14px;
+    color: #000000;
+}
+QLabel#lblResumen {
+    color: #000000;
+    font-size: 13px;
+    font-weight: bold;
+}
+
+QLabel#lblSinPartido {
+    font-size: 16px;
+    font-weight: bold;
+    color: #FFD700;
+}
+
+QFrame#panelDerecho {
+    background-color: rgba(255, 255, 255, 200);
+    border-radius: 10px;
+    padding: 10px;
+}
+QLabel#lblPartidoSeleccionado {
+    font-size: 16px;
+    font-weight: bold;
+    color: #000000;
+}
+
+QGroupBox#groupEquipoA, QGroupBox#groupEquipoB {
+    font-weight: bold;
+    color: black;
+    border: 2px solid #4CAF50;
+    border-radius: 8px;
+    margin-top: 10px;
+    padding: 10px;
+    background-color: rgba(255, 255, 255, 150);
+}
+QGroupBox#groupEquipoB {
+    border-color: #2196F3;
+}
+QGroupBox#groupEquipoA::title, QGroupBox#groupEquipoB::title {
+    color: black;
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+}
+QLabel#lblNombreEquipoA, QLabel#lblNombreEquipoB {
+    font-size: 18px;
+    font-weight: bold;
+    color: #000000;
+}
+
+QTableView#tableJugadoresA, QTableView#tableJugadoresB {
+    background-color: white;
+    color: black;
+    gridline-color: #DDDDDD;
+    border: 1px solid #CCCCCC;
+}
+QTableView#tableJugadoresA::item, QTableView#tableJugadoresB::item {
+    color: black;
+    padding: 5px;
+}
+QTableView#tableJugadoresA QHeaderView::section,
+QTableView#tableJugadoresB QHeaderView::section {
+    background-color: #4CAF50;
+    color: white;
+    font-weight: bold;
+    padding: 5px;
+    border: none;
+}
+QTableView#tableJugadoresB QHeaderView::section {
+    background-color: #2196F3;
+}
+QLabel#lblTotalGolesA, QLabel#lblTotalGolesB {
+    font-weight: bold;
+    color: #000000;
+    font-size: 14px;
+}
+
+QPushButton#btnIniciarPartido, QPushButton#btnFinalizarPartido,
+QPushButton#btnCancelarPartido, QPushButton#btnReabrirPartido,
+QPushButton#btnRegistrarResultado, QPushButton#btnLimpiar {
+    color: white;
+    font-weight: bold;
+    border-radius: 5px;
+    border: none;
+}
+QPushButton#btnRegistrarResultado {
+    background-color: #4CAF50;
+    font-size: 14px;
+}
+QPushButton#btnRegistrarResultado:hover { background-color: #45A049; }
+QPushButton#btnLimpiar {
+    background-color: #9E9E9E;
+    font-size: 14px;
+}
+QPushButton#btnLimpiar:hover { background-color: #757575; }
+QPushButton#btnRegistrarResultado:disabled {
+    background-color: #CCCCCC;
+    color: #666666;
+}
+"""
+
+# Botones de gestión de estado: (objectName, texto, color, color al pasar el ratón)
+_BOTONES_ESTADO = (
+    ("btnIniciarPartido", "INICIAR PARTIDO", "#FFA726", "#FB8C00"),
+    ("btnFinalizarPartido", "FINALIZAR PARTIDO", "#66BB6A", "#4CAF50"),
+    ("btnCancelarPartido", "CANCELAR PARTIDO", "#EF5350", "#E53935"),
+    ("btnReabrirPartido", "REABRIR PARTIDO", "#42A5F5", "#2196F3"),
+)
+
+_QSS_BOTON_ESTADO = """
+QPushButton#{0} {{ background-color: {2}; }}
+QPushButton#{0}:hover {{ background-color: {3}; }}
+QPushButton#{0}:disabled {{ background-color: #CCCCCC; color: #666666; }}
+"""
+
+_RESULTADOS_QSS += "".join(_QSS_BOTON_ESTADO.format(*boton) for boton in _BOTONES_ESTADO)
+
+
+def _build_equipo_group(sufijo):
+    """
+    Construye el grupo de registro de un equipo del partido.
+    
+    Args:
+        sufijo: Letra del equipo ("A" o "B"), usada en el título y en los objectName
+    
+    Returns:
+        Tupla (grupo, tabla de jugadores, spin de total de goles, label del nombre)
+    """
+    # Solo se necesitan al construir el panel derecho, que ya es perezoso
+    from PySide6.QtWidgets import QGroupBox, QTableView, QHeaderView, QSpinBox
+    from Models.jugadores_partido_model import JugadoresModel
+    
+    group = QGroupBox()
+    group.setObjectName(f"groupEquipo{sufijo}")
+    group.setTitle(f"Equipo {sufijo}")
+    layout = QVBoxLayout(group)
+    
+    # Nombre del equipo
+    lblNombre = QLabel("")
+    lblNombre.setObjectName(f"lblNombreEquipo{sufijo}")
+    lblNombre.setAlignment(Qt.AlignCenter)
+    layout.addWidget(lblNombre)
+    
+    # Tabla de jugadores del equipo
+    table = QTableView()
+    table.setObjectName(f"tableJugadores{sufijo}")
+    table.setModel(JugadoresModel(table))
+    header = table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeToContents)
+    header.setSectionResizeMode(0, QHeaderView.Stretch)
+    # Los goles se editan con un solo clic, como hacía antes el spinbox de la celda
+    table.setEditTriggers(QTableView.AllEditTriggers)
+    table.setSelectionBehavior(QTableView.SelectRows)
+    table.setSelectionMode(QTableView.SingleSelection)
+    layout.addWidget(table)
+    
+    # Total goles del equipo
+    layoutTotal = QHBoxLayout()
+    lblTotalGoles = QLabel("Total Goles:")
+    lblTotalGoles.setObjectName(f"lblTotalGoles{sufijo}")
+    layoutTotal.addWidget(lblTotalGoles)
+    
+    spin = QSpinBox()
+    spin.setObjectName(f"spinTotalGoles{sufijo}")
+    spin.setMinimum(0)
+    spin.setMaximum(99)
+    spin.setReadOnly(True)
+    layoutTotal.addWidget(spin)
+    layoutTotal.addStretch()
+    
+    layout.addLayout(layoutTotal)
+    
+    return group, table, spin, lblNombre
 
 
 def crear_vista_resultados():
@@ -20,6 +274,7 @@ def crear_vista_resultados():
     """
     widget = QWidget()
     widget.setObjectName("pagina_resultados")
+    widget.setStyleSheet(_RESULTADOS_QSS)
     
     # Layout principal
     layout_principal = QVBoxLayout(widget)
@@ -40,22 +295,44 @@ def crear_vista_resultados():
     
     # Título
     lblTitulo = QLabel("Registro de Resultados")
-    lblTitulo.setStyleSheet("font-size: 20px; font-weight: bold; color: #FFD700;")
+    lblTitulo.setObjectName("lblTituloResultados")
     lblTitulo.setAlignment(Qt.AlignCenter)
     layout_titulo_reloj.addWidget(lblTitulo)
     
     # Spacer central para empujar el reloj a la derecha
     layout_titulo_reloj.addStretch()
     
-    # Reloj digital en la esquina superior derecha
-    reloj = RelojDigital()
-    reloj.setObjectName("relojPartido")
-    reloj.setMaximumWidth(400)
-    reloj.mode = "timer"
-    layout_titulo_reloj.addWidget(reloj)
-    
+    # Reloj digital en la esquina superior derecha. Se crea al mostrarse la
+    # vista por primera vez y se añade al final de esta fila; hasta entonces
+    # no ocupa ningún widget
     layout_principal.addLayout(layout_titulo_reloj)
     
+    def _asegurar_reloj():
+        """Crea el reloj de partido una sola vez, avisa a los interesados y lo devuelve."""
+        if widget._reloj_built:
+            return widget._reloj
+        from Views.components.reloj_widget import RelojDigital
+        reloj = RelojDigital()
+        reloj.setObjectName("relojPartido")
+        reloj.setMaximumWidth(400)
+        reloj.mode = "timer"
+        layout_titulo_reloj.addWidget(reloj)
+        refs["relojPartido"] = reloj
+        widget._reloj = reloj
+        widget._reloj_built = True
+        for callback in widget._al_construir_reloj:
+            callback()
+        widget._al_construir_reloj.clear()
+        return reloj
+    
+    widget._reloj = None
+    widget._reloj_built = False
+    # Funciones a llamar cuando el reloj exista (el controlador registra aquí
+    # su configuración)
+    widget._al_construir_reloj = []
+    widget.asegurar_reloj = _asegurar_reloj
+    widget.installEventFilter(FiltroPrimerShow(_asegurar_reloj, widget))
+    
     # Layout horizontal: Lista partidos (1/3) | Registro de jugadores (2/3)
     layout_contenido = QHBoxLayout()
     layout_contenido.setSpacing(20)
@@ -64,27 +341,20 @@ def crear_vista_resultados():
     panel_izquierdo = QFrame()
     panel_izquierdo.setObjectName("panelIzquierdo")
     panel_izquierdo.setMaximumWidth(400)
-    panel_izquierdo.setStyleSheet("""
-        QFrame#panelIzquierdo {
-            background-color: rgba(30, 40, 60, 0.9);
-            border-radius: 10px;
-            padding: 10px;
-        }
-    """)
     
     layout_izquierdo = QVBoxLayout(panel_izquierdo)
     layout_izquierdo.setSpacing(15)
     
     # Título
     lblTituloPartidos = QLabel("Partidos")
-    lblTituloPartidos.setStyleSheet("font-size: 16px; font-weight: bold; color: #FFD700;")
+    lblTituloPartidos.setObjectName("lblTituloPartidos")
     lblTituloPartidos.setAlignment(Qt.AlignCenter)
     layout_izquierdo.addWidget(lblTituloPartidos)
     
     # Filtro de estado
     layout_filtro = QHBoxLayout()
     lblFiltro = QLabel("Filtrar:")
-    lblFiltro.setStyleSheet("color: #FFD700; font-weight: bold;")
+    lblFiltro.setObjectName("lblFiltro")
     layout_filtro.addWidget(lblFiltro)
     
     comboFiltroEstado = QComboBox()
@@ -94,33 +364,6 @@ def crear_vista_resultados():
     comboFiltroEstado.addItem("En Curso", "en_curso")
     comboFiltroEstado.addItem("Finalizados", "finalizado")
     comboFiltroEstado.addItem("Cancelados", "cancelado")
-    comboFiltroEstado.setStyleSheet("""
-        QComboBox {
-            background-color: #E6E6E6;
-            color: #1E1E1E;
-            border: 1px solid #4A5F7F;
-            border-radius: 5px;
-            padding: 5px;
-            min-height: 25px;
-        }
-        QComboBox::drop-down {
-            border: none;
-            width: 20px;
-        }
-        QComboBox::down-arrow {
-            image: none;
-            border-left: 5px solid transparent;
-            border-right: 5px solid transparent;
-            border-top: 5px solid #1E1E1E;
-            margin-right: 5px;
-        }
-        QComboBox QAbstractItemView {
-            background-color: #E6E6E6;
-            color: #1E1E1E;
-            selection-background-color: #4A5F7F;
-            selection-color: black;
-        }
-    """)
     layout_filtro.addWidget(comboFiltroEstado)
     layout_filtro.addStretch()
     
@@ -129,45 +372,21 @@ def crear_vista_resultados():
     # Lista de partidos
     listPartidos = QListWidget()
     listPartidos.setObjectName("listPartidos")
-    listPartidos.setStyleSheet("""
-        QListWidget {
-            background-color: white;
-            color: black;
-            border: 1px solid #CCCCCC;
-            border-radius: 5px;
-            padding: 5px;
-        }
-        QListWidget::item {
-            color: black;
-            padding: 10px;
-            border-bottom: 1px solid #EEEEEE;
-        }
-        QListWidget::item:selected {
-            background-color: #E8F5E9;
-            color: black;
-        }
-        QListWidget::item:hover {
-            background-color: #F1F8F4;
-        }
-    """)
+    # Todas las filas tienen la misma forma (dos líneas de texto e icono opcional):
+    # Qt puede calcular la altura una vez y colocar las filas por lotes
+    listPartidos.setUniformItemSizes(True)
+    listPartidos.setLayoutMode(QListWidget.Batched)
+    listPartidos.setBatchSize(50)
     layout_izquierdo.addWidget(listPartidos)
     
     # Resumen del resultado
     frameResumen = QFrame()
     frameResumen.setObjectName("frameResumen")
     frameResumen.setMaximumHeight(150)
-    frameResumen.setStyleSheet("""
-        QFrame#frameResumen {
-            background-color: rgba(255, 255, 255, 180);
-            border: 2px solid #4CAF50;
-            border-radius: 8px;
-            padding: 10px;
-        }
-    """)
     layoutResumen = QVBoxLayout(frameResumen)
     
     lblResumenTitulo = QLabel("Resumen del Resultado")
-    lblResumenTitulo.setStyleSheet("font-weight: bold; font-size: 14px; color: #000000;")
+    lblResumenTitulo.setObjectName("lblResumenTitulo")
     lblResumenTitulo.setAlignment(Qt.AlignCenter)
     layoutResumen.addWidget(lblResumenTitulo)
     
@@ -175,7 +394,6 @@ def crear_vista_resultados():
     lblResumen.setObjectName("lblResumen")
     lblResumen.setWordWrap(True)
     lblResumen.setAlignment(Qt.AlignCenter)
-    lblResumen.setStyleSheet("color: #000000; font-size: 13px; font-weight: bold;")
     layoutResumen.addWidget(lblResumen)
     
     layout_izquierdo.addWidget(frameResumen)
@@ -183,329 +401,102 @@ def crear_vista_resultados():
     layout_contenido.addWidget(panel_izquierdo, 1)
     
     # === PANEL DERECHO: REGISTRO DE JUGADORES (2/3) ===
-    panel_derecho = QFrame()
-    panel_derecho.setObjectName("panelDerecho")
-    panel_derecho.setStyleSheet("""
-        QFrame#panelDerecho {
-            background-color: rgba(255, 255, 255, 200);
-            border-radius: 10px;
-            padding: 10px;
-        }
-    """)
-    
-    layout_derecho = QVBoxLayout(panel_derecho)
-    layout_derecho.setSpacing(15)
-    
-    # Información del partido seleccionado
-    lblPartidoSeleccionado = QLabel("Selecciona un partido para registrar el resultado")
-    lblPartidoSeleccionado.setObjectName("lblPartidoSeleccionado")
-    lblPartidoSeleccionado.setStyleSheet("font-size: 16px; font-weight: bold; color: #000000;")
-    lblPartidoSeleccionado.setAlignment(Qt.AlignCenter)
-    layout_derecho.addWidget(lblPartidoSeleccionado)
-    
-    # Layout horizontal para los dos equipos
-    layout_equipos = QHBoxLayout()
-    layout_equipos.setSpacing(10)
-    
-    # === EQUIPO A ===
-    groupEquipoA = QGroupBox()
-    groupEquipoA.setObjectName("groupEquipoA")
-    groupEquipoA.setTitle("Equipo A")
-    groupEquipoA.setStyleSheet("""
-        QGroupBox {
-            font-weight: bold;
-            color: black;
-            border: 2px solid #4CAF50;
-            border-radius: 8px;
-            margin-top: 10px;
-            padding: 10px;
-            background-color: rgba(255, 255, 255, 150);
-        }
-        QGroupBox::title {
-            color: black;
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }
-    """)
-    layoutEquipoA = QVBoxLayout(groupEquipoA)
-    
-    # Nombre del equipo A
-    lblNombreEquipoA = QLabel("")
-    lblNombreEquipoA.setObjectName("lblNombreEquipoA")
-    lblNombreEquipoA.setStyleSheet("font-size: 18px; font-weight: bold; color: #000000;")
-    lblNombreEquipoA.setAlignment(Qt.AlignCenter)
-    layoutEquipoA.addWidget(lblNombreEquipoA)
-    
-    # Tabla de jugadores del equipo A
-    tableJugadoresA = QTableWidget()
-    tableJugadoresA.setObjectName("tableJugadoresA")
-    tableJugadoresA.setColumnCount(4)
-    tableJugadoresA.setHorizontalHeaderLabels(["Jugador", "Goles", "T. Amarillas", "T. Rojas"])
-    tableJugadoresA.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-    tableJugadoresA.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-    tableJugadoresA.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-    tableJugadoresA.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-    tableJugadoresA.setEditTriggers(QTableWidget.DoubleClicked)
-    tableJugadoresA.setSelectionBehavior(QTableWidget.SelectRows)
-    tableJugadoresA.setSelectionMode(QTableWidget.SingleSelection)
-    tableJugadoresA.setStyleSheet("""
-        QTableWidget {
-            background-color: white;
-            color: black;
-            gridline-color: #DDDDDD;
-            border: 1px solid #CCCCCC;
-        }
-        QTableWidget::item {
-            color: black;
-            padding: 5px;
-        }
-        QHeaderView::section {
-            background-color: #4CAF50;
-            color: white;
-            font-weight: bold;
-            padding: 5px;
-            border: none;
-        }
-    """)
-    layoutEquipoA.addWidget(tableJugadoresA)
-    
-    # Total goles equipo A
-    layoutTotalA = QHBoxLayout()
-    lblTotalGolesA = QLabel("Total Goles:")
-    lblTotalGolesA.setStyleSheet("font-weight: bold; color: #000000; font-size: 14px;")
-    layoutTotalA.addWidget(lblTotalGolesA)
-    
-    spinTotalGolesA = QSpinBox()
-    spinTotalGolesA.setObjectName("spinTotalGolesA")
-    spinTotalGolesA.setMinimum(0)
-    spinTotalGolesA.setMaximum(99)
-    spinTotalGolesA.setReadOnly(True)
-    layoutTotalA.addWidget(spinTotalGolesA)
-    layoutTotalA.addStretch()
-    
-    layoutEquipoA.addLayout(layoutTotalA)
-    
-    layout_equipos.addWidget(groupEquipoA)
-    
-    # === EQUIPO B ===
-    groupEquipoB = QGroupBox()
-    groupEquipoB.setObjectName("groupEquipoB")
-    groupEquipoB.setTitle("Equipo B")
-    groupEquipoB.setStyleSheet("""
-        QGroupBox {
-            font-weight: bold;
-            color: black;
-            border: 2px solid #2196F3;
-            border-radius: 8px;
-            margin-top: 10px;
-            padding: 10px;
-            background-color: rgba(255, 255, 255, 150);
-        }
-        QGroupBox::title {
-            color: black;
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }
-    """)
-    layoutEquipoB = QVBoxLayout(groupEquipoB)
-    
-    # Nombre del equipo B
-    lblNombreEquipoB = QLabel("")
-    lblNombreEquipoB.setObjectName("lblNombreEquipoB")
-    lblNombreEquipoB.setStyleSheet("font-size: 18px; font-weight: bold; color: #000000;")
-    lblNombreEquipoB.setAlignment(Qt.AlignCenter)
-    layoutEquipoB.addWidget(lblNombreEquipoB)
-    
-    # Tabla de jugadores del equipo B
-    tableJugadoresB = QTableWidget()
-    tableJugadoresB.setObjectName("tableJugadoresB")
-    tableJugadoresB.setColumnCount(4)
-    tableJugadoresB.setHorizontalHeaderLabels(["Jugador", "Goles", "T. Amarillas", "T. Rojas"])
-    tableJugadoresB.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-    tableJugadoresB.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-    tableJugadoresB.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-    tableJugadoresB.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-    tableJugadoresB.setEditTriggers(QTableWidget.DoubleClicked)
-    tableJugadoresB.setSelectionBehavior(QTableWidget.SelectRows)
-    tableJugadoresB.setSelectionMode(QTableWidget.SingleSelection)
-    tableJugadoresB.setStyleSheet("""
-        QTableWidget {
-            background-color: white;
-            color: black;
-            gridline-color: #DDDDDD;
-            border: 1px solid #CCCCCC;
-        }
-        QTableWidget::item {
-            color: black;
-            padding: 5px;
-        }
-        QHeaderView::section {
-            background-color: #2196F3;
-            color: white;
-            font-weight: bold;
-            padding: 5px;
-            border: none;
-        }
-    """)
-    layoutEquipoB.addWidget(tableJugadoresB)
-    
-    # Total goles equipo B
-    layoutTotalB = QHBoxLayout()
-    lblTotalGolesB = QLabel("Total Goles:")
-    lblTotalGolesB.setStyleSheet("font-weight: bold; color: #000000; font-size: 14px;")
-    layoutTotalB.addWidget(lblTotalGolesB)
-    
-    spinTotalGolesB = QSpinBox()
-    spinTotalGolesB.setObjectName("spinTotalGolesB")
-    spinTotalGolesB.setMinimum(0)
-    spinTotalGolesB.setMaximum(99)
-    spinTotalGolesB.setReadOnly(True)
-    layoutTotalB.addWidget(spinTotalGolesB)
-    layoutTotalB.addStretch()
-    
-    layoutEquipoB.addLayout(layoutTotalB)
-    
-    layout_equipos.addWidget(groupEquipoB)
-    
-    layout_derecho.addLayout(layout_equipos)
-    
-    # Botones de gestión de estado
-    layout_botones_estado = QHBoxLayout()
-    
-    btnIniciarPartido = QPushButton("INICIAR PARTIDO")
-    btnIniciarPartido.setObjectName("btnIniciarPartido")
-    btnIniciarPartido.setMinimumHeight(40)
-    btnIniciarPartido.setStyleSheet("""
-        QPushButton {
-            background-color: #FFA726;
-            color: white;
-            font-weight: bold;
-            border-radius: 5px;
-            border: none;
-        }
-        QPushButton:hover {
-            background-color: #FB8C00;
-        }
-        QPushButton:disabled {
-            background-color: #CCCCCC;
-            color: #666666;
-        }
-    """)
-    layout_botones_estado.addWidget(btnIniciarPartido)
-    
-    btnFinalizarPartido = QPushButton("FINALIZAR PARTIDO")
-    btnFinalizarPartido.setObjectName("btnFinalizarPartido")
-    btnFinalizarPartido.setMinimumHeight(40)
-    btnFinalizarPartido.setStyleSheet("""
-        QPushButton {
-            background-color: #66BB6A;
-            color: white;
-            font-weight: bold;
-            border-radius: 5px;
-            border: none;
-        }
-        QPushButton:hover {
-            background-color: #4CAF50;
-        }
-        QPushButton:disabled {
-            background-color: #CCCCCC;
-            color: #666666;
-        }
-    """)
-    layout_botones_estado.addWidget(btnFinalizarPartido)
-    
-    btnCancelarPartido = QPushButton("CANCELAR PARTIDO")
-    btnCancelarPartido.setObjectName("btnCancelarPartido")
-    btnCancelarPartido.setMinimumHeight(40)
-    btnCancelarPartido.setStyleSheet("""
-        QPushButton {
-            background-color: #EF5350;
-            color: white;
-            font-weight: bold;
-            border-radius: 5px;
-            border: none;
-        }
-        QPushButton:hover {
-            background-color: #E53935;
-        }
-        QPushButton:disabled {
-            background-color: #CCCCCC;
-            color: #666666;
-        }
-    """)
-    layout_botones_estado.addWidget(btnCancelarPartido)
-    
-    btnReabrirPartido = QPushButton("REABRIR PARTIDO")
-    btnReabrirPartido.setObjectName("btnReabrirPartido")
-    btnReabrirPartido.setMinimumHeight(40)
-    btnReabrirPartido.setStyleSheet("""
-        QPushButton {
-            background-color: #42A5F5;
-            color: white;
-            font-weight: bold;
-            border-radius: 5px;
-            border: none;
-        }
-        QPushButton:hover {
-            background-color: #2196F3;
-        }
-        QPushButton:disabled {
-            background-color: #CCCCCC;
-            color: #666666;
-        }
-    """)
-    layout_botones_estado.addWidget(btnReabrirPartido)
-    
-    layout_derecho.addLayout(layout_botones_estado)
-    
-    # Botones de acción
-    layout_botones = QHBoxLayout()
-    
-    btnRegistrarResultado = QPushButton("REGISTRAR RESULTADO")
-    btnRegistrarResultado.setObjectName("btnRegistrarResultado")
-    btnRegistrarResultado.setMinimumHeight(50)
-    btnRegistrarResultado.setStyleSheet("""
-        QPushButton {
-            background-color: #4CAF50;
-            color: white;
-            font-weight: bold;
-            font-size: 14px;
-            border-radius: 5px;
-            border: none;
-        }
-        QPushButton:hover {
-            background-color: #45A049;
-        }
-        QPushButton:disabled {
-            background-color: #CCCCCC;
-            color: #666666;
-        }
-    """)
-    layout_botones.addWidget(btnRegistrarResultado)
-    
-    btnLimpiar = QPushButton("LIMPIAR")
-    btnLimpiar.setObjectName("btnLimpiar")
-    btnLimpiar.setMinimumHeight(50)
-    btnLimpiar.setStyleSheet("""
-        QPushButton {
-            background-color: #9E9E9E;
-            color: white;
-            font-weight: bold;
-            font-size: 14px;
-            border-radius: 5px;
-            border: none;
-        }
-        QPushButton:hover {
-            background-color: #757575;
-        }
-    """)
-    layout_botones.addWidget(btnLimpiar)
-    
-    layout_derecho.addLayout(layout_botones)
-    
-    layout_contenido.addWidget(panel_derecho, 2)
+    # Lo construye el controlador (asegurar_panel_derecho) la primera vez que
+    # carga un partido; hasta entonces el hueco lo ocupa un aviso dentro de un
+    # QStackedWidget
+    stackPanelDerecho = QStackedWidget()
+    stackPanelDerecho.setObjectName("stackPanelDerecho")
+    
+    lblSinPartido = QLabel("Selecciona un partido para registrar el resultado")
+    lblSinPartido.setObjectName("lblSinPartido")
+    lblSinPartido.setAlignment(Qt.AlignCenter)
+    stackPanelDerecho.addWidget(lblSinPartido)
+    
+    def _build_panel_derecho():
+        """Construye el panel de registro de jugadores del partido."""
+        panel_derecho = QFrame()
+        panel_derecho.setObjectName("panelDerecho")
+        
+        layout_derecho = QVBoxLayout(panel_derecho)
+        layout_derecho.setSpacing(15)
+        
+        # Información del partido seleccionado
+        lblPartidoSeleccionado = QLabel("Selecciona un partido para registrar el resultado")
+        lblPartidoSeleccionado.setObjectName("lblPartidoSeleccionado")
+        lblPartidoSeleccionado.setAlignment(Qt.AlignCenter)
+        layout_derecho.addWidget(lblPartidoSeleccionado)
+        
+        # Layout horizontal para los dos equipos
+        layout_equipos = QHBoxLayout()
+        layout_equipos.setSpacing(10)
+        
+        for sufijo in ("A", "B"):
+            groupEquipo, table, spin, lblNombre = _build_equipo_group(sufijo)
+            layout_equipos.addWidget(groupEquipo)
+            refs[f"lblNombreEquipo{sufijo}"] = lblNombre
+            refs[f"tableJugadores{sufijo}"] = table
+            refs[f"spinTotalGoles{sufijo}"] = spin
+        
+        layout_derecho.addLayout(layout_equipos)
+        
+        # Botones de gestión de estado
+        layout_botones_estado = QHBoxLayout()
+        
+        for nombre_objeto, texto, _, _ in _BOTONES_ESTADO:
+            boton = QPushButton(texto)
+            boton.setObjectName(nombre_objeto)
+            boton.setMinimumHeight(40)
+            # Deshabilitado hasta que el controlador cargue un partido
+            boton.setEnabled(False)
+            layout_botones_estado.addWidget(boton)
+            refs[nombre_objeto] = boton
+        
+        layout_derecho.addLayout(layout_botones_estado)
+        
+        # Botones de acción
+        layout_botones = QHBoxLayout()
+        
+        btnRegistrarResultado = QPushButton("REGISTRAR RESULTADO")
+        btnRegistrarResultado.setObjectName("btnRegistrarResultado")
+        btnRegistrarResultado.setMinimumHeight(50)
+        btnRegistrarResultado.setEnabled(False)
+        layout_botones.addWidget(btnRegistrarResultado)
+        
+        btnLimpiar = QPushButton("LIMPIAR")
+        btnLimpiar.setObjectName("btnLimpiar")
+        btnLimpiar.setMinimumHeight(50)
+        layout_botones.addWidget(btnLimpiar)
+        
+        layout_derecho.addLayout(layout_botones)
+        
+        refs["lblPartidoSeleccionado"] = lblPartidoSeleccionado
+        refs["btnRegistrarResultado"] = btnRegistrarResultado
+        refs["btnLimpiar"] = btnLimpiar
+        
+        return panel_derecho
+    
+    def _asegurar_panel_derecho():
+        """Construye el panel derecho una sola vez y lo muestra."""
+        if widget._right_built:
+            return
+        widget._right_built = True
+        panel_derecho = _build_panel_derecho()
+        stackPanelDerecho.addWidget(panel_derecho)
+        stackPanelDerecho.setCurrentWidget(panel_derecho)
+    
+    widget._right_built = False
+    widget.asegurar_panel_derecho = _asegurar_panel_derecho
+    
+    layout_contenido.addWidget(stackPanelDerecho, 2)
+    
+    # Referencias por objectName para que el controlador no tenga que recorrer
+    # el árbol con findChild. Los paneles perezosos añaden las suyas al crearse
+    refs = widget._refs = {
+        "btnVolver": btnVolver,
+        "comboFiltroEstado": comboFiltroEstado,
+        "listPartidos": listPartidos,
+        "lblResumen": lblResumen,
+    }
     
     layout_principal.addLayout(layout_contenido)
     
@@ -4,165 +4,208 @@ Crea equipos, jugadores y árbitros automáticamente.
 """
 
 from Models.database import DatabaseManager
+import itertools
+import os
 import random
+import sys
+from collections import namedtuple
 from datetime import datetime, timedelta
 
-def generar_fecha_nacimiento():
-    """Genera una fecha de nacimiento aleatoria entre 15 y 25 años."""
-    edad = random.randint(15, 25)
-    fecha = datetime.now() - timedelta(days=edad*365)
-    return fecha.strftime("%Y-%m-%d")
+# Datos fijos de la generación: se crean una vez al importar el módulo
+Equipo = namedtuple("Equipo", "nombre curso escudo color")
 
-def generar_datos_prueba():
-    """Genera todos los datos de prueba necesarios."""
+# Definir equipos
+_EQUIPOS_DATA = (
+    Equipo("Los Tigres", "2º DAM", "tigre.png", "#FF6B00"),
+    Equipo("Águilas FC", "1º DAM", "aguila.png", "#0066CC"),
+    Equipo("Leones United", "2º Bachillerato", "leon.png", "#FFD700"),
+    Equipo("Dragones FC", "1º Bachillerato", "dragon.png", "#DC143C"),
+    Equipo("Lobos Team", "4º ESO", "lobo.png", "#808080"),
+    Equipo("Panteras", "3º ESO", "pantera.png", "#000000"),
+    Equipo("Halcones", "2º ESO", "halcon.png", "#4169E1"),
+    Equipo("Osos FC", "1º ESO", "oso.png", "#8B4513"),
+)
+
+# Nombres de ejemplo para jugadores
+_NOMBRES = (
+    "Carlos", "Miguel", "David", "José", "Juan", "Antonio", "Pedro", "Luis",
+    "Francisco", "Javier", "Daniel", "Alberto", "Manuel", "Rafael", "Fernando",
+    "Sergio", "Pablo", "Jorge", "Rubén", "Diego", "Adrián", "Álvaro", "Iván",
+    "Raúl", "Óscar", "Víctor", "Marcos", "Andrés", "Gabriel", "Hugo",
+    "Mario", "Alejandro", "Samuel", "Nicolás", "Ángel", "Martín", "Lucas",
+    "Jaime", "Eduardo", "Roberto", "Ricardo", "Emilio", "Guillermo", "Ignacio",
+    "Felipe", "Lorenzo", "Mateo", "Tomás", "Rodrigo", "Gonzalo", "Santiago",
+    "Cristian", "Julio", "Simón", "Leonardo", "Fabián", "Esteban", "Joaquín",
+)
+
+_APELLIDOS = (
+    "García", "Rodríguez", "Martínez", "López", "Sánchez", "Pérez", "Gómez",
+    "Fernández", "Díaz", "Álvarez", "Moreno", "Jiménez", "Ruiz", "Hernández",
+)
+
+_POSICIONES = ("Portero", "Defensa", "Centrocampista", "Delantero")
+
+# Árbitros: (nombre, apellidos, experiencia, categoría)
+_ARBITROS = (
+    ("José Luis", "Martínez López", 5, "Regional"),
+    ("Antonio", "García Sánchez", 8, "Nacional"),
+    ("Carlos", "Fernández Ruiz", 3, "Regional"),
+    ("Manuel", "Rodríguez Pérez", 10, "Internacional"),
+    ("Francisco", "López González", 6, "Nacional"),
+)
+
+# Fechas de nacimiento posibles (edades de 15 a 25 años), calculadas al importar
+_HOY = datetime.now()
+_FECHAS_NACIMIENTO = tuple(
+    (_HOY - timedelta(days=edad*365)).strftime("%Y-%m-%d")
+    for edad in range(15, 26)
+)
+
+def _generar_datos(log):
+    """
+    Genera todos los datos de prueba necesarios.
+    
+    Args:
+        log: Función que recibe cada línea del informe
+    """
     db = DatabaseManager()
     
+    # Generador aleatorio propio; con la variable de entorno SEED los datos
+    # generados son reproducibles
+    semilla = os.environ.get("SEED")
+    rng = random.Random(int(semilla) if semilla else None)
+    _randint = rng.randint
+    
     # Inicializar base de datos (crear tablas si no existen)
-    print("Inicializando base de datos...")
+    log("Inicializando base de datos...")
     db.inicializar_db()
-    print("✓ Base de datos inicializada\n")
-    
-    print("Generando datos de prueba para torneos...")
-    print("=" * 50)
-    
-    # Definir equipos
-    equipos_data = [
-        {"nombre": "Los Tigres", "curso": "2º DAM", "escudo": "tigre.png", "color": "#FF6B00"},
-        {"nombre": "Águilas FC", "curso": "1º DAM", "escudo": "aguila.png", "color": "#0066CC"},
-        {"nombre": "Leones United", "curso": "2º Bachillerato", "escudo": "leon.png", "color": "#FFD700"},
-        {"nombre": "Dragones FC", "curso": "1º Bachillerato", "escudo": "dragon.png", "color": "#DC143C"},
-        {"nombre": "Lobos Team", "curso": "4º ESO", "escudo": "lobo.png", "color": "#808080"},
-        {"nombre": "Panteras", "curso": "3º ESO", "escudo": "pantera.png", "color": "#000000"},
-        {"nombre": "Halcones", "curso": "2º ESO", "escudo": "halcon.png", "color": "#4169E1"},
-        {"nombre": "Osos FC", "curso": "1º ESO", "escudo": "oso.png", "color": "#8B4513"}
-    ]
-    
-    # Nombres de ejemplo para jugadores
-    nombres = [
-        "Carlos", "Miguel", "David", "José", "Juan", "Antonio", "Pedro", "Luis",
-        "Francisco", "Javier", "Daniel", "Alberto", "Manuel", "Rafael", "Fernando",
-        "Sergio", "Pablo", "Jorge", "Rubén", "Diego", "Adrián", "Álvaro", "Iván",
-        "Raúl", "Óscar", "Víctor", "Marcos", "Andrés", "Gabriel", "Hugo",
-        "Mario", "Alejandro", "Samuel", "Nicolás", "Ángel", "Martín", "Lucas",
-        "Jaime", "Eduardo", "Roberto", "Ricardo", "Emilio", "Guillermo", "Ignacio",
-        "Felipe", "Lorenzo", "Mateo", "Tomás", "Rodrigo", "Gonzalo", "Santiago",
-        "Cristian", "Julio", "Simón", "Leonardo", "Fabián", "Esteban", "Joaquín"
-    ]
-    
-    apellidos = [
-        "García", "Rodríguez", "Martínez", "López", "Sánchez", "Pérez", "Gómez",
-        "Fernández", "Díaz", "Álvarez", "Moreno", "Jiménez", "Ruiz", "Hernández"
-    ]
+    log("✓ Base de datos inicializada\n")
     
-    posiciones = ["Portero", "Defensa", "Centrocampista", "Delantero"]
+    log("Generando datos de prueba para torneos...")
+    log("=" * 50)
     
     # Crear equipos
-    print("\n1. Creando equipos...")
+    log("\n1. Creando equipos...")
+    # Pares (equipo, id) de los equipos con los que se generarán jugadores
     equipos_ids = []
-    for equipo_data in equipos_data:
+    # Una sola lectura de la tabla de equipos: nombre -> id
+    existentes = {e['nombre']: e['id'] for e in db.obtener_todos_equipos()}
+    equipos_nuevos = []
+    for equipo_data in _EQUIPOS_DATA:
+        # Verificar si el equipo ya existe
+        equipo_id = existentes.get(equipo_data.nombre)
+        if equipo_id is None:
+            equipos_nuevos.append(equipo_data)
+        else:
+            equipos_ids.append((equipo_data, equipo_id))
+            log(f"   ⚠ Equipo ya existe: {equipo_data.nombre}")
+    
+    # Los equipos que faltan se insertan todos en la misma transacción
+    if equipos_nuevos:
         try:
-            # Verificar si el equipo ya existe
-            equipos_existentes = db.obtener_todos_equipos()
-            existe = any(e['nombre'] == equipo_data['nombre'] for e in equipos_existentes)
-            
-            if not existe:
-                equipo_id = db.crear_equipo(
-                    nombre=equipo_data['nombre'],
-                    curso=equipo_data['curso'],
-                    color=equipo_data['color'],
-                    escudo_path=equipo_data['escudo']
-                )
-                equipos_ids.append(equipo_id)
-                print(f"   ✓ Equipo creado: {equipo_data['nombre']}")
-            else:
-                # Obtener el ID del equipo existente
-                for e in equipos_existentes:
-                    if e['nombre'] == equipo_data['nombre']:
-                        equipos_ids.append(e['id'])
-                        print(f"   ⚠ Equipo ya existe: {equipo_data['nombre']}")
-                        break
+            nuevos_ids = db.crear_equipos_bulk([
+                (e.nombre, e.curso, e.color, e.escudo) for e in equipos_nuevos
+            ])
+            for equipo_data, equipo_id in zip(equipos_nuevos, nuevos_ids):
+                equipos_ids.append((equipo_data, equipo_id))
+                log(f"   ✓ Equipo creado: {equipo_data.nombre}")
         except Exception as e:
-            print(f"   ✗ Error creando equipo {equipo_data['nombre']}: {e}")
+            log(f"   ✗ Error creando equipos: {e}")
     
     # Crear jugadores para cada equipo
-    print("\n2. Creando jugadores...")
-    nombres_usados = set()
+    log("\n2. Creando jugadores...")
     total_jugadores = 0
+    # Todas las combinaciones nombre/apellidos barajadas una vez: cada jugador
+    # toma la siguiente, así los nombres completos nunca se repiten. Se
+    # barajan como tuplas de índices y el texto solo se construye para las
+    # que se usan, descartando las que ya existen de ejecuciones anteriores
+    jugadores_existentes = {(j['nombre'], j['apellidos']) for j in db.obtener_todos_jugadores()}
+    combinaciones = list(itertools.product(
+        range(len(_NOMBRES)), range(len(_APELLIDOS)), range(len(_APELLIDOS))))
+    rng.shuffle(combinaciones)
     
-    for idx, equipo_id in enumerate(equipos_ids):
-        equipo = equipos_data[idx]
-        num_jugadores = random.randint(7, 9)  # Entre 7 y 9 jugadores por equipo
-        
+    def _combinaciones_libres():
+        for i_nombre, i_apellido1, i_apellido2 in combinaciones:
+            nombre = _NOMBRES[i_nombre]
+            apellido1, apellido2 = _APELLIDOS[i_apellido1], _APELLIDOS[i_apellido2]
+            if (nombre, f"{apellido1} {apellido2}") not in jugadores_existentes:
+                yield nombre, apellido1, apellido2
+    
+    combinaciones_iter = _combinaciones_libres()
+    # Se acumulan todas las filas y se insertan juntas en una transacción
+    jugadores_filas = []
+    # Entre 7 y 9 jugadores por equipo; las fechas de nacimiento de todos
+    # los jugadores se sortean de una vez
+    jugadores_por_equipo = [_randint(7, 9) for _ in equipos_ids]
+    fechas_iter = iter(rng.choices(_FECHAS_NACIMIENTO, k=sum(jugadores_por_equipo)))
+    
+    for (equipo, equipo_id), num_jugadores in zip(equipos_ids, jugadores_por_equipo):
         for j in range(num_jugadores):
             # Generar nombre único
-            while True:
-                nombre = random.choice(nombres)
-                apellido1 = random.choice(apellidos)
-                apellido2 = random.choice(apellidos)
-                nombre_completo = f"{nombre} {apellido1} {apellido2}"
-                
-                if nombre_completo not in nombres_usados:
-                    nombres_usados.add(nombre_completo)
-                    break
+            nombre, apellido1, apellido2 = next(combinaciones_iter)
             
-            try:
-                posicion = posiciones[j % len(posiciones)]
-                dorsal = j + 1
-                es_capitan = (j == 0)  # Primer jugador es capitán
-                
-                db.crear_jugador(
-                    nombre=nombre,
-                    apellidos=f"{apellido1} {apellido2}",
-                    fecha_nacimiento=generar_fecha_nacimiento(),
-                    curso=equipo['curso'],
-                    equipo_id=equipo_id,
-                    posicion=posicion,
-                    dorsal=dorsal,
-                    es_capitan=es_capitan,
-                    tarjetas_amarillas=0,
-                    tarjetas_rojas=0,
-                    goles=0
-                )
-                total_jugadores += 1
-            except Exception as e:
-                print(f"   ✗ Error creando jugador: {e}")
+            posicion = _POSICIONES[j % len(_POSICIONES)]
+            dorsal = j + 1
+            es_capitan = 1 if j == 0 else 0  # Primer jugador es capitán
+            
+            jugadores_filas.append((
+                nombre, f"{apellido1} {apellido2}", next(fechas_iter),
+                equipo.curso, equipo_id, posicion, dorsal, es_capitan,
+                0, 0, 0
+            ))
         
-        print(f"   ✓ {num_jugadores} jugadores creados para {equipo['nombre']}")
+        log(f"   ✓ {num_jugadores} jugadores preparados para {equipo.nombre}")
     
-    # Crear árbitros
-    print("\n3. Creando árbitros...")
-    nombres_arbitros = [
-        ("José Luis", "Martínez López", 5, "Regional"),
-        ("Antonio", "García Sánchez", 8, "Nacional"),
-        ("Carlos", "Fernández Ruiz", 3, "Regional"),
-        ("Manuel", "Rodríguez Pérez", 10, "Internacional"),
-        ("Francisco", "López González", 6, "Nacional")
-    ]
+    try:
+        total_jugadores = db.crear_jugadores_bulk(jugadores_filas)
+        log(f"   ✓ {total_jugadores} jugadores creados")
+    except Exception as e:
+        log(f"   ✗ Error creando jugadores: {e}")
     
+    # Crear árbitros
+    log("\n3. Creando árbitros...")
     total_arbitros = 0
-    for nombre, apellidos, experiencia, categoria in nombres_arbitros:
+    arbitros_existentes = {(a['nombre'], a['apellidos']) for a in db.obtener_todos_arbitros()}
+    arbitros_nuevos = []
+    for arbitro in _ARBITROS:
+        if (arbitro[0], arbitro[1]) in arbitros_existentes:
+            log(f"   ⚠ Árbitro ya existe: {arbitro[0]} {arbitro[1]}")
+        else:
+            arbitros_nuevos.append(arbitro)
+    
+    fechas_arbitros = rng.choices(_FECHAS_NACIMIENTO, k=len(arbitros_nuevos))
+    arbitros_filas = [
+        (nombre, apellidos, fecha, experiencia, categoria)
+        for (nombre, apellidos, experiencia, categoria), fecha
+        in zip(arbitros_nuevos, fechas_arbitros)
+    ]
+    if arbitros_filas:
         try:
-            db.crear_arbitro(
-                nombre=nombre,
-                apellidos=apellidos,
-                fecha_nacimiento=generar_fecha_nacimiento(),
-                experiencia=experiencia,
-                categoria=categoria
-            )
-            total_arbitros += 1
-            print(f"   ✓ Árbitro creado: {nombre} {apellidos} ({categoria})")
+            total_arbitros = db.crear_arbitros_bulk(arbitros_filas)
+            for nombre, apellidos, _, categoria in arbitros_nuevos:
+                log(f"   ✓ Árbitro creado: {nombre} {apellidos} ({categoria})")
         except Exception as e:
-            print(f"   ✗ Error creando árbitro: {e}")
+            log(f"   ✗ Error creando árbitros: {e}")
     
     # Resumen
-    print("\n" + "=" * 50)
-    print("RESUMEN DE DATOS GENERADOS:")
-    print(f"  • Equipos: {len(equipos_ids)}")
-    print(f"  • Jugadores: {total_jugadores}")
-    print(f"  • Árbitros: {total_arbitros}")
-    print("=" * 50)
-    print("\n✓ ¡Datos de prueba generados exitosamente!")
-    print("  Ahora puedes crear un torneo con estos equipos.\n")
+    log("\n" + "=" * 50)
+    log("RESUMEN DE DATOS GENERADOS:")
+    log(f"  • Equipos: {len(equipos_ids)}")
+    log(f"  • Jugadores: {total_jugadores}")
+    log(f"  • Árbitros: {total_arbitros}")
+    log("=" * 50)
+    log("\n✓ ¡Datos de prueba generados exitosamente!")
+    log("  Ahora puedes crear un torneo con estos equipos.\n")
+
+def generar_datos_prueba():
+    """Genera todos los datos de prueba necesarios."""
+    # El informe se acumula y se escribe de una vez al final, aunque falle algo
+    salida = []
+    try:
+        _generar_datos(salida.append)
+    finally:
+        sys.stdout.write("\n".join(salida) + "\n")
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     try:
@@ -4,40 +4,91 @@ Genera hasta 32 equipos en total para poder probar torneos de dieciseisavos.
 """
 
 from Models.database import DatabaseManager
+import itertools
 import random
 import sqlite3
+import sys
 from datetime import datetime, timedelta
 
-def generar_fecha_nacimiento():
-    """Genera una fecha de nacimiento aleatoria entre 15 y 25 años."""
+def generar_fechas_nacimiento(cantidad):
+    """
+    Genera de una vez varias fechas de nacimiento aleatorias entre 15 y 25 años.
+    
+    Args:
+        cantidad: Número de fechas a generar
+        
+    Returns:
+        Lista de fechas en formato YYYY-MM-DD
+    """
     hoy = datetime.now()
-    años_atras = random.randint(15, 25)
-    dias_atras = random.randint(0, 365)
-    fecha = hoy - timedelta(days=años_atras * 365 + dias_atras)
-    return fecha.strftime("%Y-%m-%d")
+    años_atras = random.choices(range(15, 26), k=cantidad)
+    dias_atras = random.choices(range(0, 366), k=cantidad)
+    return [
+        (hoy - timedelta(days=años * 365 + dias)).strftime("%Y-%m-%d")
+        for años, dias in zip(años_atras, dias_atras)
+    ]
+
+def _filas_jugadores_equipo(equipo_id, curso, nombres_completos, fechas, posiciones):
+    """
+    Construye las filas de los jugadores de un equipo.
+    No usa estado compartido: cada equipo recibe su propio tramo de nombres
+    y fechas, así que los equipos pueden prepararse de forma independiente.
+    
+    Args:
+        equipo_id: ID del equipo
+        curso: Curso del equipo, que heredan sus jugadores
+        nombres_completos: Tuplas (nombre, apellido1, apellido2), una por jugador
+        fechas: Fechas de nacimiento, una por jugador
+        posiciones: Posiciones que se reparten por orden
+        
+    Returns:
+        Lista de tuplas listas para crear_jugadores_bulk
+    """
+    return [
+        (nombre, f"{apellido1} {apellido2}", fecha, curso, equipo_id,
+         posiciones[j % len(posiciones)], j + 1, 1 if j == 0 else 0,  # El primero es capitán
+         0, 0, 0)
+        for j, ((nombre, apellido1, apellido2), fecha) in enumerate(zip(nombres_completos, fechas))
+    ]
 
 def generar_equipos_adicionales():
     """Genera equipos y jugadores adicionales hasta llegar a 32 equipos."""
     db = DatabaseManager()
     
-    print("Generando equipos y jugadores adicionales...")
-    print("=" * 60)
+    # El informe se acumula y se escribe de una vez al final, aunque falle algo
+    salida = []
+    try:
+        # Una sola conexión para toda la generación
+        with db.conexion():
+            _generar_equipos_adicionales(db, salida.append)
+    finally:
+        sys.stdout.write("\n".join(salida) + "\n")
+        sys.stdout.flush()
+
+def _generar_equipos_adicionales(db, log):
+    """
+    Genera los equipos, jugadores y árbitros adicionales.
+    
+    Args:
+        db: DatabaseManager con una conexión persistente abierta
+        log: Función que recibe cada línea del informe
+    """
+    log("Generando equipos y jugadores adicionales...")
+    log("=" * 60)
     
     # Verificar cuántos equipos hay actualmente
-    db.conectar()
     cursor = db.conn.cursor()
     cursor.execute("SELECT COUNT(*) as total FROM Equipos")
     equipos_existentes = cursor.fetchone()['total']
-    db.desconectar()
     
-    print(f"\n✓ Equipos existentes: {equipos_existentes}")
+    log(f"\n✓ Equipos existentes: {equipos_existentes}")
     equipos_a_crear = 32 - equipos_existentes
     
     if equipos_a_crear <= 0:
-        print("\n✓ Ya tienes 32 equipos o más. No es necesario generar más.")
+        log("\n✓ Ya tienes 32 equipos o más. No es necesario generar más.")
         return
     
-    print(f"✓ Se crearán {equipos_a_crear} equipos nuevos\n")
+    log(f"✓ Se crearán {equipos_a_crear} equipos nuevos\n")
     
     # Nombres creativos para equipos
     nombres_equipos = [
@@ -54,17 +105,14 @@ def generar_equipos_adicionales():
     ]
     
     # Obtener nombres de equipos existentes
-    db.conectar()
-    cursor = db.conn.cursor()
     cursor.execute("SELECT nombre FROM Equipos")
     equipos_existentes_nombres = set(row['nombre'] for row in cursor.fetchall())
-    db.desconectar()
     
     # Filtrar nombres disponibles
     nombres_disponibles = [n for n in nombres_equipos if n not in equipos_existentes_nombres]
     
     if len(nombres_disponibles) < equipos_a_crear:
-        print(f"⚠️  Solo hay {len(nombres_disponibles)} nombres únicos disponibles")
+        log(f"⚠️  Solo hay {len(nombres_disponibles)} nombres únicos disponibles")
         equipos_a_crear = len(nombres_disponibles)
     
     colores = [
@@ -103,134 +151,119 @@ def generar_equipos_adicionales():
     equipos_ids = []
     equipos_creados = 0
     
-    print("\n1. Creando equipos...")
+    log("\n1. Creando equipos...")
+    # Todos los equipos nuevos se insertan en una única transacción
+    equipos_filas = []
+    # Los cursos de todos los equipos se sortean de una vez
+    cursos_equipos = random.choices(cursos, k=equipos_a_crear)
     for i in range(equipos_a_crear):
         nombre_equipo = nombres_disponibles[i]
         color = colores[i % len(colores)]
         escudo = escudos[i % len(escudos)]
-        curso = random.choice(cursos)
-        
-        try:
-            equipo_id = db.crear_equipo(
-                nombre=nombre_equipo,
-                curso=curso,
-                color=color,
-                escudo_path=escudo
-            )
-            equipos_ids.append(equipo_id)
-            equipos_creados += 1
-            print(f"   ✓ Equipo creado: {nombre_equipo} ({curso})")
-        except sqlite3.IntegrityError:
-            print(f"   ⚠️  Equipo ya existe: {nombre_equipo} (saltando)")
-        except Exception as e:
-            print(f"   ✗ Error creando equipo {nombre_equipo}: {e}")
-    
-    print(f"\n   Total equipos creados: {equipos_creados}")
+        curso = cursos_equipos[i]
+        equipos_filas.append((nombre_equipo, curso, color, escudo))
+    
+    try:
+        equipos_ids = db.crear_equipos_bulk(equipos_filas)
+        equipos_creados = len(equipos_ids)
+        for nombre_equipo, curso, _, _ in equipos_filas:
+            log(f"   ✓ Equipo creado: {nombre_equipo} ({curso})")
+    except sqlite3.IntegrityError:
+        log("   ⚠️  Algún equipo ya existe; no se ha creado ninguno")
+    except Exception as e:
+        log(f"   ✗ Error creando equipos: {e}")
+    
+    log(f"\n   Total equipos creados: {equipos_creados}")
     
     # Crear jugadores para cada equipo
-    print("\n2. Creando jugadores...")
-    nombres_usados = set()
+    log("\n2. Creando jugadores...")
+    num_arbitros = 10
+    # Entre 8 y 11 jugadores por equipo, sorteados de una vez para todos
+    jugadores_por_equipo = random.choices(range(8, 12), k=len(equipos_ids))
+    
+    # Cada combinación nombre/apellido/apellido se identifica con un número;
+    # se sortean sin repetición solo los necesarios para jugadores y árbitros,
+    # así los nombres completos nunca se repiten y no hace falta generarlas todas
+    num_apellidos = len(apellidos)
+    codigos = random.sample(range(len(nombres) * num_apellidos * num_apellidos),
+                            k=sum(jugadores_por_equipo) + num_arbitros)
+    combinaciones_iter = (
+        (nombres[codigo // (num_apellidos * num_apellidos)],
+         apellidos[codigo // num_apellidos % num_apellidos],
+         apellidos[codigo % num_apellidos])
+        for codigo in codigos
+    )
     total_jugadores = 0
+    # Las filas de todos los equipos se insertan juntas al final
+    jugadores_filas = []
+    
+    # Nombre y curso de cada equipo nuevo, ya conocidos al crearlo: id -> (nombre, curso)
+    equipos_info = {
+        equipo_id: (fila[0], fila[1]) for equipo_id, fila in zip(equipos_ids, equipos_filas)
+    }
+    
+    fechas_iter = iter(generar_fechas_nacimiento(sum(jugadores_por_equipo)))
     
-    for equipo_id in equipos_ids:
-        num_jugadores = random.randint(8, 11)  # Entre 8 y 11 jugadores
+    for equipo_id, num_jugadores in zip(equipos_ids, jugadores_por_equipo):
+        nombre_eq, curso_eq = equipos_info[equipo_id]
         
-        for j in range(num_jugadores):
-            # Generar nombre único
-            while True:
-                nombre = random.choice(nombres)
-                apellido1 = random.choice(apellidos)
-                apellido2 = random.choice(apellidos)
-                nombre_completo = f"{nombre} {apellido1} {apellido2}"
-                
-                if nombre_completo not in nombres_usados:
-                    nombres_usados.add(nombre_completo)
-                    break
-            
-            try:
-                # Obtener info del equipo
-                db.conectar()
-                cursor = db.conn.cursor()
-                cursor.execute("SELECT nombre, curso FROM Equipos WHERE id = ?", (equipo_id,))
-                equipo = cursor.fetchone()
-                db.desconectar()
-                
-                posicion = posiciones[j % len(posiciones)]
-                dorsal = j + 1
-                es_capitan = (j == 0)
-                
-                db.crear_jugador(
-                    nombre=nombre,
-                    apellidos=f"{apellido1} {apellido2}",
-                    fecha_nacimiento=generar_fecha_nacimiento(),
-                    curso=equipo['curso'],
-                    equipo_id=equipo_id,
-                    posicion=posicion,
-                    dorsal=dorsal,
-                    es_capitan=es_capitan,
-                    tarjetas_amarillas=0,
-                    tarjetas_rojas=0,
-                    goles=0
-                )
-                total_jugadores += 1
-            except Exception as e:
-                print(f"   ✗ Error creando jugador: {e}")
+        jugadores_filas.extend(_filas_jugadores_equipo(
+            equipo_id, curso_eq,
+            itertools.islice(combinaciones_iter, num_jugadores),
+            itertools.islice(fechas_iter, num_jugadores),
+            posiciones
+        ))
         
-        if equipo:
-            print(f"   ✓ {num_jugadores} jugadores creados para {equipo['nombre']}")
+        log(f"   ✓ {num_jugadores} jugadores preparados para {nombre_eq}")
+    
+    try:
+        total_jugadores = db.crear_jugadores_bulk(jugadores_filas)
+        log(f"   ✓ {total_jugadores} jugadores creados")
+    except Exception as e:
+        log(f"   ✗ Error creando jugadores: {e}")
     
     # Crear algunos árbitros adicionales
-    print("\n3. Creando árbitros adicionales...")
+    log("\n3. Creando árbitros adicionales...")
     categorias = ["Regional", "Nacional", "Internacional"]
-    total_arbitros = 0
-    
-    for i in range(10):
-        while True:
-            nombre = random.choice(nombres)
-            apellido1 = random.choice(apellidos)
-            apellido2 = random.choice(apellidos)
-            nombre_completo = f"{nombre} {apellido1} {apellido2}"
-            
-            if nombre_completo not in nombres_usados:
-                nombres_usados.add(nombre_completo)
-                break
-        
-        categoria = random.choice(categorias)
-        curso = random.choice(cursos)
+    arbitros_filas = []
+    
+    fechas_arbitros = generar_fechas_nacimiento(num_arbitros)
+    
+    for categoria, fecha in zip(random.choices(categorias, k=num_arbitros), fechas_arbitros):
+        nombre, apellido1, apellido2 = next(combinaciones_iter)
         
-        try:
-            db.crear_arbitro(
-                nombre=nombre,
-                apellidos=f"{apellido1} {apellido2}",
-                fecha_nacimiento=generar_fecha_nacimiento(),
-                curso=curso,
-                categoria=categoria
-            )
-            total_arbitros += 1
-            print(f"   ✓ Árbitro creado: {nombre} {apellido1} ({categoria})")
-        except Exception as e:
-            print(f"   ✗ Error creando árbitro: {e}")
+        # Los árbitros no tienen curso; la experiencia empieza en 0 como en crear_arbitro
+        arbitros_filas.append((
+            nombre, f"{apellido1} {apellido2}", fecha, 0, categoria
+        ))
+    
+    try:
+        total_arbitros = db.crear_arbitros_bulk(arbitros_filas)
+        for nombre, apellidos, _, _, categoria in arbitros_filas:
+            log(f"   ✓ Árbitro creado: {nombre} {apellidos.split()[0]} ({categoria})")
+        log(f"   ✓ {total_arbitros} árbitros creados")
+    except Exception as e:
+        log(f"   ✗ Error creando árbitros: {e}")
     
     # Resumen final
-    print("\n" + "=" * 60)
-    print("RESUMEN FINAL:")
+    log("\n" + "=" * 60)
+    log("RESUMEN FINAL:")
     
-    db.conectar()
+    # Los tres totales en una sola consulta
     cursor = db.conn.cursor()
-    cursor.execute("SELECT COUNT(*) as total FROM Equipos")
-    total_equipos = cursor.fetchone()['total']
-    cursor.execute("SELECT COUNT(*) as total FROM Jugadores")
-    total_jugadores_db = cursor.fetchone()['total']
-    cursor.execute("SELECT COUNT(*) as total FROM Arbitros")
-    total_arbitros_db = cursor.fetchone()['total']
-    db.desconectar()
-    
-    print(f"  • Total de equipos en BD: {total_equipos}")
-    print(f"  • Total de jugadores en BD: {total_jugadores_db}")
-    print(f"  • Total de árbitros en BD: {total_arbitros_db}")
-    print("=" * 60)
-    print(f"\n✓ ¡Datos adicionales generados exitosamente!")
-    print(f"  Ahora puedes crear un torneo de 32 equipos (dieciseisavos).\n")
+    cursor.execute("""
+        SELECT (SELECT COUNT(*) FROM Equipos),
+               (SELECT COUNT(*) FROM Jugadores),
+               (SELECT COUNT(*) FROM Arbitros)
+    """)
+    total_equipos, total_jugadores_db, total_arbitros_db = cursor.fetchone()
+    
+    log(f"  • Total de equipos en BD: {total_equipos}")
+    log(f"  • Total de jugadores en BD: {total_jugadores_db}")
+    log(f"  • Total de árbitros en BD: {total_arbitros_db}")
+    log("=" * 60)
+    log(f"\n✓ ¡Datos adicionales generados exitosamente!")
+    log(f"  Ahora puedes crear un torneo de 32 equipos (dieciseisavos).\n")
 
 if __name__ == "__main__":
     try:
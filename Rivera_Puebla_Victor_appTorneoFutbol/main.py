@@ -8,12 +8,57 @@ import os
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QPushButton, QLabel, QStackedWidget,
                                QFrame, QMenuBar, QMessageBox)
-from PySide6.QtCore import Qt, QLocale
-from PySide6.QtGui import QAction, QPalette, QPixmap, QBrush
+from PySide6.QtCore import Qt, QLocale, QTimer, QThread, Signal
+from PySide6.QtGui import QAction, QPalette, QPixmap, QBrush, QColor, QImage
 
 from Models.database import DatabaseManager
 from Controllers.main_controller import MainController
-from generar_datos_prueba import generar_datos_prueba
+
+
+# Hoja de estilos de la ventana principal: es constante, se crea una vez al
+# importar y se aplica en MainApp._aplicar_estilos
+_MAIN_QSS = """
+/* Página principal: título y títulos de los paneles */
+QLabel#lblTituloPrincipal {
+    font-size: 32px;
+    font-weight: bold;
+    color: #FFD700;
+    background: rgba(30, 40, 60, 0.9);
+    padding: 20px;
+    border: 2px solid #4A5F7F;
+    border-radius: 10px;
+}
+
+QLabel#lblTituloPanel {
+    font-size: 18px;
+    font-weight: bold;
+    color: #FFD700;
+}
+"""
+
+
+class _CargadorFondo(QThread):
+    """
+    Hilo que lee la imagen de fondo del disco sin bloquear el arranque.
+    Trabaja con QImage porque QPixmap solo puede crearse en el hilo principal.
+    """
+    
+    fondoCargado = Signal(QImage)
+    
+    def __init__(self, ruta: str, parent=None):
+        """
+        Inicializa el hilo de carga.
+        
+        Args:
+            ruta: Ruta absoluta de la imagen de fondo
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+        self._ruta = ruta
+        
+    def run(self):
+        """Lee la imagen y la envía al hilo principal (nula si no se pudo leer)."""
+        self.fondoCargado.emit(QImage(self._ruta))
 
 
 class MainApp(QMainWindow):
@@ -28,6 +73,15 @@ class MainApp(QMainWindow):
         self.resize(1200, 800)
         self._current_language = "es"
         
+        # Imagen de fondo original; se escala en resizeEvent
+        self._fondo_original = QPixmap()
+        # Durante un redimensionado se escala rápido y, cuando el usuario
+        # deja de redimensionar, se repite una vez con suavizado
+        self._timer_fondo = QTimer(self)
+        self._timer_fondo.setSingleShot(True)
+        self._timer_fondo.setInterval(150)
+        self._timer_fondo.timeout.connect(self._refinar_fondo)
+        
         # Inicializar base de datos
         self._inicializar_base_datos()
         
@@ -52,6 +106,9 @@ class MainApp(QMainWindow):
             equipos = db.obtener_todos_equipos()
             if not equipos:
                 print("\nNo se encontraron equipos. Generando datos de prueba...")
+                # Solo hace falta la primera vez: se importa aquí para no
+                # cargar el generador en cada arranque
+                from generar_datos_prueba import generar_datos_prueba
                 generar_datos_prueba()
                 print("Datos de prueba generados correctamente.\n")
         except Exception as e:
@@ -121,19 +178,10 @@ class MainApp(QMainWindow):
         
         layout = QVBoxLayout(pagina)
         
-        # Título
+        # Título (estilo en _MAIN_QSS, QLabel#lblTituloPrincipal)
         lblTitulo = QLabel("GESTIÓN DE TORNEOS DE FÚTBOL")
-        lblTitulo.setObjectName("lblTitulo")
+        lblTitulo.setObjectName("lblTituloPrincipal")
         lblTitulo.setAlignment(Qt.AlignCenter)
-        lblTitulo.setStyleSheet("""
-            font-size: 32px;
-            font-weight: bold;
-            color: #FFD700;
-            background: rgba(30, 40, 60, 0.9);
-            padding: 20px;
-            border: 2px solid #4A5F7F;
-            border-radius: 10px;
-        """)
         layout.addWidget(lblTitulo)
         
         # Contenedor central
@@ -147,46 +195,14 @@ class MainApp(QMainWindow):
         fila1_layout = QHBoxLayout(fila1)
         fila1_layout.setSpacing(20)
         
-        # Frame Equipos/Participantes
-        frame_ep = QFrame()
-        frame_ep.setObjectName("frameEquiposParticipantes")
-        frame_ep_layout = QVBoxLayout(frame_ep)
-        
-        lbl_ep = QLabel("Gestión de Datos")
-        lbl_ep.setAlignment(Qt.AlignCenter)
-        lbl_ep.setStyleSheet("font-size: 18px; font-weight: bold; color: #FFD700;")
-        frame_ep_layout.addWidget(lbl_ep)
-        
-        self.btnEquipos = QPushButton("EQUIPOS")
-        self.btnEquipos.setObjectName("btnEquipos")
-        self.btnEquipos.setMinimumHeight(80)
-        self.btnEquipos.setCursor(Qt.PointingHandCursor)
-        frame_ep_layout.addWidget(self.btnEquipos)
-        
-        self.btnParticipantes = QPushButton("PARTICIPANTES")
-        self.btnParticipantes.setObjectName("btnParticipantes")
-        self.btnParticipantes.setMinimumHeight(80)
-        self.btnParticipantes.setCursor(Qt.PointingHandCursor)
-        frame_ep_layout.addWidget(self.btnParticipantes)
-        
+        frame_ep, (self.btnEquipos, self.btnParticipantes) = self._crear_panel(
+            "frameEquiposParticipantes", "Gestión de Datos",
+            [("EQUIPOS", "btnEquipos", 80), ("PARTICIPANTES", "btnParticipantes", 80)])
         fila1_layout.addWidget(frame_ep)
         
-        # Frame Calendario
-        frame_cal = QFrame()
-        frame_cal.setObjectName("frameCalendario")
-        frame_cal_layout = QVBoxLayout(frame_cal)
-        
-        lbl_cal = QLabel("Calendario de Partidos")
-        lbl_cal.setAlignment(Qt.AlignCenter)
-        lbl_cal.setStyleSheet("font-size: 18px; font-weight: bold; color: #FFD700;")
-        frame_cal_layout.addWidget(lbl_cal)
-        
-        self.btnCalendario = QPushButton("CALENDARIO")
-        self.btnCalendario.setObjectName("btnCalendario")
-        self.btnCalendario.setMinimumHeight(180)
-        self.btnCalendario.setCursor(Qt.PointingHandCursor)
-        frame_cal_layout.addWidget(self.btnCalendario)
-        
+        frame_cal, (self.btnCalendario,) = self._crear_panel(
+            "frameCalendario", "Calendario de Partidos",
+            [("CALENDARIO", "btnCalendario", 180)])
         fila1_layout.addWidget(frame_cal)
         
         contenedor_layout.addWidget(fila1)
@@ -196,40 +212,14 @@ class MainApp(QMainWindow):
         fila2_layout = QHBoxLayout(fila2)
         fila2_layout.setSpacing(20)
         
-        # Frame Resultados
-        frame_res = QFrame()
-        frame_res.setObjectName("frameResultados")
-        frame_res_layout = QVBoxLayout(frame_res)
-        
-        lbl_res = QLabel("Registro de Resultados")
-        lbl_res.setAlignment(Qt.AlignCenter)
-        lbl_res.setStyleSheet("font-size: 18px; font-weight: bold; color: #FFD700;")
-        frame_res_layout.addWidget(lbl_res)
-        
-        self.btnResultados = QPushButton("RESULTADOS")
-        self.btnResultados.setObjectName("btnResultados")
-        self.btnResultados.setMinimumHeight(180)
-        self.btnResultados.setCursor(Qt.PointingHandCursor)
-        frame_res_layout.addWidget(self.btnResultados)
-        
+        frame_res, (self.btnResultados,) = self._crear_panel(
+            "frameResultados", "Registro de Resultados",
+            [("RESULTADOS", "btnResultados", 180)])
         fila2_layout.addWidget(frame_res)
         
-        # Frame Clasificación
-        frame_clas = QFrame()
-        frame_clas.setObjectName("frameClasificacion")
-        frame_clas_layout = QVBoxLayout(frame_clas)
-        
-        lbl_clas = QLabel("Brackets y Clasificación")
-        lbl_clas.setAlignment(Qt.AlignCenter)
-        lbl_clas.setStyleSheet("font-size: 18px; font-weight: bold; color: #FFD700;")
-        frame_clas_layout.addWidget(lbl_clas)
-        
-        self.btnClasificacion = QPushButton("CLASIFICACIÓN")
-        self.btnClasificacion.setObjectName("btnClasificacion")
-        self.btnClasificacion.setMinimumHeight(180)
-        self.btnClasificacion.setCursor(Qt.PointingHandCursor)
-        frame_clas_layout.addWidget(self.btnClasificacion)
-        
+        frame_clas, (self.btnClasificacion,) = self._crear_panel(
+            "frameClasificacion", "Brackets y Clasificación",
+            [("CLASIFICACIÓN", "btnClasificacion", 180)])
         fila2_layout.addWidget(frame_clas)
         
         contenedor_layout.addWidget(fila2)
@@ -257,305 +247,110 @@ class MainApp(QMainWindow):
         
         return pagina
         
+    def _crear_panel(self, nombre: str, titulo: str, botones):
+        """
+        Crea un panel de la página principal: un frame con título y botones.
+        El título no lleva estilo propio; todos comparten la regla
+        QLabel#lblTituloPanel de _MAIN_QSS.
+        
+        Args:
+            nombre: objectName del frame
+            titulo: Texto del título del panel
+            botones: Lista de tuplas (texto, objectName, altura mínima)
+            
+        Returns:
+            Tupla (frame, lista de botones creados en el mismo orden)
+        """
+        frame = QFrame()
+        frame.setObjectName(nombre)
+        frame_layout = QVBoxLayout(frame)
+        
+        lbl = QLabel(titulo)
+        lbl.setObjectName("lblTituloPanel")
+        lbl.setAlignment(Qt.AlignCenter)
+        frame_layout.addWidget(lbl)
+        
+        creados = []
+        for texto, nombre_boton, altura in botones:
+            boton = QPushButton(texto)
+            boton.setObjectName(nombre_boton)
+            boton.setMinimumHeight(altura)
+            boton.setCursor(Qt.PointingHandCursor)
+            frame_layout.addWidget(boton)
+            creados.append(boton)
+        
+        return frame, creados
+        
     def _aplicar_estilos(self):
-        """Aplica los estilos QSS a la aplicación."""
+        """Aplica los estilos QSS y el fondo de la ventana."""
+        
+        # Estilos QSS solo sobre la ventana principal, no sobre los diálogos
+        self.setStyleSheet(_MAIN_QSS)
+        print("Estilos aplicados correctamente.")
         
         # Obtener ruta absoluta de la imagen de fondo
         base_dir = os.path.dirname(os.path.abspath(__file__))
         fondo_path = os.path.join(base_dir, "Resources", "img", "fondo.jpg")
         
-        # Aplicar imagen de fondo usando QPalette
-        pixmap = QPixmap(fondo_path)
-        if not pixmap.isNull():
-            # Escalar imagen para cubrir toda la ventana manteniendo aspecto
-            scaled_pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            palette = self.palette()
-            palette.setBrush(QPalette.Window, QBrush(scaled_pixmap))
-            self.setPalette(palette)
-            print(f"Imagen de fondo aplicada desde: {fondo_path}")
-        else:
-            print(f"Error: No se pudo cargar la imagen de fondo desde: {fondo_path}")
-        
-        qss_content = """
-        /* Widget central transparente para mostrar el fondo */
-        QWidget#centralwidget {{
-            background: transparent;
-        }}
-        
-        /* Botones principales con mismo estilo que el título */
-        QPushButton {{
-            background: rgba(30, 40, 60, 0.9);
-            color: #FFD700;
-            border: 2px solid #4A5F7F;
-            border-radius: 10px;
-            padding: 15px 25px;
-            font-size: 17px;
-            font-weight: bold;
-            min-height: 50px;
-        }}
-        
-        QPushButton:hover {{
-            background: rgba(36, 48, 72, 0.95);
-            border-color: #5E78A0;
-        }}
-        
-        QPushButton:pressed {{
-            background: rgba(22, 30, 46, 0.95);
-            border-color: #394860;
-            padding-top: 17px;
-            padding-bottom: 13px;
-        }}
-        
-        /* Frames con sombra y borde oscuro */
-        QFrame {{
-            background: rgba(255, 255, 255, 1.0);
-            border-radius: 20px;
-            border: 4px solid #333333;
-        }}
-        
-        QLabel {{
-            color: #000000;
-        }}
-        
-        /* Campos de texto modernos */
-        QLineEdit {{
-            background: white;
-            border: 2px solid #C8E6C9;
-            border-radius: 10px;
-            padding: 10px;
-            font-size: 14px;
-            color: #000000;
-        }}
-        
-        QLineEdit:focus {{
-            border: 2px solid #4CAF50;
-            background: #F1F8E9;
-        }}
-        
-        /* ComboBox moderno */
-        QComboBox {{
-            background: white;
-            border: 2px solid #C8E6C9;
-            border-radius: 10px;
-            padding: 8px;
-            min-height: 30px;
-            color: #000000;
-        }}
-        
-        QComboBox:focus {{
-            border: 2px solid #4CAF50;
-        }}
-        
-        QComboBox::drop-down {{
-            border: none;
-            width: 30px;
-        }}
-        
-        QComboBox::down-arrow {{
-            image: none;
-            border-left: 5px solid transparent;
-            border-right: 5px solid transparent;
-            border-top: 8px solid #4CAF50;
-            margin-right: 10px;
-        }}
-        
-        /* Listas */
-        QListWidget {{
-            background: white;
-            border: 2px solid #C8E6C9;
-            border-radius: 10px;
-            padding: 5px;
-            color: #000000;
-        }}
-        
-        QListWidget::item {{
-            border-radius: 5px;
-            padding: 8px;
-            margin: 2px;
-            color: #000000;
-        }}
-        
-        QListWidget::item:selected {{
-            background: #C8E6C9;
-            color: #1B5E20;
-        }}
-        
-        QListWidget::item:hover {{
-            background: #E8F5E9;
-        }}
-        
-        /* Tablas */
-        QTableWidget {{
-            background: white;
-            border: 2px solid #C8E6C9;
-            border-radius: 10px;
-            gridline-color: #E8F5E9;
-        }}
-        
-        QTableWidget::item {{
-            padding: 5px;
-        }}
-        
-        QTableWidget::item:selected {{
-            background: #C8E6C9;
-            color: #1B5E20;
-        }}
-        
-        /* Headers de tabla */
-        QHeaderView::section {{
-            background: #4CAF50;
-            color: white;
-            padding: 8px;
-            border: none;
-            font-weight: bold;
-        }}
-        
-        /* Scrollbars modernos */
-        QScrollBar:vertical {{
-            background: #E8F5E9;
-            width: 12px;
-            border-radius: 6px;
-        }}
-        
-        QScrollBar::handle:vertical {{
-            background: #4CAF50;
-            border-radius: 6px;
-            min-height: 20px;
-        }}
-        
-        QScrollBar::handle:vertical:hover {{
-            background: #66BB6A;
-        }}
-        
-        QScrollBar:horizontal {{
-            background: #E8F5E9;
-            height: 12px;
-            border-radius: 6px;
-        }}
-        
-        QScrollBar::handle:horizontal {{
-            background: #4CAF50;
-            border-radius: 6px;
-            min-width: 20px;
-        }}
-        
-        QScrollBar::handle:horizontal:hover {{
-            background: #66BB6A;
-        }}
-        
-        /* MenuBar */
-        QMenuBar {{
-            background: #4CAF50;
-            color: white;
-            padding: 5px;
-        }}
-        
-        QMenuBar::item {{
-            background: transparent;
-            padding: 8px 15px;
-            border-radius: 5px;
-        }}
-        
-        QMenuBar::item:selected {{
-            background: #66BB6A;
-        }}
-        
-        QMenu {{
-            background: white;
-            border: 2px solid #4CAF50;
-            border-radius: 10px;
-        }}
-        
-        QMenu::item {{
-            padding: 8px 25px;
-        }}
-        
-        QMenu::item:selected {{
-            background: #E8F5E9;
-            color: #1B5E20;
-        }}        
-        /* RadioButtons y CheckBoxes */
-        QRadioButton {{
-            color: #000000;
-            font-size: 14px;
-            spacing: 8px;
-        }}
-        
-        QRadioButton::indicator {{
-            width: 18px;
-            height: 18px;
-            border-radius: 9px;
-            border: 2px solid #4CAF50;
-            background: white;
-        }}
-        
-        QRadioButton::indicator:checked {{
-            background: qradialgradient(cx:0.5, cy:0.5, radius:0.5,
-                                       fx:0.5, fy:0.5, stop:0 #4CAF50, stop:0.6 #4CAF50, stop:0.7 white);
-        }}
-        
-        QCheckBox {{
-            color: #000000;
-            font-size: 14px;
-            spacing: 8px;
-        }}
-        
-        QCheckBox::indicator {{
-            width: 18px;
-            height: 18px;
-            border-radius: 4px;
-            border: 2px solid #4CAF50;
-            background: white;
-        }}
-        
-        QCheckBox::indicator:checked {{
-            background: #4CAF50;
-            image: none;
-        }}
-        
-        /* SpinBox */
-        QSpinBox {{
-            background: white;
-            border: 2px solid #C8E6C9;
-            border-radius: 10px;
-            padding: 8px;
-            color: #000000;
-            font-size: 14px;
-        }}
-        
-        QSpinBox:focus {{
-            border: 2px solid #4CAF50;
-        }}
-        
-        /* DateEdit */
-        QDateEdit {{
-            background: white;
-            border: 2px solid #C8E6C9;
-            border-radius: 10px;
-            padding: 8px;
-            color: #000000;
-            font-size: 14px;
-        }}
-        
-        QDateEdit:focus {{
-            border: 2px solid #4CAF50;
-        }}
-        
-        QDateEdit::drop-down {{
-            border: none;
-            width: 30px;
-        }}
-        
-        QDateEdit::down-arrow {{
-            image: none;
-            border-left: 5px solid transparent;
-            border-right: 5px solid transparent;
-            border-top: 8px solid #4CAF50;
-            margin-right: 10px;
-        }}        """
-        
-        self.setStyleSheet(qss_content)
-        print("Estilos aplicados correctamente.")
+        # Color liso de fondo mientras la imagen se carga en segundo plano
+        palette = self.palette()
+        palette.setColor(QPalette.Window, QColor(30, 40, 60))
+        self.setPalette(palette)
+        
+        # Leer la imagen de fondo en otro hilo; se aplica al terminar
+        self._fondo_path = fondo_path
+        self._cargador_fondo = _CargadorFondo(fondo_path, self)
+        self._cargador_fondo.fondoCargado.connect(self._on_fondo_cargado)
+        self._cargador_fondo.start()
+        
+    def _escalar_fondo(self, transformacion):
+        """
+        Escala la imagen de fondo al tamaño de la ventana y la aplica con QPalette.
+        
+        Args:
+            transformacion: Qt.FastTransformation o Qt.SmoothTransformation
+        """
+        if self._fondo_original.isNull():
+            return
+        # Escalar imagen para cubrir toda la ventana manteniendo aspecto
+        scaled_pixmap = self._fondo_original.scaled(
+            self.size(), Qt.KeepAspectRatioByExpanding, transformacion)
+        palette = self.palette()
+        palette.setBrush(QPalette.Window, QBrush(scaled_pixmap))
+        self.setPalette(palette)
+        
+    def _on_fondo_cargado(self, imagen: QImage):
+        """
+        Recibe la imagen leída por el hilo de carga y la aplica como fondo.
+        
+        Args:
+            imagen: Imagen de fondo (nula si no se pudo leer)
+        """
+        if imagen.isNull():
+            print(f"Error: No se pudo cargar la imagen de fondo desde: {self._fondo_path}")
+            return
+        self._fondo_original = QPixmap.fromImage(imagen)
+        self._refinar_fondo()
+        print(f"Imagen de fondo aplicada desde: {self._fondo_path}")
+        
+    def _refinar_fondo(self):
+        """Vuelve a escalar el fondo con suavizado al terminar el redimensionado."""
+        self._escalar_fondo(Qt.SmoothTransformation)
+        
+    def resizeEvent(self, event):
+        """Reescala el fondo al cambiar el tamaño de la ventana."""
+        super().resizeEvent(event)
+        if not self.isVisible():
+            # Primer tamaño al mostrar la ventana: escalado final directamente
+            self._refinar_fondo()
+            return
+        self._escalar_fondo(Qt.FastTransformation)
+        self._timer_fondo.start()
+        
+    def closeEvent(self, event):
+        """Espera al hilo de carga del fondo antes de cerrar la ventana."""
+        self._cargador_fondo.wait()
+        super().closeEvent(event)
 
 
 def main():